@@ -3,6 +3,32 @@ from abc import abstractmethod
 
 class Attribute(object):
 
+    __slots__ = ()
+
+    def getOwner(self):
+        """
+        Accessor for the owner which is told when the attribute is changed in place. Attributes which can not be changed
+        in place have no owner.
+
+        RETURNS
+        -------
+        AttributeOwner
+            Owner of the attribute, None if it has none.
+        """
+        return None
+
+    def setOwner(self, owner):
+        """
+        Mutator for the owner which is told when the attribute is changed in place. Attributes which can not be changed
+        in place ignore it.
+
+        PARAMETERS
+        ----------
+        owner : AttributeOwner
+            New owner of the attribute.
+        """
+        pass
+
     @abstractmethod
     def continuousAttributeSize(self) -> int:
         pass
@@ -0,0 +1,89 @@
+import weakref
+
+
+class AttributeOwner(object):
+
+    __slots__ = ('__modification_count', '__listeners', '__weakref__')
+
+    __modification_count: int
+    __listeners: list
+
+    def __init__(self):
+        """
+        Constructor for the owner of the attributes of an instance. An attribute which can be changed in place tells its
+        owner when it is changed, and the instance tells it when attributes are added or removed, so the owner counts
+        the changes of the instance and nothing else. Other owners, for example the one counting the changes of an
+        instance list, can listen to the owner; every change recorded is recorded by them as well. The listeners are
+        weakly referenced, so listening does not keep an instance list alive.
+        """
+        self.__modification_count = 0
+        self.__listeners = None
+
+    def __getstate__(self):
+        return self.__modification_count
+
+    def __setstate__(self, state):
+        self.__modification_count = state
+        self.__listeners = None
+
+    def attributeModified(self, attribute):
+        """
+        Records that the given attribute is changed in place, added or removed, and tells the listeners.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute which is changed, None if all attributes are removed.
+        """
+        self.__modification_count = self.__modification_count + 1
+        if self.__listeners:
+            for listener in self.getListeners():
+                listener.attributeModified(attribute)
+
+    def getModificationCount(self) -> int:
+        """
+        Accessor for the number of changes recorded.
+
+        RETURNS
+        -------
+        int
+            Number of changes of the attributes.
+        """
+        return self.__modification_count
+
+    def getListeners(self) -> list:
+        """
+        Returns the owners listening to this owner which are still alive.
+
+        RETURNS
+        -------
+        list
+            Listening owners.
+        """
+        if not self.__listeners:
+            return []
+        listeners = []
+        for reference in self.__listeners:
+            listener = reference()
+            if listener is not None:
+                listeners.append(listener)
+        if len(listeners) != len(self.__listeners):
+            self.__listeners = [weakref.ref(listener) for listener in listeners]
+        return listeners
+
+    def addListener(self, listener):
+        """
+        Makes the given owner record every change recorded by this owner from now on. Adding a listener twice has no
+        effect.
+
+        PARAMETERS
+        ----------
+        listener : AttributeOwner
+            Owner which listens to this owner.
+        """
+        for current in self.getListeners():
+            if current is listener:
+                return
+        if self.__listeners is None:
+            self.__listeners = []
+        self.__listeners.append(weakref.ref(listener))
@@ -1,9 +1,13 @@
 from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.AttributeOwner import AttributeOwner
 
 
 class ContinuousAttribute(Attribute):
 
+    __slots__ = ('__value', '__owner')
+
     __value: float
+    __owner: AttributeOwner
 
     def __init__(self, value: float):
         """
@@ -15,6 +19,7 @@ class ContinuousAttribute(Attribute):
             Value of the attribute.
         """
         self.__value = value
+        self.__owner = None
 
     def getValue(self) -> float:
         """
@@ -37,6 +42,30 @@ class ContinuousAttribute(Attribute):
             New value of value.
         """
         self.__value = value
+        if self.__owner is not None:
+            self.__owner.attributeModified(self)
+
+    def getOwner(self) -> AttributeOwner:
+        """
+        Accessor for the owner which is told when the value is changed.
+
+        RETURNS
+        -------
+        AttributeOwner
+            Owner of the attribute, None if it has none.
+        """
+        return self.__owner
+
+    def setOwner(self, owner: AttributeOwner):
+        """
+        Mutator for the owner which is told when the value is changed.
+
+        PARAMETERS
+        ----------
+        owner : AttributeOwner
+            New owner of the attribute.
+        """
+        self.__owner = owner
 
     def __str__(self) -> str:
         """
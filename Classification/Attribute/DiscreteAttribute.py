@@ -1,19 +1,26 @@
+from sys import intern
+
 from Classification.Attribute.Attribute import Attribute
 
 
 class DiscreteAttribute(Attribute):
 
+    __slots__ = ('__value',)
+
     __value: str
 
     def __init__(self, value: str):
         """
-        Constructor for a discrete attribute.
+        Constructor for a discrete attribute. String values are interned, so equal values of different attributes share
+        a single string object.
 
         PARAMETERS
         ----------
         value : str
             Value of the attribute.
         """
+        if isinstance(value, str):
+            value = intern(value)
         self.__value = value
 
     def getValue(self) -> str:
@@ -1,10 +1,14 @@
+from Classification.Attribute.AttributeOwner import AttributeOwner
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 
 
 class DiscreteIndexedAttribute(DiscreteAttribute):
 
+    __slots__ = ('__index', '__maxIndex', '__owner')
+
     __index: int
     __maxIndex: int
+    __owner: AttributeOwner
 
     def __init__(self,
                  value: str,
@@ -25,6 +29,7 @@ class DiscreteIndexedAttribute(DiscreteAttribute):
         super().__init__(value)
         self.__index = index
         self.__maxIndex = maxIndex
+        self.__owner = None
 
     def getIndex(self) -> int:
         """
@@ -48,6 +53,41 @@ class DiscreteIndexedAttribute(DiscreteAttribute):
         """
         return self.__maxIndex
 
+    def setMaxIndex(self, maxIndex: int):
+        """
+        Mutator method for maxIndex.
+
+        PARAMETERS
+        ----------
+        maxIndex : int
+            New value of maxIndex.
+        """
+        self.__maxIndex = maxIndex
+        if self.__owner is not None:
+            self.__owner.attributeModified(self)
+
+    def getOwner(self) -> AttributeOwner:
+        """
+        Accessor for the owner which is told when maxIndex is changed.
+
+        RETURNS
+        -------
+        AttributeOwner
+            Owner of the attribute, None if it has none.
+        """
+        return self.__owner
+
+    def setOwner(self, owner: AttributeOwner):
+        """
+        Mutator for the owner which is told when maxIndex is changed.
+
+        PARAMETERS
+        ----------
+        owner : AttributeOwner
+            New owner of the attribute.
+        """
+        self.__owner = owner
+
     def continuousAttributeSize(self) -> int:
         return self.__maxIndex
 
@@ -1,7 +1,6 @@
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
-from Classification.Model.DecisionTree.DecisionNode import DecisionNode
-from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.BootstrapTrees import BootstrapTrees
 from Classification.Model.TreeEnsembleModel import TreeEnsembleModel
 from Classification.Parameter.BaggingParameter import BaggingParameter
 from Classification.Parameter.Parameter import Parameter
@@ -17,7 +16,12 @@ class Bagging(Classifier):
         random redistribution of the training set.
         This training method is for a bagged decision tree classifier. 20 percent of the instances are left aside for
         pruning of the trees 80 percent of the instances are used for training the trees. The number of trees
-        (forestSize) is a parameter, and basically the method will learn an ensemble of trees as a model.
+        (forestSize) is a parameter, and basically the method will learn an ensemble of trees as a model. Each bootstrap
+        sample is a view of the drawn instances of the training set weighted with the number of times they are drawn,
+        so no sample is copied. With histogram bins, the continuous attributes of the training set are binned once for
+        all trees; otherwise each tree finds the exact splits from the presorted index lists of its sample. With more
+        than one process, the trees are grown in a process pool sharing the training set, and the ensemble is the one
+        grown in a single process.
 
         PARAMETERS
         ----------
@@ -26,13 +30,7 @@ class Bagging(Classifier):
         parameters : Parameter
             Parameters of the bagging trees algorithm. ensembleSize returns the number of trees in the bagged forest.
         """
-        forest_size = parameters.getEnsembleSize()
-        forest = []
-        for i in range(forest_size):
-            bootstrap = trainSet.bootstrap(i)
-            tree = DecisionTree(DecisionNode(InstanceList(bootstrap.getSample())))
-            forest.append(tree)
-        self.model = TreeEnsembleModel(forest)
+        self.model = TreeEnsembleModel(BootstrapTrees(trainSet, parameters, False).trees())
 
     def loadModel(self, fileName: str):
         self.model = TreeEnsembleModel(fileName)
@@ -3,6 +3,8 @@ from Classification.InstanceList.InstanceList import InstanceList
 from Classification.InstanceList.Partition import Partition
 from Classification.Model.DecisionTree.DecisionNode import DecisionNode
 from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.PresortedIndexLists import PresortedIndexLists
+from Classification.Model.DecisionTree.QuantileHistogram import QuantileHistogram
 from Classification.Parameter.C45Parameter import C45Parameter
 
 
@@ -13,7 +15,10 @@ class C45(Classifier):
               parameters: C45Parameter):
         """
         Training algorithm for C4.5 univariate decision tree classifier. 20 percent of the data are left aside for
-        pruning 80 percent of the data is used for constructing the tree.
+        pruning 80 percent of the data is used for constructing the tree. If the parameters have histogram bins, the
+        continuous attributes of the data the tree is constructed on are binned once, and the splits are found from the
+        bins. Otherwise the data is argsorted once with respect to each continuous attribute, and the nodes find the
+        exact splits from the presorted index lists, leaving the training data in its order.
 
         PARAMETERS
         ----------
@@ -27,11 +32,21 @@ class C45(Classifier):
                                   ratio=parameters.getCrossValidationRatio(),
                                   seed=parameters.getSeed(),
                                   stratified=True)
-            tree = DecisionTree(DecisionNode(partition.get(1)))
+            tree = DecisionTree(self.__rootNode(partition.get(1), parameters))
             tree.prune(partition.get(0))
         else:
-            tree = DecisionTree(DecisionNode(trainSet))
+            tree = DecisionTree(self.__rootNode(trainSet, parameters))
         self.model = tree
 
+    @staticmethod
+    def __rootNode(data: InstanceList, parameters: C45Parameter) -> DecisionNode:
+        """
+        Grows the decision tree on the given data, from the quantile bins of the data if the parameters have histogram
+        bins, from the presorted index lists of the data otherwise.
+        """
+        if parameters.getHistogramBins() > 0:
+            return DecisionNode(data, histogram=QuantileHistogram(data, parameters.getHistogramBins()))
+        return DecisionNode(data, presorted=PresortedIndexLists(data))
+
     def loadModel(self, fileName: str):
         self.model = DecisionTree(fileName)
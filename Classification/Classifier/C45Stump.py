@@ -2,6 +2,8 @@ from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.DecisionTree.DecisionNode import DecisionNode
 from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.QuantileHistogram import QuantileHistogram
+from Classification.Parameter.C45Parameter import C45Parameter
 from Classification.Parameter.Parameter import Parameter
 
 
@@ -11,7 +13,8 @@ class C45Stump(Classifier):
               trainSet: InstanceList,
               parameters: Parameter):
         """
-        Training algorithm for C4.5 Stump univariate decision tree classifier.
+        Training algorithm for C4.5 Stump univariate decision tree classifier. If the parameters are C45Parameter
+        with histogram bins, the split of a continuous attribute is found from its quantile bins.
 
         PARAMETERS
         ----------
@@ -20,8 +23,12 @@ class C45Stump(Classifier):
         parameters: Parameter
             Parameter of the C45Stump algorithm.
         """
+        histogram = None
+        if isinstance(parameters, C45Parameter) and parameters.getHistogramBins() > 0:
+            histogram = QuantileHistogram(trainSet, parameters.getHistogramBins())
         self.model = DecisionTree(DecisionNode(data=trainSet,
-                                               isStump=True))
+                                               isStump=True,
+                                               histogram=histogram))
 
     def loadModel(self, fileName: str):
         self.model = DecisionTree(fileName)
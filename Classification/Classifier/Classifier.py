@@ -1,4 +1,6 @@
 from abc import abstractmethod
+
+import numpy as np
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Parameter.Parameter import Parameter
 from Classification.Instance.Instance import Instance
@@ -45,7 +47,9 @@ class Classifier(object):
 
     def test(self, testSet: InstanceList) -> Performance:
         """
-        TestClassification an instance list with the current model.
+        TestClassification an instance list with the current model. An instance with a weight counts as many times as
+        its weight. The actual and predicted classes are coded with the class label encoding of the instance list, and
+        the confusion matrix is filled from the codes at once.
 
         PARAMETERS
         ----------
@@ -59,9 +63,19 @@ class Classifier(object):
         """
         class_labels = testSet.getUnionOfPossibleClassLabels()
         confusion = ConfusionMatrix(class_labels)
+        class_label_index = dict(testSet.getClassLabelIndex())
+        code_labels = list(testSet.getClassLabelNames())
+        predicted_codes = []
         for i in range(testSet.size()):
-            instance = testSet.get(i)
-            confusion.classify(instance.getClassLabel(), self.model.predict(instance))
+            predicted_class = self.model.predict(testSet.get(i))
+            code = class_label_index.get(predicted_class)
+            if code is None:
+                code = len(code_labels)
+                class_label_index[predicted_class] = code
+                code_labels.append(predicted_class)
+            predicted_codes.append(code)
+        confusion.classifyCodes(testSet.getClassLabelCodes(), np.array(predicted_codes, dtype=np.int64), code_labels,
+                                testSet.getWeights())
         return DetailedClassificationPerformance(confusion)
 
     def singleRun(self,
@@ -1,5 +1,6 @@
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStream import InstanceListStream
 from Classification.Model.DummyModel import DummyModel
 from Classification.Parameter.Parameter import Parameter
 
@@ -11,16 +12,20 @@ class Dummy(Classifier):
               parameters: Parameter = None):
         """
         Training algorithm for the dummy classifier. Actually dummy classifier returns the maximum occurring class in
-        the training data, there is no training.
+        the training data, there is no training. If the training data is an InstanceListStream, the class distribution
+        is found in a single pass over the stream.
 
         PARAMETERS
         ----------
         trainSet: InstanceList
-            Training data given to the algorithm.
+            Training data given to the algorithm, an InstanceList or an InstanceListStream.
         parameters: Parameter
             Parameter of the Dummy algorithm.
         """
-        self.model = DummyModel(trainSet)
+        if isinstance(trainSet, InstanceListStream):
+            self.model = DummyModel(trainSet.classDistribution())
+        else:
+            self.model = DummyModel(trainSet)
 
     def loadModel(self, fileName: str):
         self.model = DummyModel(fileName)
@@ -1,5 +1,8 @@
+from Math.DiscreteDistribution import DiscreteDistribution
+
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStream import InstanceListStream
 from Classification.InstanceList.Partition import Partition
 from Classification.Model.KMeansModel import KMeansModel
 from Classification.Parameter.KMeansParameter import KMeansParameter
@@ -10,11 +13,17 @@ class KMeans(Classifier):
     def train(self,
               trainSet: InstanceList,
               parameters: KMeansParameter):
-        prior_distribution = trainSet.classDistribution()
         class_means = InstanceList()
-        class_lists = Partition(trainSet)
-        for i in range(class_lists.size()):
-            class_means.add(class_lists.get(i).average())
+        if isinstance(trainSet, InstanceListStream):
+            prior_distribution = DiscreteDistribution()
+            for class_label, statistics in trainSet.classStatistics().items():
+                prior_distribution.addDistribution(statistics.getClassDistribution())
+                class_means.add(trainSet.average(class_label, statistics))
+        else:
+            prior_distribution = trainSet.classDistribution()
+            class_lists = Partition(trainSet)
+            for i in range(class_lists.size()):
+                class_means.add(class_lists.get(i).average())
         self.model = KMeansModel(priorDistribution=prior_distribution,
                                  classMeans=class_means,
                                  distanceMetric=parameters.getDistanceMetric())
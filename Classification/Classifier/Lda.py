@@ -1,8 +1,10 @@
+from Math.DiscreteDistribution import DiscreteDistribution
 from Math.Matrix import Matrix
 from Math.Vector import Vector
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStream import InstanceListStream
 from Classification.InstanceList.Partition import Partition
 from Classification.Model.LdaModel import LdaModel
 from Classification.Parameter.Parameter import Parameter
@@ -17,30 +19,46 @@ class Lda(Classifier):
               parameters: Parameter = None):
         """
         Training algorithm for the linear discriminant analysis classifier (Introduction to Machine Learning, Alpaydin,
-        2015).
+        2015). If the training data is an InstanceListStream, the class means and the pooled covariance are found from
+        the moments of the instances of each class in a single pass over the stream.
 
         PARAMETERS
         ----------
         trainSet : InstanceList
-            Training data given to the algorithm.
+            Training data given to the algorithm, an InstanceList or an InstanceListStream.
         parameters : Parameter
             Parameter of the Lda algorithm.
         """
         w0 = {}
         w = {}
-        prior_distribution = trainSet.classDistribution()
-        class_lists = Partition(trainSet)
-        covariance = Matrix(trainSet.get(0).continuousAttributeSize(), trainSet.get(0).continuousAttributeSize())
-        for i in range(class_lists.size()):
-            average_vector = Vector(class_lists.get(i).continuousAverage())
-            class_covariance = class_lists.get(i).covariance(average_vector)
-            class_covariance.multiplyWithConstant(class_lists.get(i).size() - 1)
-            covariance.add(class_covariance)
-        covariance.divideByConstant(trainSet.size() - class_lists.size())
+        class_averages = {}
+        if isinstance(trainSet, InstanceListStream):
+            class_statistics = trainSet.classStatistics()
+            prior_distribution = DiscreteDistribution()
+            covariance = None
+            for class_label, statistics in class_statistics.items():
+                prior_distribution.addDistribution(statistics.getClassDistribution())
+                average_vector = Vector(statistics.getMoments().getMean())
+                class_averages[class_label] = average_vector
+                if covariance is None:
+                    covariance = Matrix(average_vector.size(), average_vector.size())
+                class_covariance = statistics.getMoments().getCovariance(average_vector)
+                class_covariance.multiplyWithConstant(statistics.getCount() - 1)
+                covariance.add(class_covariance)
+            covariance.divideByConstant(int(prior_distribution.getSum()) - len(class_statistics))
+        else:
+            prior_distribution = trainSet.classDistribution()
+            class_lists = Partition(trainSet)
+            covariance = Matrix(trainSet.get(0).continuousAttributeSize(), trainSet.get(0).continuousAttributeSize())
+            for i in range(class_lists.size()):
+                average_vector = Vector(class_lists.get(i).continuousAverage())
+                class_averages[class_lists.get(i).getClassLabel()] = average_vector
+                class_covariance = class_lists.get(i).covariance(average_vector)
+                class_covariance.multiplyWithConstant(class_lists.get(i).totalWeight() - 1)
+                covariance.add(class_covariance)
+            covariance.divideByConstant(trainSet.totalWeight() - class_lists.size())
         covariance.inverse()
-        for i in range(class_lists.size()):
-            Ci = class_lists.get(i).getClassLabel()
-            average_vector = Vector(class_lists.get(i).continuousAverage())
+        for Ci, average_vector in class_averages.items():
             wi = covariance.multiplyWithVectorFromRight(average_vector)
             w[Ci] = wi
             w0i = -0.5 * wi.dotProduct(average_vector) + math.log(prior_distribution.getProbability(Ci))
@@ -1,8 +1,11 @@
 from Math.DiscreteDistribution import DiscreteDistribution
+from Math.Vector import Vector
 
+from Classification.Attribute.AttributeType import AttributeType
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStream import InstanceListStream
 from Classification.InstanceList.Partition import Partition
 from Classification.Model.NaiveBayesModel import NaiveBayesModel
 from Classification.Parameter.Parameter import Parameter
@@ -56,18 +59,50 @@ class NaiveBayes(Classifier):
         if isinstance(self.model, NaiveBayesModel):
             self.model.initForDiscrete(class_attribute_distributions)
 
+    def trainWithStream(self, trainSet: InstanceListStream):
+        """
+        Training algorithm for Naive Bayes algorithm in a single pass over a stream of instances. The class means and
+        standard deviations of a continuous data set, or the class attribute distributions of a discrete data set, are
+        found from the statistics of the instances of each class.
+
+        PARAMETERS
+        ----------
+        trainSet : InstanceListStream
+            Training data given to the algorithm
+        """
+        class_statistics = trainSet.classStatistics()
+        prior_distribution = DiscreteDistribution()
+        for statistics in class_statistics.values():
+            prior_distribution.addDistribution(statistics.getClassDistribution())
+        self.model = NaiveBayesModel(prior_distribution)
+        if trainSet.getDataDefinition().getAttributeType(0) is AttributeType.CONTINUOUS:
+            class_means = {}
+            class_deviations = {}
+            for class_label, statistics in class_statistics.items():
+                class_means[class_label] = Vector(statistics.getMoments().getMean())
+                class_deviations[class_label] = Vector(statistics.getMoments().getStandardDeviation())
+            self.model.initForContinuous(class_means, class_deviations)
+        else:
+            class_attribute_distributions = {}
+            for class_label, statistics in class_statistics.items():
+                class_attribute_distributions[class_label] = statistics.getAttributeDistributions()
+            self.model.initForDiscrete(class_attribute_distributions)
+
     def train(self,
               trainSet: InstanceList,
               parameters: Parameter = None):
         """
         Training algorithm for Naive Bayes algorithm. It basically calls trainContinuousVersion for continuous data
-        sets, trainDiscreteVersion for discrete data sets.
+        sets, trainDiscreteVersion for discrete data sets and trainWithStream for streams of instances.
 
         PARAMETERS
         ----------
         trainSet : InstanceList
-            Training data given to the algorithm
+            Training data given to the algorithm, an InstanceList or an InstanceListStream.
         """
+        if isinstance(trainSet, InstanceListStream):
+            self.trainWithStream(trainSet)
+            return
         prior_distribution = trainSet.classDistribution()
         class_lists = Partition(trainSet)
         if isinstance(class_lists.get(0).get(0).getAttribute(0), DiscreteAttribute):
@@ -1,7 +1,6 @@
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
-from Classification.Model.DecisionTree.DecisionNode import DecisionNode
-from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.BootstrapTrees import BootstrapTrees
 from Classification.Model.TreeEnsembleModel import TreeEnsembleModel
 from Classification.Parameter.RandomForestParameter import RandomForestParameter
 
@@ -13,7 +12,11 @@ class RandomForest(Classifier):
               parameters: RandomForestParameter):
         """
         Training algorithm for random forest classifier. Basically the algorithm creates K distinct decision trees from
-        K bootstrap samples of the original training set.
+        K bootstrap samples of the original training set. Each bootstrap sample is a view of the drawn instances of the
+        training set weighted with the number of times they are drawn, so no sample is copied. With histogram bins,
+        the continuous attributes of the training set are binned once for all trees; otherwise each tree finds the exact
+        splits from the presorted index lists of its sample. With more than one process, the trees are grown in a
+        process pool sharing the training set, and the forest is the one grown in a single process.
 
         PARAMETERS
         ----------
@@ -22,15 +25,7 @@ class RandomForest(Classifier):
         parameters : RandomForestParameter
             Parameters of the bagging trees algorithm. ensembleSize returns the number of trees in the random forest.
         """
-        forest_size = parameters.getEnsembleSize()
-        forest = []
-        for i in range(forest_size):
-            bootstrap = trainSet.bootstrap(i)
-            tree = DecisionTree(DecisionNode(data=InstanceList(bootstrap.getSample()),
-                                             parameter=parameters,
-                                             isStump=False))
-            forest.append(tree)
-        self.model = TreeEnsembleModel(forest)
+        self.model = TreeEnsembleModel(BootstrapTrees(trainSet, parameters, True).trees())
 
     def loadModel(self, fileName: str):
         self.model = TreeEnsembleModel(fileName)
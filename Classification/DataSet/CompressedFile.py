@@ -0,0 +1,72 @@
+import bz2
+import gzip
+import lzma
+
+
+class CompressedFile(object):
+
+    MAGIC_BYTES = {b"\x1f\x8b": gzip, b"BZh": bz2, b"\xfd7zXZ\x00": lzma}
+    EXTENSIONS = {".gz": gzip, ".gzip": gzip, ".bz2": bz2, ".xz": lzma, ".lzma": lzma}
+
+    @staticmethod
+    def compressionOf(fileName: str, mode: str = "r"):
+        """
+        Finds the compression module of the given file from its extension, or, if the file is read and its extension
+        is not a known one, from the magic bytes at its start.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file.
+        mode : str
+            Mode the file is opened in.
+
+        RETURNS
+        -------
+        module
+            One of the gzip, bz2 and lzma modules, None if the file is not compressed.
+        """
+        lower_name = fileName.lower()
+        for extension, module in CompressedFile.EXTENSIONS.items():
+            if lower_name.endswith(extension):
+                return module
+        if "r" not in mode:
+            return None
+        with open(fileName, "rb") as input_file:
+            start = input_file.read(6)
+        for magic, module in CompressedFile.MAGIC_BYTES.items():
+            if start.startswith(magic):
+                return module
+        return None
+
+    @staticmethod
+    def open(fileName: str,
+             mode: str = "r",
+             encoding: str = "utf8"):
+        """
+        Opens the given file as the built-in open does, decompressing (or compressing, if it is written) it on the fly
+        if it is a gzip, bzip2 or xz file. The file is streamed, so a compressed file is never decompressed as a whole,
+        neither in memory nor on the disk.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file.
+        mode : str
+            Mode of the file, 'r', 'w' or 'a', followed by 'b' for a binary file.
+        encoding : str
+            Encoding of a text file.
+
+        RETURNS
+        -------
+        file
+            File object of the file.
+        """
+        module = CompressedFile.compressionOf(fileName, mode)
+        if "b" in mode:
+            if module is None:
+                return open(fileName, mode)
+            return module.open(fileName, mode)
+        if module is None:
+            return open(fileName, mode, encoding=encoding)
+        return module.open(fileName, mode + "t", encoding=encoding)
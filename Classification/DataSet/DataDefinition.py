@@ -7,32 +7,120 @@ class DataDefinition(object):
 
     __attributeTypes: list
     __attributeValueList: [[str]]
+    __attributeValueIndex: [dict]
 
     def __init__(self, attributeTypes=None, attributeValueList=None):
         """
-        Constructor for creating a new DataDefinition with given attribute types.
+        Constructor for creating a new DataDefinition with given attribute types. For each attribute, a dictionary
+        mapping its possible values to their indexes is kept next to the value list, so that the index of a value is
+        found in constant time.
 
         PARAMETERS
         ----------
         attributeTypes : list
             Attribute types of the data definition.
+        attributeValueList : list
+            Possible values of each discrete indexed attribute. Attributes without a value list get their values in
+            the order they are first seen while loading the data.
         """
         if attributeTypes is None:
             attributeTypes = []
-        if attributeValueList is not None:
-            self.__attributeValueList = attributeValueList
+        if attributeValueList is None:
+            attributeValueList = []
         self.__attributeTypes = attributeTypes
+        self.__attributeValueList = []
+        self.__attributeValueIndex = []
+        for i in range(max(len(attributeTypes), len(attributeValueList))):
+            if i < len(attributeValueList):
+                self.__addValueList(attributeValueList[i])
+            else:
+                self.__addValueList([])
+
+    def __addValueList(self, values: list):
+        """
+        Appends the value list of a new attribute together with its value to index dictionary.
+
+        PARAMETERS
+        ----------
+        values : list
+            Possible values of the attribute.
+        """
+        value_index = {}
+        for i in range(len(values)):
+            if values[i] not in value_index:
+                value_index[values[i]] = i
+        self.__attributeValueList.append(values)
+        self.__attributeValueIndex.append(value_index)
 
     def numberOfValues(self, attributeIndex: int) -> int:
         return len(self.__attributeValueList[attributeIndex])
 
+    def getAttributeValueIndex(self, attributeIndex: int) -> dict:
+        """
+        Returns the dictionary mapping the possible values of an attribute to their indexes. The dictionary is shared,
+        not copied, so readers, filters and classifiers working on the same data definition use the same codes.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping the values of the attribute to their indexes.
+        """
+        return self.__attributeValueIndex[attributeIndex]
+
+    def addAttributeValue(self,
+                          attributeIndex: int,
+                          value: str) -> int:
+        """
+        Returns the index of the given value of an attribute, adding the value to the end of the value list of the
+        attribute if it is not there yet.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        value : str
+            Value of the attribute.
+
+        RETURNS
+        -------
+        int
+            Index of the value.
+        """
+        value_index = self.__attributeValueIndex[attributeIndex]
+        index = value_index.get(value)
+        if index is None:
+            index = len(self.__attributeValueList[attributeIndex])
+            value_index[value] = index
+            self.__attributeValueList[attributeIndex].append(value)
+        return index
+
+    def getAttributeValues(self, attributeIndex: int) -> list:
+        """
+        Returns the possible values of a discrete indexed attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Possible values of the attribute, an empty list if they are not given.
+        """
+        if attributeIndex >= len(self.__attributeValueList):
+            return []
+        return self.__attributeValueList[attributeIndex]
+
     def featureValueIndex(self,
                           attributeIndex: int,
                           value: str) -> int:
-        for i in range(len(self.__attributeValueList[attributeIndex])):
-            if self.__attributeValueList[attributeIndex][i] == value:
-                return i
-        return -1
+        return self.__attributeValueIndex[attributeIndex].get(value, -1)
 
     def attributeCount(self) -> int:
         """
@@ -91,7 +179,9 @@ class DataDefinition(object):
         """
         return self.__attributeTypes[index]
 
-    def addAttribute(self, attributeType: AttributeType):
+    def addAttribute(self,
+                     attributeType: AttributeType,
+                     values: list = None):
         """
         Adds an attribute type to the list of attribute types.
 
@@ -99,8 +189,13 @@ class DataDefinition(object):
         ----------
         attributeType : AttributeType
             Attribute type to add to the list of attribute types.
+        values : list
+            Possible values of the attribute, if it is a discrete indexed attribute.
         """
+        if values is None:
+            values = []
         self.__attributeTypes.append(attributeType)
+        self.__addValueList(values)
 
     def removeAttribute(self, index: int):
         """
@@ -112,12 +207,16 @@ class DataDefinition(object):
             Index to remove attribute type from list.
         """
         self.__attributeTypes.pop(index)
+        self.__attributeValueList.pop(index)
+        self.__attributeValueIndex.pop(index)
 
     def removeAllAtrributes(self):
         """
         Clears all the attribute types from list.
         """
         self.__attributeTypes.clear()
+        self.__attributeValueList.clear()
+        self.__attributeValueIndex.clear()
 
     def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> DataDefinition:
         """
@@ -134,6 +233,8 @@ class DataDefinition(object):
             DataDefinition with new subset of attribute types.
         """
         new_attribute_types = []
+        new_attribute_value_list = []
         for i in range(featureSubSet.size()):
             new_attribute_types.append(self.__attributeTypes[featureSubSet.get(i)])
-        return DataDefinition(new_attribute_types)
+            new_attribute_value_list.append(self.__attributeValueList[featureSubSet.get(i)])
+        return DataDefinition(new_attribute_types, new_attribute_value_list)
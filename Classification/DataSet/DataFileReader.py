@@ -0,0 +1,446 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from Classification.Attribute.AttributeOwner import AttributeOwner
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.BinaryAttribute import BinaryAttribute
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.CompressedFile import CompressedFile
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.Instance.Instance import Instance
+
+
+class DataFileReader(object):
+
+    __definition: DataDefinition
+    __separator: str
+    __file_name: str
+    __chunk_size: int
+    __converters: list
+    __shared_attributes: list
+    __shared_owner: AttributeOwner
+    __growing_columns: list
+    __processes: int
+
+    BINARY_TRUE_VALUES = frozenset(["True", "true", "Yes", "yes", "y", "Y"])
+    DEFAULT_CHUNK_SIZE = 10000
+    MINIMUM_RANGE_SIZE = 1 << 20
+    RANGES_PER_PROCESS = 4
+
+    def __init__(self,
+                 definition: DataDefinition,
+                 separator: str,
+                 fileName: str,
+                 chunkSize: int = DEFAULT_CHUNK_SIZE,
+                 processes: int = 1):
+        """
+        Constructor for a streaming reader of a data file. Each instance must be stored in a separate line separated
+        with the character separator, the last item being the class label. The file is read chunkSize lines at a time,
+        so only one chunk of lines is held in memory. The conversion of each column is decided once from the data
+        definition, and then applied to whole columns of a chunk. Discrete attributes are immutable, so a single
+        attribute object is created for each distinct value of a column and shared by all rows having that value. A
+        gzip, bzip2 or xz compressed data file is decompressed on the fly while it is read.
+
+        Discrete indexed attributes without a value list in the data definition get their values in the order they
+        are first seen: each new value is appended to the value list of the data definition, and the maximum index of
+        the attributes read so far is updated after every chunk. The shared discrete indexed attributes have an owner of
+        their own, so a change of their maximum index is a change of the instances read by this reader only.
+
+        With more than one process, an uncompressed data file is split at line boundaries into byte ranges, which are
+        parsed by a pool of processes into column chunks (see readColumnChunks). The chunks are converted in the order
+        of the ranges, so the rows, their order and the value lists are the same as reading the file in one process.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        chunkSize : int
+            Number of lines read at a time.
+        processes : int
+            Number of processes parsing the data file.
+        """
+        self.__definition = definition
+        self.__separator = separator
+        self.__file_name = fileName
+        self.__chunk_size = chunkSize
+        self.__processes = processes
+        self.__converters = []
+        self.__shared_attributes = []
+        self.__shared_owner = AttributeOwner()
+        self.__growing_columns = []
+        for i in range(definition.attributeCount()):
+            attribute_type = definition.getAttributeType(i)
+            self.__shared_attributes.append({})
+            if attribute_type is AttributeType.DISCRETE_INDEXED and definition.numberOfValues(i) == 0:
+                self.__growing_columns.append(i)
+            if attribute_type is AttributeType.CONTINUOUS:
+                self.__converters.append(self.__continuousColumn)
+            else:
+                self.__converters.append(self.__discreteColumn)
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the data set.
+        """
+        return self.__definition
+
+    def featureValueIndex(self,
+                          attributeIndex: int,
+                          value: str) -> int:
+        """
+        Returns the index of the value of a discrete indexed attribute, using the value dictionary of the data
+        definition. Values of attributes whose value list is built while reading are added to the data definition.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        value : str
+            Value of the attribute.
+
+        RETURNS
+        -------
+        int
+            Index of the value in the data definition, -1 if it does not exist.
+        """
+        if attributeIndex in self.__growing_columns:
+            return self.__definition.addAttributeValue(attributeIndex, value)
+        return self.__definition.featureValueIndex(attributeIndex, value)
+
+    def __updateMaxIndexes(self):
+        """
+        Sets the maximum index of the shared discrete indexed attributes, whose value lists are built while reading, to
+        the number of values seen so far.
+        """
+        for i in self.__growing_columns:
+            number_of_values = self.__definition.numberOfValues(i)
+            for attribute in self.__shared_attributes[i].values():
+                attribute.setMaxIndex(number_of_values)
+
+    def __continuousColumn(self,
+                           attributeIndex: int,
+                           values: tuple) -> list:
+        return [ContinuousAttribute(float(value)) for value in values]
+
+    def __sharedAttribute(self,
+                          attributeIndex: int,
+                          value: str) -> DiscreteAttribute:
+        """
+        Returns the shared attribute object of the given value of a discrete, binary or discrete indexed column,
+        creating it on first use.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        value : str
+            Value of the attribute as read from the data file.
+
+        RETURNS
+        -------
+        DiscreteAttribute
+            Attribute shared by all rows with the given value.
+        """
+        attributes = self.__shared_attributes[attributeIndex]
+        attribute = attributes.get(value)
+        if attribute is None:
+            attribute_type = self.__definition.getAttributeType(attributeIndex)
+            if attribute_type is AttributeType.DISCRETE:
+                attribute = DiscreteAttribute(value)
+            elif attribute_type is AttributeType.BINARY:
+                attribute = BinaryAttribute(value in self.BINARY_TRUE_VALUES)
+            else:
+                attribute = DiscreteIndexedAttribute(value,
+                                                     self.featureValueIndex(attributeIndex, value),
+                                                     self.__definition.numberOfValues(attributeIndex))
+                attribute.setOwner(self.__shared_owner)
+            attributes[value] = attribute
+        return attribute
+
+    def __discreteColumn(self,
+                         attributeIndex: int,
+                         values: tuple) -> list:
+        attributes = self.__shared_attributes[attributeIndex]
+        return [attributes.get(value) or self.__sharedAttribute(attributeIndex, value) for value in values]
+
+    def readRows(self):
+        """
+        Reads the data file chunk by chunk and yields, for each chunk, the list of rows whose number of items matches
+        the data definition. Each row is the list of items of a line.
+
+        RETURNS
+        -------
+        generator
+            Lists of rows.
+        """
+        item_count = self.__definition.attributeCount() + 1
+        separator = self.__separator
+        input_file = CompressedFile.open(self.__file_name, 'r', encoding='utf8')
+        try:
+            while True:
+                lines = list(islice(input_file, self.__chunk_size))
+                if len(lines) == 0:
+                    break
+                rows = []
+                for line in lines:
+                    items = line.strip().split(separator)
+                    if len(items) == item_count:
+                        rows.append(items)
+                if len(rows) > 0:
+                    yield rows
+        finally:
+            input_file.close()
+
+    def readColumns(self):
+        """
+        Reads the data file chunk by chunk and yields, for each chunk, the attribute columns and the class label column.
+        Each column is a tuple of the string items of that column.
+
+        RETURNS
+        -------
+        generator
+            Pairs of attribute columns list and class label column.
+        """
+        attribute_count = self.__definition.attributeCount()
+        for rows in self.readRows():
+            columns = list(zip(*rows))
+            yield columns[:attribute_count], columns[attribute_count]
+
+    @staticmethod
+    def __encodeColumn(values) -> tuple:
+        """
+        Codes the given string items with the indexes of their distinct values in the order of first occurrence.
+
+        PARAMETERS
+        ----------
+        values
+            String items of a column.
+
+        RETURNS
+        -------
+        tuple
+            List of the distinct values and int32 array of the codes of the items.
+        """
+        value_index = {}
+        codes = [value_index.setdefault(value, len(value_index)) for value in values]
+        return list(value_index), np.array(codes, dtype=np.int32)
+
+    @staticmethod
+    def encodeColumns(continuous: list,
+                      columns: list,
+                      labels) -> tuple:
+        """
+        Converts the string columns of a chunk into a compact column chunk: each continuous column is parsed into a
+        float array, and each other column, as well as the class label column, is coded with the indexes of its distinct
+        values in the order of their first occurrence.
+
+        PARAMETERS
+        ----------
+        continuous : list
+            For each attribute, True if it is continuous.
+        columns : list
+            Attribute columns, each a sequence of string items.
+        labels
+            Class label column.
+
+        RETURNS
+        -------
+        tuple
+            List of the encoded attribute columns, and the encoded class label column. A continuous column is a float
+            array; any other column is a pair of the list of its distinct values and the array of the codes of its
+            items.
+        """
+        encoded = []
+        for i in range(len(columns)):
+            if continuous[i]:
+                encoded.append(np.fromiter(map(float, columns[i]), dtype=np.float64, count=len(columns[i])))
+            else:
+                encoded.append(DataFileReader.__encodeColumn(columns[i]))
+        return encoded, DataFileReader.__encodeColumn(labels)
+
+    @staticmethod
+    def parseRange(fileName: str,
+                   separator: str,
+                   continuous: list,
+                   start: int,
+                   end: int) -> tuple:
+        """
+        Parses the lines in the given byte range of an uncompressed data file into a column chunk. This is the work
+        done by each process of a parallel read; the range must start and end at line boundaries.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data set file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        continuous : list
+            For each attribute, True if it is continuous.
+        start : int
+            Offset of the first byte of the range.
+        end : int
+            Offset after the last byte of the range.
+
+        RETURNS
+        -------
+        tuple
+            Column chunk of the lines of the range, in the format of encodeColumns.
+        """
+        input_file = open(fileName, 'rb')
+        input_file.seek(start)
+        data = input_file.read(end - start)
+        input_file.close()
+        item_count = len(continuous) + 1
+        rows = []
+        for line in io.StringIO(data.decode('utf8'), newline=None):
+            items = line.strip().split(separator)
+            if len(items) == item_count:
+                rows.append(items)
+        if len(rows) > 0:
+            columns = list(zip(*rows))
+        else:
+            columns = [()] * item_count
+        return DataFileReader.encodeColumns(continuous, columns[:-1], columns[-1])
+
+    @staticmethod
+    def fileRanges(fileName: str, parts: int) -> list:
+        """
+        Splits a file into about the given number of byte ranges of about equal size, each range starting and ending at
+        a line boundary.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file.
+        parts : int
+            Number of ranges.
+
+        RETURNS
+        -------
+        list
+            List of (start, end) byte offsets of the ranges, in the order of the file.
+        """
+        size = os.path.getsize(fileName)
+        boundaries = [0]
+        input_file = open(fileName, 'rb')
+        for k in range(1, parts):
+            position = size * k // parts
+            if position <= boundaries[-1]:
+                continue
+            input_file.seek(position - 1)
+            input_file.readline()
+            position = input_file.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+        input_file.close()
+        boundaries.append(size)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    def __parallelRanges(self) -> list:
+        """
+        Returns the byte ranges parsed in parallel, or None if the file is read in a single process: when there is
+        one process, when the file is compressed, or when it is too small to be worth splitting.
+        """
+        if self.__processes <= 1 or CompressedFile.compressionOf(self.__file_name) is not None:
+            return None
+        parts = min(self.__processes * self.RANGES_PER_PROCESS,
+                    os.path.getsize(self.__file_name) // self.MINIMUM_RANGE_SIZE)
+        if parts <= 1:
+            return None
+        ranges = self.fileRanges(self.__file_name, parts)
+        if len(ranges) <= 1:
+            return None
+        return ranges
+
+    def readColumnChunks(self):
+        """
+        Reads the data file and yields its rows as column chunks in the format of encodeColumns, in the order of the
+        file. With more than one process the byte ranges of the file are parsed in a process pool, one chunk for each
+        range; otherwise the file is read chunkSize lines at a time.
+
+        RETURNS
+        -------
+        generator
+            Pairs of encoded attribute columns list and encoded class label column.
+        """
+        continuous = [self.__definition.getAttributeType(i) is AttributeType.CONTINUOUS
+                      for i in range(self.__definition.attributeCount())]
+        ranges = self.__parallelRanges()
+        if ranges is None:
+            for columns, labels in self.readColumns():
+                yield self.encodeColumns(continuous, columns, labels)
+        else:
+            with ProcessPoolExecutor(min(self.__processes, len(ranges))) as pool:
+                futures = [pool.submit(DataFileReader.parseRange, self.__file_name, self.__separator, continuous,
+                                       start, end) for start, end in ranges]
+                for future in futures:
+                    yield future.result()
+
+    def __readInstancesFromChunks(self):
+        """
+        Converts the column chunks of readColumnChunks into instances, chunk by chunk in the order of the file. The
+        distinct values of each chunk are converted to shared attributes in the order of their first occurrence, so
+        the value lists built while reading are the ones reading in one process gives.
+
+        RETURNS
+        -------
+        generator
+            Lists of instances.
+        """
+        for columns, labels in self.readColumnChunks():
+            attributes = []
+            for i in range(len(columns)):
+                if self.__definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                    attributes.append([ContinuousAttribute(value) for value in columns[i].tolist()])
+                else:
+                    values, codes = columns[i]
+                    shared = [self.__sharedAttribute(i, value) for value in values]
+                    attributes.append([shared[code] for code in codes.tolist()])
+            self.__updateMaxIndexes()
+            label_values, label_codes = labels
+            class_labels = [label_values[code] for code in label_codes.tolist()]
+            if len(class_labels) == 0:
+                continue
+            if len(attributes) > 0:
+                yield [Instance(label, list(row)) for label, row in zip(class_labels, zip(*attributes))]
+            else:
+                yield [Instance(label) for label in class_labels]
+
+    def readInstances(self):
+        """
+        Reads the data file chunk by chunk and yields, for each chunk, the list of instances of that chunk. Attributes
+        are created column by column using the conversion decided from the data definition. With more than one
+        process, the chunks are the column chunks parsed in parallel.
+
+        RETURNS
+        -------
+        generator
+            Lists of instances.
+        """
+        if self.__processes > 1:
+            yield from self.__readInstancesFromChunks()
+            return
+        for columns, labels in self.readColumns():
+            attributes = []
+            for i in range(len(columns)):
+                attributes.append(self.__converters[i](i, columns[i]))
+            self.__updateMaxIndexes()
+            if len(attributes) > 0:
+                yield [Instance(label, list(row)) for label, row in zip(labels, zip(*attributes))]
+            else:
+                yield [Instance(label) for label in labels]
@@ -2,9 +2,13 @@ from __future__ import annotations
 from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataFileReader import DataFileReader
+from Classification.DataSet.DataSetCache import DataSetCache
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Attribute.AttributeType import AttributeType
 from Classification.Instance.Instance import Instance
 from Classification.Instance.CompositeInstance import CompositeInstance
+from Classification.Instance.ProjectedInstance import ProjectedInstance
 from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 from Classification.Attribute.BinaryAttribute import BinaryAttribute
@@ -19,9 +23,17 @@ class DataSet(object):
     def __init__(self,
                  definition: DataDefinition = None,
                  separator: str = None,
-                 fileName: str = None):
-        """
-        Constructor for generating a new DataSet with given DataDefinition.
+                 fileName: str = None,
+                 cacheDirectory: str = None,
+                 processes: int = 1):
+        """
+        Constructor for generating a new DataSet with given DataDefinition. If a cache directory is given, the data file
+        is parsed only once; later data sets of the same file and definition memory map the binary cache stored in that
+        directory. The cache is rebuilt when the contents of the data file change. The instances of a cached data set are
+        a ColumnarInstanceList, which converts its columns again when its instances are changed, so filters and
+        writeToFile work on cached data sets as on the others. A cached data set does not change the given data
+        definition, its data definition is a copy. With more than one process, the data file is parsed in
+        parallel; the instances are in the same order as reading it in one process.
 
         PARAMETERS
         ----------
@@ -31,18 +43,26 @@ class DataSet(object):
             Separator character which separates the attribute values in the data file.
         fileName : str
             Name of the data set file.
+        cacheDirectory : str
+            Directory of the binary cache of the data file.
+        processes : int
+            Number of processes parsing the data file.
         """
         self.__definition = definition
         if separator is None:
             self.__instances = InstanceList()
+        elif cacheDirectory is not None:
+            self.__instances = DataSetCache(cacheDirectory).load(definition, separator, fileName, processes)
+            self.__definition = self.__instances.getDataDefinition()
         else:
             self.__instances = InstanceList(listOrDefinition=definition,
                                             separator=separator,
-                                            fileName=fileName)
+                                            fileName=fileName,
+                                            processes=processes)
 
     def initWithFile(self, fileName: str):
         """
-        Constructor for generating a new DataSet from given File.
+        Constructor for generating a new DataSet from given File. The file may be gzip, bzip2 or xz compressed.
 
         PARAMETERS
         ----------
@@ -51,11 +71,9 @@ class DataSet(object):
         """
         self.__instances = InstanceList()
         self.__definition = DataDefinition()
-        input_file = open(fileName, 'r', encoding='utf8')
-        lines = input_file.readlines()
-        input_file.close()
+        input_file = CompressedFile.open(fileName, 'r', encoding='utf8')
         i = 0
-        for line in lines:
+        for line in input_file:
             attributes = line.split(",")
             if i == 0:
                 for j in range(len(attributes) - 1):
@@ -80,6 +98,7 @@ class DataSet(object):
             if instance.attributeSize() == self.__definition.attributeCount():
                 self.__instances.add(instance)
             i = i + 1
+        input_file.close()
 
     def __checkDefinition(self, instance: Instance) -> bool:
         """
@@ -302,7 +321,10 @@ class DataSet(object):
 
     def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> DataSet:
         """
-        Return a subset generated via the given FeatureSubSet.
+        Return a subset generated via the given FeatureSubSet. The instances of the subset are projections of the
+        instances of this data set, which map the attribute indexes through the feature subset without copying the
+        attributes. Since the projected attributes have the types of the projected data definition, the instances are
+        not checked against it.
 
         PARAMETERS
         ----------
@@ -315,20 +337,61 @@ class DataSet(object):
             Subset generated via the given FeatureSubSet.
         """
         result = DataSet(self.__definition.getSubSetOfFeatures(featureSubSet))
-        for i in range(self.__instances.size()):
-            result.addInstance(self.__instances.get(i).getSubSetOfFeatures(featureSubSet))
+        indexes = tuple(featureSubSet.get(i) for i in range(featureSubSet.size()))
+        result.__instances = InstanceList([ProjectedInstance(instance, indexes) for instance in self.__instances])
+        result.__instances.setWeights(self.__instances.getWeights())
         return result
 
-    def writeToFile(self, outFileName: str):
+    def collapseDuplicates(self):
         """
-        Print out the instances of InstanceList as a String.
+        Replaces the instances with their unique instances, each having as weight the number of its duplicates. The
+        learners that count instances, such as NaiveBayes, C45 and Knn, give the same models on the collapsed data set,
+        while scanning each distinct row once.
+        """
+        self.__instances = self.__instances.collapseDuplicates()
+
+    def writeToFile(self,
+                    outFileName: str,
+                    chunkSize: int = DataFileReader.DEFAULT_CHUNK_SIZE):
+        """
+        Print out the instances of InstanceList as a String. An instance with a weight is printed as many times as its
+        weight. If the file name ends with .gz, .bz2 or .xz, the file is compressed. The lines of chunkSize instances
+        are formatted and written at once.
 
         PARAMETERS
         ----------
         outFileName : str
             File name to write the output.
+        chunkSize : int
+            Number of instances formatted at once.
         """
-        out_file = open(outFileName, "w")
-        for i in range(self.__instances.size()):
-            out_file.write(self.__instances.get(i).__str__() + "\n")
+        out_file = CompressedFile.open(outFileName, "w")
+        for start in range(0, self.__instances.size(), chunkSize):
+            out_file.write(self.__instances.formatRows(start, min(start + chunkSize, self.__instances.size())))
         out_file.close()
+
+    def writeToBinaryFile(self, baseName: str):
+        """
+        Exports the instances in the binary columnar format of DataSetCache, to the files baseName.json,
+        baseName.values.npy and baseName.codes.npy. The data set is reloaded with initWithBinaryFile without parsing
+        any text.
+
+        PARAMETERS
+        ----------
+        baseName : str
+            Path prefix of the exported files.
+        """
+        DataSetCache.writeColumns(self.__instances, self.__definition, baseName)
+
+    def initWithBinaryFile(self, baseName: str):
+        """
+        Constructor for generating a new DataSet from the columns exported with writeToBinaryFile. The columns are
+        memory mapped, and the data definition is the exported one.
+
+        PARAMETERS
+        ----------
+        baseName : str
+            Path prefix of the exported files.
+        """
+        self.__instances = DataSetCache.readColumns(baseName)
+        self.__definition = self.__instances.getDataDefinition()
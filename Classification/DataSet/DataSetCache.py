@@ -0,0 +1,406 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class DataSetCache(object):
+
+    __directory: str
+
+    VERSION = 1
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, directory: str):
+        """
+        Constructor for a binary cache of data files. For each data file and data definition the cache stores three
+        files in the given directory: a json header with the data definition, the values of the discrete codes and the
+        class labels, a NumPy array of the continuous attribute values and a NumPy array of the discrete attribute
+        codes whose last column holds the class label codes. The arrays are memory mapped when the cache is opened, so
+        processes opening the same cache share the same pages.
+
+        PARAMETERS
+        ----------
+        directory : str
+            Directory where the cache files are stored.
+        """
+        self.__directory = directory
+
+    @staticmethod
+    def definitionKey(definition: DataDefinition, separator: str) -> str:
+        """
+        Returns a hash of the data definition and the separator. Caches of the same data file read with different
+        definitions are kept apart by this key.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+
+        RETURNS
+        -------
+        str
+            Hash of the data definition.
+        """
+        signature = [separator]
+        for i in range(definition.attributeCount()):
+            signature.append([definition.getAttributeType(i).name, definition.getAttributeValues(i)])
+        return hashlib.sha256(json.dumps(signature).encode("utf8")).hexdigest()
+
+    @staticmethod
+    def fileHash(fileName: str) -> str:
+        """
+        Returns the hash of the contents of the given file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file.
+
+        RETURNS
+        -------
+        str
+            Hash of the file contents.
+        """
+        digest = hashlib.sha256()
+        input_file = open(fileName, 'rb')
+        block = input_file.read(DataSetCache.BLOCK_SIZE)
+        while len(block) > 0:
+            digest.update(block)
+            block = input_file.read(DataSetCache.BLOCK_SIZE)
+        input_file.close()
+        return digest.hexdigest()
+
+    def __baseName(self, definition: DataDefinition, separator: str, fileName: str) -> str:
+        """
+        Returns the common path prefix of the cache files of the given data file and data definition. Data files with
+        the same name in different directories have different caches, as the prefix includes a hash of the absolute
+        path of the data file.
+        """
+        source = hashlib.sha256(os.path.abspath(fileName).encode("utf8")).hexdigest()
+        return os.path.join(self.__directory, os.path.basename(fileName) + "." + source[:16] + "." +
+                            self.definitionKey(definition, separator)[:32])
+
+    @staticmethod
+    def __copyDefinition(definition: DataDefinition) -> DataDefinition:
+        """
+        Returns a copy of the given data definition, whose value lists can be filled without changing the given one.
+        """
+        return DataDefinition([definition.getAttributeType(i) for i in range(definition.attributeCount())],
+                              [list(definition.getAttributeValues(i)) for i in range(definition.attributeCount())])
+
+    def __validHeader(self, baseName: str, fileName: str):
+        """
+        Reads the header of a cache and checks it against the data file. The cache must have been written from the
+        same data file, given by its absolute path. If the size and the modification time of the data file are the ones
+        recorded in the header, the recorded hash is trusted; otherwise the data file is hashed again and compared with
+        the recorded hash.
+
+        RETURNS
+        -------
+        dict
+            The header if the cache is valid, None otherwise.
+        """
+        if not os.path.exists(baseName + ".json"):
+            return None
+        header_file = open(baseName + ".json", 'r', encoding='utf8')
+        header = json.load(header_file)
+        header_file.close()
+        if header.get("version") != self.VERSION or header.get("source") != os.path.abspath(fileName):
+            return None
+        status = os.stat(fileName)
+        if header["size"] == status.st_size and header["mtime"] == status.st_mtime_ns:
+            return header
+        if header["size"] != status.st_size or header["hash"] != self.fileHash(fileName):
+            return None
+        header["mtime"] = status.st_mtime_ns
+        self.__writeHeader(baseName, header)
+        return header
+
+    @staticmethod
+    def __writeHeader(baseName: str, header: dict):
+        temporary = baseName + ".json." + str(os.getpid())
+        header_file = open(temporary, 'w', encoding='utf8')
+        json.dump(header, header_file)
+        header_file.close()
+        os.replace(temporary, baseName + ".json")
+
+    @staticmethod
+    def __saveArray(fileName: str, array: np.ndarray):
+        temporary = fileName + "." + str(os.getpid()) + ".npy"
+        np.save(temporary, np.ascontiguousarray(array))
+        os.replace(temporary, fileName)
+
+    def write(self,
+              instanceList: ColumnarInstanceList,
+              separator: str,
+              fileName: str):
+        """
+        Writes the columns of the given instance list as the cache of the given data file. Each file is written under a
+        temporary name and renamed, and the header is written last, so a reader never sees a partially written cache.
+
+        PARAMETERS
+        ----------
+        instanceList : ColumnarInstanceList
+            Columns read from the data file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        """
+        self.__write(self.__baseName(instanceList.getDataDefinition(), separator, fileName), instanceList, fileName)
+
+    def __write(self,
+                baseName: str,
+                instanceList: ColumnarInstanceList,
+                fileName: str):
+        """
+        Writes the columns of the given instance list as the cache files with the given path prefix.
+        """
+        os.makedirs(self.__directory, exist_ok=True)
+        definition = instanceList.getDataDefinition()
+        status = os.stat(fileName)
+        codes = np.concatenate((instanceList.codeMatrix(), instanceList.getClassLabelCodes().reshape(-1, 1)), axis=1)
+        self.__saveArray(baseName + ".values.npy", instanceList.valueMatrix())
+        self.__saveArray(baseName + ".codes.npy", codes.astype(np.int32))
+        categories = []
+        for i in range(definition.attributeCount()):
+            categories.append(instanceList.getCategories(i))
+        header = {"version": self.VERSION,
+                  "source": os.path.abspath(fileName),
+                  "size": status.st_size,
+                  "mtime": status.st_mtime_ns,
+                  "hash": self.fileHash(fileName),
+                  "rows": instanceList.size(),
+                  "attributeTypes": [definition.getAttributeType(i).name for i in range(definition.attributeCount())],
+                  "categories": categories,
+                  "classLabels": instanceList.getClassLabelNames()}
+        self.__writeHeader(baseName, header)
+
+    @staticmethod
+    def writeColumns(instanceList: InstanceList,
+                     definition: DataDefinition,
+                     baseName: str):
+        """
+        Exports the given instance list in the binary columnar format of the cache: baseName.json holds the data
+        definition, the values of the discrete codes and the class labels, baseName.values.npy the continuous attribute
+        values and baseName.codes.npy the discrete attribute codes and the class label codes. An instance list which is
+        not columnar is converted to columns with the given data definition; an instance with a weight is written as
+        many times as its weight.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list to export.
+        definition : DataDefinition
+            Data definition of the instances.
+        baseName : str
+            Path prefix of the exported files.
+        """
+        if isinstance(instanceList, ColumnarInstanceList):
+            columns = instanceList
+        else:
+            columns = ColumnarInstanceList(definition)
+            columns.addAll(instanceList.getInstances())
+        values = columns.valueMatrix()
+        codes = np.concatenate((columns.codeMatrix(), columns.getClassLabelCodes().reshape(-1, 1)), axis=1)
+        if instanceList.getWeights() is not None:
+            weights = np.asarray(instanceList.getWeights(), dtype=np.intp)
+            values = np.repeat(values, weights, axis=0)
+            codes = np.repeat(codes, weights, axis=0)
+        directory = os.path.dirname(baseName)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        DataSetCache.__saveArray(baseName + ".values.npy", values)
+        DataSetCache.__saveArray(baseName + ".codes.npy", codes.astype(np.int32))
+        DataSetCache.__writeColumnHeader(columns, codes.shape[0], baseName)
+
+    @staticmethod
+    def __writeColumnHeader(columns: ColumnarInstanceList,
+                            rows: int,
+                            baseName: str):
+        """
+        Writes the header of exported columns with the data definition, the values of the codes and the class labels of
+        the given columns.
+        """
+        definition = columns.getDataDefinition()
+        header = {"version": DataSetCache.VERSION,
+                  "rows": rows,
+                  "attributeTypes": [definition.getAttributeType(i).name for i in range(definition.attributeCount())],
+                  "categories": [columns.getCategories(i) for i in range(definition.attributeCount())],
+                  "classLabels": columns.getClassLabelNames()}
+        DataSetCache.__writeHeader(baseName, header)
+
+    @staticmethod
+    def writeColumnBlocks(blocks,
+                          rows: int,
+                          baseName: str):
+        """
+        Exports consecutive blocks of rows in the format of writeColumns, without holding all rows in memory: the arrays
+        are created with their final size and memory mapped, and each block is copied to its rows. All blocks must have
+        the same data definition, values of the codes and class labels.
+
+        PARAMETERS
+        ----------
+        blocks
+            Iterable of ColumnarInstanceList blocks, having rows rows in total.
+        rows : int
+            Total number of rows of the blocks.
+        baseName : str
+            Path prefix of the exported files.
+        """
+        directory = os.path.dirname(baseName)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        values_name = baseName + ".values." + str(os.getpid()) + ".npy"
+        codes_name = baseName + ".codes." + str(os.getpid()) + ".npy"
+        values = None
+        codes = None
+        start = 0
+        last = None
+        for block in blocks:
+            if values is None:
+                values = np.lib.format.open_memmap(values_name, mode="w+", dtype=np.float64,
+                                                   shape=(rows, block.valueMatrix().shape[1]))
+                codes = np.lib.format.open_memmap(codes_name, mode="w+", dtype=np.int32,
+                                                  shape=(rows, block.codeMatrix().shape[1] + 1))
+            end = start + block.size()
+            values[start:end] = block.valueMatrix()
+            codes[start:end, :-1] = block.codeMatrix()
+            codes[start:end, -1] = block.getClassLabelCodes()
+            start = end
+            last = block
+        if last is None or start != rows:
+            raise ValueError("Blocks have " + str(start) + " rows instead of " + str(rows))
+        values.flush()
+        codes.flush()
+        del values
+        del codes
+        os.replace(values_name, baseName + ".values.npy")
+        os.replace(codes_name, baseName + ".codes.npy")
+        DataSetCache.__writeColumnHeader(last, rows, baseName)
+
+    @staticmethod
+    def readColumns(baseName: str) -> ColumnarInstanceList:
+        """
+        Opens the columns exported with writeColumns. The arrays are memory mapped read only, and the data definition
+        is the one stored in the header.
+
+        PARAMETERS
+        ----------
+        baseName : str
+            Path prefix of the exported files.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Exported columns.
+        """
+        header_file = open(baseName + ".json", 'r', encoding='utf8')
+        header = json.load(header_file)
+        header_file.close()
+        attribute_types = [AttributeType[name] for name in header["attributeTypes"]]
+        value_lists = []
+        for i in range(len(attribute_types)):
+            if attribute_types[i] is AttributeType.DISCRETE_INDEXED:
+                value_lists.append(header["categories"][i])
+            else:
+                value_lists.append([])
+        mode = 'r' if header["rows"] > 0 else None
+        values = np.load(baseName + ".values.npy", mmap_mode=mode)
+        codes = np.load(baseName + ".codes.npy", mmap_mode=mode)
+        result = ColumnarInstanceList()
+        result.initWithArrays(DataDefinition(attribute_types, value_lists), header["categories"],
+                              header["classLabels"], values, codes[:, :-1], codes[:, -1])
+        return result
+
+    def open(self,
+             definition: DataDefinition,
+             separator: str,
+             fileName: str) -> ColumnarInstanceList:
+        """
+        Opens the cache of the given data file, if there is a valid one. The arrays are memory mapped read only. The
+        given data definition is not changed; the data definition of the result is a copy of it.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Columns of the data file, None if there is no valid cache.
+        """
+        return self.__open(self.__baseName(definition, separator, fileName), self.__copyDefinition(definition),
+                           fileName)
+
+    def __open(self,
+               baseName: str,
+               definition: DataDefinition,
+               fileName: str) -> ColumnarInstanceList:
+        """
+        Opens the cache files with the given path prefix. Discrete indexed attributes without a value list in the given
+        copy of the data definition get the value list stored in the cache.
+        """
+        header = self.__validHeader(baseName, fileName)
+        if header is None:
+            return None
+        for i in range(definition.attributeCount()):
+            if definition.getAttributeType(i) is AttributeType.DISCRETE_INDEXED and definition.numberOfValues(i) == 0:
+                for value in header["categories"][i]:
+                    definition.addAttributeValue(i, value)
+        mode = 'r' if header["rows"] > 0 else None
+        values = np.load(baseName + ".values.npy", mmap_mode=mode)
+        codes = np.load(baseName + ".codes.npy", mmap_mode=mode)
+        result = ColumnarInstanceList()
+        result.initWithArrays(definition, header["categories"], header["classLabels"], values, codes[:, :-1],
+                              codes[:, -1])
+        return result
+
+    def load(self,
+             definition: DataDefinition,
+             separator: str,
+             fileName: str,
+             processes: int = 1) -> ColumnarInstanceList:
+        """
+        Returns the columns of the given data file from the cache. If there is no valid cache, the data file is parsed,
+        the cache is written, and then opened. The cache is keyed by the data definition as given, which is not changed:
+        value lists of discrete indexed attributes are filled, by parsing or from the cache, in the data definition of
+        the result, a copy of the given one. Loading again with the same data definition thus finds the same cache.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        processes : int
+            Number of processes parsing the data file when there is no valid cache.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Columns of the data file.
+        """
+        base_name = self.__baseName(definition, separator, fileName)
+        result = self.__open(base_name, self.__copyDefinition(definition), fileName)
+        if result is None:
+            self.__write(base_name, ColumnarInstanceList(self.__copyDefinition(definition), separator, fileName,
+                                                         processes), fileName)
+            result = self.__open(base_name, self.__copyDefinition(definition), fileName)
+        return result
@@ -0,0 +1,226 @@
+import numpy as np
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.CompressedFile import CompressedFile
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSetCache import DataSetCache
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+
+
+class DataSetGenerator(object):
+
+    __definition: DataDefinition
+    __class_labels: list
+    __categories: list
+    __label_noise: float
+    __seed: int
+    __precision: int
+    __means: np.ndarray
+    __probabilities: list
+
+    BLOCK_SIZE = 1 << 16
+
+    def __init__(self,
+                 definition: DataDefinition,
+                 classCount: int = 2,
+                 labelNoise: float = 0.0,
+                 seed: int = 1,
+                 valueCount: int = 4,
+                 separation: float = 1.0,
+                 precision: int = 4):
+        """
+        Constructor for a generator of synthetic data sets with the attribute types of the given data definition. The
+        classes are equally likely. Given its class, a continuous attribute is normally distributed with unit variance
+        around a mean of the class, and a discrete, discrete indexed or binary attribute takes its values with
+        probabilities of the class. The means and the probabilities are drawn once from the seed.
+
+        Rows are generated in blocks of BLOCK_SIZE rows, each with its own random generator derived from the seed and
+        the index of the block. So the data set of a seed does not depend on how it is written, and a smaller data set
+        of the same seed is the start of a larger one.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition whose attribute types are generated. Discrete and discrete indexed attributes having values
+            in the definition take those values.
+        classCount : int
+            Number of classes.
+        labelNoise : float
+            Probability that the class label of a row is replaced by a random class label.
+        seed : int
+            Seed of the random generators.
+        valueCount : int
+            Number of values of discrete and discrete indexed attributes without values in the definition.
+        separation : float
+            Standard deviation of the class means of the continuous attributes. Larger values separate the classes more.
+        precision : int
+            Number of decimal digits the continuous values are rounded to.
+        """
+        self.__class_labels = ["C" + str(i + 1) for i in range(classCount)]
+        self.__label_noise = labelNoise
+        self.__seed = seed
+        self.__precision = precision
+        attribute_types = []
+        value_lists = []
+        self.__categories = []
+        for i in range(definition.attributeCount()):
+            attribute_type = definition.getAttributeType(i)
+            attribute_types.append(attribute_type)
+            if attribute_type is AttributeType.CONTINUOUS:
+                self.__categories.append(None)
+            elif attribute_type is AttributeType.BINARY:
+                self.__categories.append(["False", "True"])
+            elif definition.numberOfValues(i) > 0:
+                self.__categories.append(list(definition.getAttributeValues(i)))
+            else:
+                self.__categories.append(["v" + str(j + 1) for j in range(valueCount)])
+            if attribute_type is AttributeType.DISCRETE_INDEXED:
+                value_lists.append(list(self.__categories[i]))
+            else:
+                value_lists.append([])
+        self.__definition = DataDefinition(attribute_types, value_lists)
+        random = np.random.default_rng(seed)
+        self.__means = random.normal(0.0, separation, (classCount, self.__definition.continuousAttributeCount()))
+        self.__probabilities = []
+        for i in range(self.__definition.attributeCount()):
+            if self.__categories[i] is None:
+                self.__probabilities.append(None)
+            else:
+                self.__probabilities.append(np.cumsum(random.dirichlet(np.ones(len(self.__categories[i])), classCount),
+                                                      axis=1))
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition of the generated data sets, having the value lists of the discrete indexed
+        attributes.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the generated data sets.
+        """
+        return self.__definition
+
+    def getClassLabels(self) -> list:
+        """
+        Accessor for the class labels of the generated data sets.
+
+        RETURNS
+        -------
+        list
+            Class labels C1, C2, ...
+        """
+        return self.__class_labels
+
+    def __generateBlock(self, index: int) -> ColumnarInstanceList:
+        """
+        Generates the block of rows with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the block.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            BLOCK_SIZE rows of the block.
+        """
+        random = np.random.default_rng([self.__seed, index])
+        size = self.BLOCK_SIZE
+        labels = random.integers(len(self.__class_labels), size=size)
+        values = np.round(random.standard_normal((size, self.__means.shape[1])) + self.__means[labels],
+                          self.__precision)
+        codes = np.zeros((size, self.__definition.attributeCount() - self.__means.shape[1]), dtype=np.int32)
+        column = 0
+        for i in range(self.__definition.attributeCount()):
+            if self.__probabilities[i] is not None:
+                cumulative = self.__probabilities[i][labels]
+                code = (random.random(size)[:, np.newaxis] >= cumulative).sum(axis=1)
+                codes[:, column] = np.minimum(code, cumulative.shape[1] - 1)
+                column = column + 1
+        noisy = random.random(size) < self.__label_noise
+        labels[noisy] = random.integers(len(self.__class_labels), size=int(noisy.sum()))
+        result = ColumnarInstanceList()
+        result.initWithArrays(self.__definition, self.__categories, self.__class_labels, values, codes,
+                              labels.astype(np.int32))
+        return result
+
+    def blocks(self, size: int):
+        """
+        Generates the first size rows of the data set block by block, so that arbitrarily large data sets can be
+        written without holding them in memory.
+
+        PARAMETERS
+        ----------
+        size : int
+            Number of rows.
+
+        RETURNS
+        -------
+        generator
+            Consecutive ColumnarInstanceList blocks of size rows in total.
+        """
+        for index in range(max(1, -(-size // self.BLOCK_SIZE))):
+            block = self.__generateBlock(index)
+            start = index * self.BLOCK_SIZE
+            if start + self.BLOCK_SIZE > size:
+                block = block.getRows(0, size - start)
+            yield block
+
+    def generate(self, size: int) -> ColumnarInstanceList:
+        """
+        Generates the first size rows of the data set in memory.
+
+        PARAMETERS
+        ----------
+        size : int
+            Number of rows.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Generated rows.
+        """
+        blocks = list(self.blocks(size))
+        result = ColumnarInstanceList()
+        result.initWithArrays(self.__definition, self.__categories, self.__class_labels,
+                              np.concatenate([block.valueMatrix() for block in blocks]),
+                              np.concatenate([block.codeMatrix() for block in blocks]),
+                              np.concatenate([block.getClassLabelCodes() for block in blocks]))
+        return result
+
+    def writeToFile(self,
+                    fileName: str,
+                    size: int):
+        """
+        Writes the first size rows of the data set as a comma separated data file, which is read with the data
+        definition of the generator. If the file name ends with .gz, .bz2 or .xz, the file is compressed.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data file.
+        size : int
+            Number of rows.
+        """
+        out_file = CompressedFile.open(fileName, "w")
+        for block in self.blocks(size):
+            out_file.write(block.formatRows(0, block.size()))
+        out_file.close()
+
+    def writeToBinaryFile(self,
+                          baseName: str,
+                          size: int):
+        """
+        Writes the first size rows of the data set in the binary columnar format of DataSet.writeToBinaryFile, which
+        is read with DataSet.initWithBinaryFile.
+
+        PARAMETERS
+        ----------
+        baseName : str
+            Path prefix of the written files.
+        size : int
+            Number of rows.
+        """
+        DataSetCache.writeColumnBlocks(self.blocks(size), size, baseName)
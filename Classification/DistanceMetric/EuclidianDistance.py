@@ -1,7 +1,9 @@
 from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 from Classification.DistanceMetric.DistanceMetric import DistanceMetric
+from Classification.Instance.BinaryInstance import BinaryInstance
 from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseInstance import SparseInstance
 import math
 
 
@@ -10,8 +12,23 @@ class EuclidianDistance(DistanceMetric):
     def distance(self,
                  instance1: Instance,
                  instance2: Instance) -> float:
+        if isinstance(instance1, SparseInstance) and isinstance(instance2, SparseInstance):
+            return self.sparseDistance(instance1, instance2)
+        if isinstance(instance1, BinaryInstance) and isinstance(instance2, BinaryInstance) and instance1.isPacked() \
+                and instance2.isPacked() and instance1.getBinaryOffset() == instance2.getBinaryOffset():
+            return self.binaryDistance(instance1, instance2)
+        return self.__attributeDistance(instance1, instance2, instance1.attributeSize())
+
+    def __attributeDistance(self,
+                            instance1: Instance,
+                            instance2: Instance,
+                            size: int) -> float:
+        """
+        Calculates the distance between the first size attributes of two instances: the number of discrete attributes
+        with different values plus the sum of the squared differences of the continuous attributes.
+        """
         result = 0
-        for i in range(instance1.attributeSize()):
+        for i in range(size):
             if isinstance(instance1.getAttribute(i), DiscreteAttribute) and \
                     isinstance(instance2.getAttribute(i), DiscreteAttribute):
                 if instance1.getAttribute(i).getValue() is not None and \
@@ -22,3 +39,63 @@ class EuclidianDistance(DistanceMetric):
                         isinstance(instance2.getAttribute(i), ContinuousAttribute):
                     result += math.pow(instance1.getAttribute(i).getValue() - instance2.getAttribute(i).getValue(), 2)
         return result
+
+    def binaryDistance(self,
+                       instance1: BinaryInstance,
+                       instance2: BinaryInstance) -> float:
+        """
+        Calculates the distance between two instances with packed binary attributes. The attributes before the binary
+        attributes are compared one by one, and the number of binary attributes with different values is found from the
+        exclusive or of the packed values.
+
+        PARAMETERS
+        ----------
+        instance1 : BinaryInstance
+            First instance.
+        instance2 : BinaryInstance
+            Second instance.
+
+        RETURNS
+        -------
+        float
+            Distance between two instances.
+        """
+        result = self.__attributeDistance(instance1, instance2, instance1.getBinaryOffset())
+        return result + instance1.hammingDistance(instance2)
+
+    def sparseDistance(self,
+                       instance1: Instance,
+                       instance2: Instance) -> float:
+        """
+        Calculates the squared Euclidian distance between two instances of continuous attributes by merging their
+        non-zero values, so that the attributes which are zero in both instances are skipped.
+
+        PARAMETERS
+        ----------
+        instance1 : Instance
+            First instance.
+        instance2 : Instance
+            Second instance.
+
+        RETURNS
+        -------
+        float
+            Squared Euclidian distance between two instances.
+        """
+        values1 = instance1.sparseContinuousAttributes()
+        values2 = instance2.sparseContinuousAttributes()
+        result = 0
+        i = 0
+        j = 0
+        while i < len(values1) or j < len(values2):
+            if j == len(values2) or (i < len(values1) and values1[i][0] < values2[j][0]):
+                result += math.pow(values1[i][1], 2)
+                i = i + 1
+            elif i == len(values1) or values2[j][0] < values1[i][0]:
+                result += math.pow(values2[j][1], 2)
+                j = j + 1
+            else:
+                result += math.pow(values1[i][1] - values2[j][1], 2)
+                i = i + 1
+                j = j + 1
+        return result
@@ -1,8 +1,7 @@
 from Classification.Experiment.MultipleRun import MultipleRun
 from Classification.Experiment.Experiment import Experiment
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
-from Sampling.Bootstrap import Bootstrap
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewBootstrap import ViewBootstrap
 
 
 class BootstrapRun(MultipleRun):
@@ -36,9 +35,9 @@ class BootstrapRun(MultipleRun):
         """
         result = ExperimentPerformance()
         for i in range(self.__numberOfBootstraps):
-            bootstrap = Bootstrap(instance_list=experiment.getDataSet().getInstances(),
-                                  seed=i + experiment.getParameter().getSeed())
-            bootstrap_sample = InstanceList(bootstrap.getSample())
+            bootstrap = ViewBootstrap(instanceList=experiment.getDataSet().getInstanceList(),
+                                      seed=i + experiment.getParameter().getSeed())
+            bootstrap_sample = bootstrap.getSample()
             experiment.getClassifier().train(trainSet=bootstrap_sample,
                                              parameters=experiment.getParameter())
             result.add(experiment.getClassifier().test(experiment.getDataSet().getInstanceList()))
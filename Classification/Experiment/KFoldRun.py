@@ -1,10 +1,9 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.MultipleRun import MultipleRun
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -30,8 +29,8 @@ class KFoldRun(MultipleRun):
                       experimentPerformance: ExperimentPerformance,
                       crossValidation: CrossValidation):
         for i in range(self.K):
-            train_set = InstanceList(crossValidation.getTrainFold(i))
-            test_set = InstanceList(crossValidation.getTestFold(i))
+            train_set = crossValidation.getTrainFold(i)
+            test_set = crossValidation.getTestFold(i)
             classifier.train(train_set, parameter)
             experimentPerformance.add(classifier.test(test_set))
 
@@ -50,9 +49,9 @@ class KFoldRun(MultipleRun):
             An ExperimentPerformance instance.
         """
         result = ExperimentPerformance()
-        crossValidation = KFoldCrossValidation(instance_list=experiment.getDataSet().getInstances(),
-                                               K=self.K,
-                                               seed=experiment.getParameter().getSeed())
+        crossValidation = ViewKFoldCrossValidation(instanceList=experiment.getDataSet().getInstanceList(),
+                                                   K=self.K,
+                                                   seed=experiment.getParameter().getSeed())
         self.runExperiment(classifier=experiment.getClassifier(),
                            parameter=experiment.getParameter(),
                            experimentPerformance=result,
@@ -1,10 +1,10 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
@@ -30,7 +30,7 @@ class KFoldRunSeparateTest(KFoldRun):
                       crossValidation: CrossValidation,
                       testSet: InstanceList):
         for i in range(self.K):
-            train_set = InstanceList(crossValidation.getTrainFold(i))
+            train_set = crossValidation.getTrainFold(i)
             classifier.train(train_set, parameter)
             experimentPerformance.add(classifier.test(testSet))
 
@@ -55,9 +55,9 @@ class KFoldRunSeparateTest(KFoldRun):
                               ratio=0.25,
                               seed=experiment.getParameter().getSeed(),
                               stratified=True)
-        cross_validation = KFoldCrossValidation(instanceList=partition.get(1).getInstances(),
-                                               K=self.K,
-                                               seed=experiment.getParameter().getSeed())
+        cross_validation = ViewKFoldCrossValidation(instanceList=partition.get(1),
+                                                    K=self.K,
+                                                    seed=experiment.getParameter().getSeed())
         self.runExperimentSeparate(classifier=experiment.getClassifier(),
                            parameter=experiment.getParameter(),
                            experimentPerformance=result,
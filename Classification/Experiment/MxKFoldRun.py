@@ -1,7 +1,6 @@
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -42,9 +41,9 @@ class MxKFoldRun(KFoldRun):
         """
         result = ExperimentPerformance()
         for j in range(self.M):
-            cross_validation = KFoldCrossValidation(instance_list=experiment.getDataSet().getInstances(),
-                                                   K=self.K,
-                                                   seed=experiment.getParameter().getSeed())
+            cross_validation = ViewKFoldCrossValidation(instanceList=experiment.getDataSet().getInstanceList(),
+                                                        K=self.K,
+                                                        seed=experiment.getParameter().getSeed())
             self.runExperiment(classifier=experiment.getClassifier(),
                                parameter=experiment.getParameter(),
                                experimentPerformance=result,
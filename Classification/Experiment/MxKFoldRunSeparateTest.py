@@ -1,7 +1,6 @@
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRunSeparateTest import KFoldRunSeparateTest
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -49,9 +48,9 @@ class MxKFoldRunSeparateTest(KFoldRunSeparateTest):
                               seed=experiment.getParameter().getSeed(),
                               stratified=True)
         for j in range(self.M):
-            cross_validation = KFoldCrossValidation(instanceList=partition.get(1).getInstances(),
-                                                   K=self.K,
-                                                   seed=experiment.getParameter().getSeed())
+            cross_validation = ViewKFoldCrossValidation(instanceList=partition.get(1),
+                                                        K=self.K,
+                                                        seed=experiment.getParameter().getSeed())
             self.runExperimentSeparate(classifier=experiment.getClassifier(),
                                parameter=experiment.getParameter(),
                                experimentPerformance=result,
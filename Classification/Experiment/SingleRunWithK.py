@@ -1,10 +1,9 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.SingleRun import SingleRun
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.Performance import Performance
 
@@ -28,8 +27,8 @@ class SingleRunWithK(SingleRun):
                       classifier: Classifier,
                       parameter: Parameter,
                       crossValidation: CrossValidation):
-        train_set = InstanceList(crossValidation.getTrainFold(0))
-        test_set = InstanceList(crossValidation.getTestFold(0))
+        train_set = crossValidation.getTrainFold(0)
+        test_set = crossValidation.getTestFold(0)
         return classifier.singleRun(parameter=parameter,
                                     trainSet=train_set,
                                     testSet=test_set)
@@ -49,9 +48,9 @@ class SingleRunWithK(SingleRun):
         Performance
             A Performance instance.
         """
-        cross_validation = KFoldCrossValidation(instanceList=experiment.getDataSet().getInstances(),
-                                               K=self.__K,
-                                               seed=experiment.getParameter().getSeed())
+        cross_validation = ViewKFoldCrossValidation(instanceList=experiment.getDataSet().getInstanceList(),
+                                                    K=self.__K,
+                                                    seed=experiment.getParameter().getSeed())
         return self.runExperiment(classifier=experiment.getClassifier(),
                                   parameter=experiment.getParameter(),
                                   crossValidation=cross_validation)
@@ -1,7 +1,6 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
+from Classification.InstanceList.ViewStratifiedKFoldCrossValidation import ViewStratifiedKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -34,9 +33,10 @@ class StratifiedKFoldRun(KFoldRun):
             An ExperimentPerformance instance.
         """
         result = ExperimentPerformance()
-        cross_validation = StratifiedKFoldCrossValidation(instance_lists=experiment.getDataSet().getClassInstances(),
-                                                         K=self.K,
-                                                         seed=experiment.getParameter().getSeed())
+        cross_validation = ViewStratifiedKFoldCrossValidation(
+            instanceList=experiment.getDataSet().getInstanceList(),
+            K=self.K,
+            seed=experiment.getParameter().getSeed())
         self.runExperiment(classifier=experiment.getClassifier(),
                            parameter=experiment.getParameter(),
                            experimentPerformance=result,
@@ -1,7 +1,6 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRunSeparateTest import KFoldRunSeparateTest
+from Classification.InstanceList.ViewStratifiedKFoldCrossValidation import ViewStratifiedKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -40,9 +39,10 @@ class StratifiedKFoldRunSeparateTest(KFoldRunSeparateTest):
                               ratio=0.25,
                               seed=experiment.getParameter().getSeed(),
                               stratified=True)
-        cross_validation = StratifiedKFoldCrossValidation(instance_lists=Partition(partition.get(1)).getLists(),
-                                                         K=self.K,
-                                                         seed=experiment.getParameter().getSeed())
+        cross_validation = ViewStratifiedKFoldCrossValidation(
+            instanceList=partition.get(1),
+            K=self.K,
+            seed=experiment.getParameter().getSeed())
         self.runExperimentSeparate(classifier=experiment.getClassifier(),
                                    parameter=experiment.getParameter(),
                                    experimentPerformance=result,
@@ -1,7 +1,6 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.MxKFoldRun import MxKFoldRun
+from Classification.InstanceList.ViewStratifiedKFoldCrossValidation import ViewStratifiedKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -40,9 +39,10 @@ class StratifiedMxKFoldRun(MxKFoldRun):
         """
         result = ExperimentPerformance()
         for j in range(self.M):
-            cross_validation = StratifiedKFoldCrossValidation(instance_lists=experiment.getDataSet().getClassInstances(),
-                                                             K=self.K,
-                                                             seed=experiment.getParameter().getSeed())
+            cross_validation = ViewStratifiedKFoldCrossValidation(
+                instanceList=experiment.getDataSet().getInstanceList(),
+                K=self.K,
+                seed=experiment.getParameter().getSeed())
             self.runExperiment(classifier=experiment.getClassifier(),
                                parameter=experiment.getParameter(),
                                experimentPerformance=result,
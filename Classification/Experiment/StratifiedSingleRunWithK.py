@@ -1,7 +1,5 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewStratifiedKFoldCrossValidation import ViewStratifiedKFoldCrossValidation
 from Classification.Performance.Performance import Performance
 
 
@@ -35,11 +33,12 @@ class StratifiedSingleRunWithK:
         Performance
             A Performance instance.
         """
-        cross_validation = StratifiedKFoldCrossValidation(instance_lists=experiment.getDataSet().getClassInstances(),
-                                                         K=self.__K,
-                                                         seed=experiment.getParameter().getSeed())
-        train_set = InstanceList(cross_validation.getTrainFold(0))
-        test_set = InstanceList(cross_validation.getTestFold(0))
+        cross_validation = ViewStratifiedKFoldCrossValidation(
+            instanceList=experiment.getDataSet().getInstanceList(),
+            K=self.__K,
+            seed=experiment.getParameter().getSeed())
+        train_set = cross_validation.getTrainFold(0)
+        test_set = cross_validation.getTestFold(0)
         return experiment.getClassifier().singleRun(parameter=experiment.getParameter(),
                                                     trainSet=train_set,
                                                     testSet=test_set)
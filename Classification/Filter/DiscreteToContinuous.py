@@ -3,21 +3,74 @@ from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.DataSet.DataSet import DataSet
 from Classification.Filter.LaryFilter import LaryFilter
 from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseInstance import SparseInstance
 
 
 class DiscreteToContinuous(LaryFilter):
 
-    def __init__(self, dataSet: DataSet):
+    __sparse: bool
+
+    def __init__(self,
+                 dataSet: DataSet,
+                 sparse: bool = False):
         """
-        Constructor for discrete to continuous filter.
+        Constructor for discrete to continuous filter. If sparse is True, each instance is replaced with a sparse
+        instance which stores only the non-zero continuous attributes, instead of adding L continuous attributes for
+        each discrete attribute.
 
         PARAMETERS
         ----------
         dataSet : DataSet
             The dataSet whose instances whose discrete attributes will be converted to continuous attributes using
             1-of-L encoding.
+        sparse : bool
+            If True, the instances are converted to sparse instances.
         """
         super().__init__(dataSet)
+        self.__sparse = sparse
+
+    def convert(self):
+        """
+        Feature converter for a list of instances. If the filter is sparse, each instance in the instance list is
+        replaced with its sparse version, otherwise each instance is converted in place.
+        """
+        if not self.__sparse:
+            super().convert()
+            return
+        instances = self.dataSet.getInstances()
+        for i in range(len(instances)):
+            instances[i] = self.convertToSparseInstance(instances[i])
+        self.dataSet.getInstanceList().detachStatistics()
+        self.convertDataDefinition()
+
+    def convertToSparseInstance(self, instance: Instance) -> SparseInstance:
+        """
+        Converts a single instance to a sparse instance with the same attributes convertInstance gives. The continuous
+        attributes come first, and each discrete attribute with L values is converted to L attributes, only one of
+        which, the one of its value, is stored.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            The instance to be converted.
+
+        RETURNS
+        -------
+        SparseInstance
+            Sparse version of the converted instance.
+        """
+        values = {}
+        size = 0
+        for i in range(instance.attributeSize()):
+            if len(self.attribute_distributions[i]) == 0:
+                values[size] = instance.getAttribute(i).getValue()
+                size = size + 1
+        for i in range(instance.attributeSize()):
+            if len(self.attribute_distributions[i]) > 0:
+                index = self.attribute_value_indexes[i][instance.getAttribute(i).__str__()]
+                values[size + index] = 1
+                size = size + len(self.attribute_distributions[i])
+        return SparseInstance(instance.getClassLabel(), size, values)
 
     def convertInstance(self, instance: Instance):
         """
@@ -33,7 +86,7 @@ class DiscreteToContinuous(LaryFilter):
         size = instance.attributeSize()
         for i in range(size):
             if len(self.attribute_distributions[i]) > 0:
-                index = self.attribute_distributions[i].getIndex(instance.getAttribute(i).__str__())
+                index = self.attribute_value_indexes[i][instance.getAttribute(i).__str__()]
                 for j in range(len(self.attribute_distributions[i])):
                     if j != index:
                         instance.addAttribute(ContinuousAttribute(0))
@@ -1,3 +1,5 @@
+from Classification.Attribute.AttributeOwner import AttributeOwner
+from Classification.Attribute.AttributeType import AttributeType
 from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
 from Classification.DataSet.DataSet import DataSet
 from Classification.Filter.LaryFilter import LaryFilter
@@ -6,9 +8,14 @@ from Classification.Instance.Instance import Instance
 
 class DiscreteToIndexed(LaryFilter):
 
+    __indexed_attributes: list
+
     def __init__(self, dataSet: DataSet):
         """
-        Constructor for discrete to indexed filter.
+        Constructor for discrete to indexed filter. Indexed attributes are immutable, so one indexed attribute is
+        created for each value of each discrete attribute and shared by all instances having that value. The shared
+        attributes have an owner of their own, so a change of their maximum index is a change of the converted instances
+        only.
 
         PARAMETERS
         ----------
@@ -16,6 +23,14 @@ class DiscreteToIndexed(LaryFilter):
             The dataSet whose instances whose discrete attributes will be converted to indexed attributes
         """
         super().__init__(dataSet)
+        self.__indexed_attributes = []
+        owner = AttributeOwner()
+        for value_index in self.attribute_value_indexes:
+            attributes = {}
+            for value in value_index:
+                attributes[value] = DiscreteIndexedAttribute(value, value_index[value], len(value_index))
+                attributes[value].setOwner(owner)
+            self.__indexed_attributes.append(attributes)
 
     def convertInstance(self, instance: Instance):
         """
@@ -29,7 +44,18 @@ class DiscreteToIndexed(LaryFilter):
         size = instance.attributeSize()
         for i in range(size):
             if len(self.attribute_distributions[i]) > 0:
-                index = self.attribute_distributions[i].getIndex(instance.getAttribute(i).__str__())
-                instance.addAttribute(DiscreteIndexedAttribute(instance.getAttribute(i).__str__(), index,
-                                                               len(self.attribute_distributions[i])))
+                instance.addAttribute(self.__indexed_attributes[i][instance.getAttribute(i).__str__()])
         self.removeDiscreteAttributesFromInstance(instance, size)
+
+    def convertDataDefinition(self):
+        """
+        Converts the data definition with discrete attributes, to data definition with discrete indexed attributes. The
+        value lists of the new attributes are the values of the attribute distributions, so the value dictionaries of
+        the data definition give the same indexes as the converted instances.
+        """
+        data_definition = self.dataSet.getDataDefinition()
+        size = data_definition.attributeCount()
+        for i in range(size):
+            if len(self.attribute_distributions[i]) > 0:
+                data_definition.addAttribute(AttributeType.DISCRETE_INDEXED, list(self.attribute_value_indexes[i]))
+        self.removeDiscreteAttributesFromDataDefinition(size)
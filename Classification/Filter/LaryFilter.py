@@ -6,10 +6,13 @@ from Classification.Instance.Instance import Instance
 class LaryFilter(FeatureFilter):
 
     attribute_distributions: list
+    attribute_value_indexes: list
 
     def __init__(self, dataSet: DataSet):
         """
-        Constructor that sets the dataSet and all the attributes distributions.
+        Constructor that sets the dataSet and all the attributes distributions. For each discrete attribute, a
+        dictionary mapping its values to their indexes in the attribute distribution is built once, so that converting
+        an attribute value is a single hash lookup.
 
         PARAMETERS
         ----------
@@ -18,6 +21,12 @@ class LaryFilter(FeatureFilter):
         """
         super().__init__(dataSet)
         self.attribute_distributions = dataSet.getInstanceList().allAttributesDistribution()
+        self.attribute_value_indexes = []
+        for distribution in self.attribute_distributions:
+            value_index = {}
+            for value in distribution:
+                value_index[value] = len(value_index)
+            self.attribute_value_indexes.append(value_index)
 
     def removeDiscreteAttributesFromInstance(self,
                                              instance: Instance,
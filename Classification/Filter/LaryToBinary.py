@@ -2,21 +2,72 @@ from Classification.Attribute.AttributeType import AttributeType
 from Classification.Attribute.BinaryAttribute import BinaryAttribute
 from Classification.DataSet.DataSet import DataSet
 from Classification.Filter.LaryFilter import LaryFilter
+from Classification.Instance.BinaryInstance import BinaryInstance
 from Classification.Instance.Instance import Instance
 
 
 class LaryToBinary(LaryFilter):
 
-    def __init__(self, dataSet: DataSet):
+    __packed: bool
+
+    def __init__(self,
+                 dataSet: DataSet,
+                 packed: bool = False):
         """
-        Constructor for L-ary discrete to binary discrete filter.
+        Constructor for L-ary discrete to binary discrete filter. If packed is True, each instance is replaced with an
+        instance whose binary attributes are packed into the bits of an integer.
 
         PARAMETERS
         ----------
         dataSet : DataSet
             The instances whose L-ary discrete attributes will be converted to binary discrete attributes.
+        packed : bool
+            If True, the instances are converted to instances with packed binary attributes.
         """
         super().__init__(dataSet)
+        self.__packed = packed
+
+    def convert(self):
+        """
+        Feature converter for a list of instances. If the filter is packed, each instance in the instance list is
+        replaced with its packed version, otherwise each instance is converted in place.
+        """
+        if not self.__packed:
+            super().convert()
+            return
+        instances = self.dataSet.getInstances()
+        for i in range(len(instances)):
+            instances[i] = self.convertToBinaryInstance(instances[i])
+        self.dataSet.getInstanceList().detachStatistics()
+        self.convertDataDefinition()
+
+    def convertToBinaryInstance(self, instance: Instance) -> BinaryInstance:
+        """
+        Converts a single instance to an instance with the same attributes convertInstance gives, whose binary
+        attributes are packed into the bits of an integer. For each discrete attribute with L values, the bit of its
+        value among the L bits of the attribute is set.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            The instance to be converted.
+
+        RETURNS
+        -------
+        BinaryInstance
+            Packed version of the converted instance.
+        """
+        attributes = []
+        size = 0
+        bits = 0
+        for i in range(instance.attributeSize()):
+            if len(self.attribute_distributions[i]) > 0:
+                index = self.attribute_value_indexes[i][instance.getAttribute(i).__str__()]
+                bits = bits | (1 << (size + index))
+                size = size + len(self.attribute_distributions[i])
+            else:
+                attributes.append(instance.getAttribute(i))
+        return BinaryInstance(instance.getClassLabel(), attributes, size, bits)
 
     def convertInstance(self, instance: Instance):
         """
@@ -33,7 +84,7 @@ class LaryToBinary(LaryFilter):
         size = instance.attributeSize()
         for i in range(size):
             if len(self.attribute_distributions[i]) > 0:
-                index = self.attribute_distributions[i].getIndex(instance.getAttribute(i).__str__())
+                index = self.attribute_value_indexes[i][instance.getAttribute(i).__str__()]
                 for j in range(len(self.attribute_distributions[i])):
                     if j != index:
                         instance.addAttribute(BinaryAttribute(False))
@@ -0,0 +1,207 @@
+from __future__ import annotations
+from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.BinaryAttribute import BinaryAttribute
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+from Math.Vector import Vector
+
+
+class BinaryInstance(Instance):
+
+    __slots__ = ('__offset', '__size', '__bits')
+
+    __offset: int
+    __size: int
+    __bits: int
+
+    __TRUE = BinaryAttribute(True)
+    __FALSE = BinaryAttribute(False)
+
+    def __init__(self,
+                 classLabel: str,
+                 attributes: list,
+                 size: int,
+                 bits: int):
+        """
+        Constructor of an instance whose attributes, after the given ones, are binary attributes packed into the bits of
+        an integer: the i'th binary attribute is True if the i'th bit of bits is set. Binary attributes can not be
+        changed in place, so the attribute accessor gives shared True and False attributes.
+
+        Adding or removing attributes copies all attributes into a list of the instance's own, after which it is an
+        ordinary instance.
+
+        PARAMETERS
+        ----------
+        classLabel : str
+            Class label of the instance.
+        attributes : list
+            Attributes of the instance which come before the binary attributes.
+        size : int
+            Number of binary attributes.
+        bits : int
+            Values of the binary attributes.
+        """
+        super().__init__(classLabel, attributes)
+        self.__offset = len(attributes)
+        self.__size = size
+        self.__bits = bits
+
+    def __materialize(self):
+        """
+        Copies all attributes into a list of the instance's own.
+        """
+        if self.__bits is not None:
+            attributes = [self.getAttribute(i) for i in range(self.attributeSize())]
+            self.__bits = None
+            self.setAttributes(attributes)
+
+    def addDiscreteAttribute(self, value: str):
+        self.__materialize()
+        super().addDiscreteAttribute(value)
+
+    def addContinuousAttribute(self, value: float):
+        self.__materialize()
+        super().addContinuousAttribute(value)
+
+    def addAttribute(self, attribute: Attribute):
+        self.__materialize()
+        super().addAttribute(attribute)
+
+    def addVectorAttribute(self, vector: Vector):
+        self.__materialize()
+        super().addVectorAttribute(vector)
+
+    def removeAttribute(self, index: int):
+        self.__materialize()
+        super().removeAttribute(index)
+
+    def removeAllAttributes(self):
+        self.__materialize()
+        super().removeAllAttributes()
+
+    def isPacked(self) -> bool:
+        """
+        Checks if the binary attributes are still packed, that is attributes are not added or removed.
+
+        RETURNS
+        -------
+        bool
+            True if the binary attributes are packed.
+        """
+        return self.__bits is not None
+
+    def getBinaryOffset(self) -> int:
+        """
+        Accessor for the index of the first binary attribute.
+
+        RETURNS
+        -------
+        int
+            Number of attributes which come before the binary attributes.
+        """
+        return self.__offset
+
+    def getBits(self) -> int:
+        """
+        Accessor for the packed values of the binary attributes.
+
+        RETURNS
+        -------
+        int
+            Integer whose i'th bit is set if the i'th binary attribute is True.
+        """
+        return self.__bits
+
+    def hammingDistance(self, instance: BinaryInstance) -> int:
+        """
+        Returns the number of binary attributes whose values differ in this and the given instance, which is the number
+        of set bits in the exclusive or of their packed values.
+
+        PARAMETERS
+        ----------
+        instance : BinaryInstance
+            Instance to compare with.
+
+        RETURNS
+        -------
+        int
+            Number of binary attributes with different values.
+        """
+        difference = self.__bits ^ instance.__bits
+        if hasattr(difference, "bit_count"):
+            return difference.bit_count()
+        return bin(difference).count("1")
+
+    def getAttribute(self, index: int) -> Attribute:
+        """
+        Accessor for a single attribute.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute to be accessed.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute with index 'index'.
+        """
+        if self.__bits is None:
+            return super().getAttribute(index)
+        if index < 0:
+            index = index + self.__offset + self.__size
+        if index < self.__offset:
+            return super().getAttribute(index)
+        if index >= self.__offset + self.__size:
+            raise IndexError("list index out of range")
+        if (self.__bits >> (index - self.__offset)) & 1:
+            return BinaryInstance.__TRUE
+        return BinaryInstance.__FALSE
+
+    def attributeSize(self) -> int:
+        """
+        Returns the number of attributes in the attributes list.
+
+        RETURNS
+        -------
+        int
+            Number of attributes in the attributes list.
+        """
+        if self.__bits is None:
+            return super().attributeSize()
+        return self.__offset + self.__size
+
+    def __str__(self) -> str:
+        """
+        Converts instance to a String.
+
+        RETURNS
+        -------
+        str
+            A string of attributes separated with comma character.
+        """
+        if self.__bits is None:
+            return super().__str__()
+        items = [self.getAttribute(i).__str__() for i in range(self.attributeSize())]
+        items.append(self.getClassLabel())
+        return ",".join(items)
+
+    def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> Instance:
+        """
+        The getSubSetOfFeatures method takes a FeatureSubSet as an input. First it creates a result Instance
+        with the class label, and adds the attributes of the given featureSubSet to it.
+
+        PARAMETERS
+        ----------
+        featureSubSet : FeatureSubSet
+            FeatureSubSet an list of indices.
+
+        RETURNS
+        -------
+        Instance
+            result Instance.
+        """
+        if self.__bits is None:
+            return super().getSubSetOfFeatures(featureSubSet)
+        return Instance(self.getClassLabel(), [self.getAttribute(featureSubSet.get(i))
+                                               for i in range(featureSubSet.size())])
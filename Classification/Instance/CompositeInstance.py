@@ -3,6 +3,8 @@ from Classification.Instance.Instance import Instance
 
 class CompositeInstance(Instance):
 
+    __slots__ = ('__possible_class_labels',)
+
     __possible_class_labels: list
 
     def __init__(self,
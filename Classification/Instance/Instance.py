@@ -1,7 +1,9 @@
 from __future__ import annotations
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
 from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.AttributeOwner import AttributeOwner
 from Math.Vector import Vector
 
 from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
@@ -9,14 +11,26 @@ from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
 
 class Instance(object):
 
+    __slots__ = ('__class_label', '__attributes', '__continuous_values', '__continuous_modification_count',
+                 '__owner', '__sources')
+
     __class_label: str
     __attributes: list
+    __continuous_values: list
+    __continuous_modification_count: int
+    __owner: AttributeOwner
+    __sources: tuple
 
     def __init__(self,
                  classLabel: str,
                  attributes=None):
         """
-        Constructor for a single instance. Given the attributes and class label, it generates a new instance.
+        Constructor for a single instance. Given the attributes and class label, it generates a new instance. The
+        continuous values of the attributes are computed once and cached, and the cache is used as long as the
+        modification count of the instance does not change. The count is kept by the attribute owner of the instance,
+        which is created when the count is first asked for; from then on the attributes of the instance tell the owner
+        when they are changed in place, and adding or removing attributes is counted as well. Changes of other
+        instances never change the count.
 
         PARAMETERS
         ----------
@@ -29,6 +43,10 @@ class Instance(object):
             attributes = []
         self.__class_label = classLabel
         self.__attributes = attributes
+        self.__continuous_values = None
+        self.__continuous_modification_count = 0
+        self.__owner = None
+        self.__sources = ()
 
     def __lt__(self, other):
         return self.__class_label < other.classLabel
@@ -49,6 +67,7 @@ class Instance(object):
             Value of the discrete attribute.
         """
         self.__attributes.append(DiscreteAttribute(value))
+        self.__attributesChanged(None)
 
     def addContinuousAttribute(self, value: float):
         """
@@ -59,7 +78,10 @@ class Instance(object):
         value : float
             Value of the continuous attribute.
         """
-        self.__attributes.append(ContinuousAttribute(value))
+        attribute = ContinuousAttribute(value)
+        self.__attributes.append(attribute)
+        self.watchAttribute(attribute)
+        self.__attributesChanged(attribute)
 
     def addAttribute(self, attribute: Attribute):
         """
@@ -71,6 +93,8 @@ class Instance(object):
             Attribute to be added.
         """
         self.__attributes.append(attribute)
+        self.watchAttribute(attribute)
+        self.__attributesChanged(attribute)
 
     def addVectorAttribute(self, vector: Vector):
         """
@@ -82,7 +106,10 @@ class Instance(object):
             Vector that has the continuous attributes.
         """
         for i in range(vector.size()):
-            self.__attributes.append(ContinuousAttribute(vector.getValue(i)))
+            attribute = ContinuousAttribute(vector.getValue(i))
+            self.__attributes.append(attribute)
+            self.watchAttribute(attribute)
+            self.__attributesChanged(attribute)
 
     def removeAttribute(self, index: int):
         """
@@ -93,13 +120,115 @@ class Instance(object):
         index : int
             Index of the attribute to be removed.
         """
-        self.__attributes.pop(index)
+        self.__attributesChanged(self.__attributes.pop(index))
 
     def removeAllAttributes(self):
         """
         Removes all the attributes from the attributes list.
         """
         self.__attributes.clear()
+        self.__attributesChanged(None)
+
+    def setAttributes(self, attributes: list):
+        """
+        Replaces the attributes of the instance with the given list of attributes, which becomes the instance's own.
+        Instances which keep their attributes in another form use it to turn into ordinary instances.
+
+        PARAMETERS
+        ----------
+        attributes : list
+            New attributes of the instance.
+        """
+        self.__attributes = attributes
+        if self.__owner is not None:
+            for attribute in attributes:
+                self.watchAttribute(attribute)
+        self.__attributesChanged(None)
+
+    def __attributesChanged(self, attribute: Attribute):
+        """
+        Records that the given attribute is added or removed, or that the attributes are replaced, and drops the cached
+        continuous values.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute added or removed, None if the attributes are replaced or removed.
+        """
+        self.__continuous_values = None
+        if self.__owner is not None:
+            self.__owner.attributeModified(attribute)
+
+    def watchAttribute(self, attribute: Attribute):
+        """
+        Makes the changes of the given attribute of the instance count as changes of the instance. An attribute without
+        an owner is given the owner of the instance. An attribute owned elsewhere, for example one shared with another
+        instance, keeps its owner, and the modification count of that owner is added to the count of the instance.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute of the instance.
+        """
+        if self.__owner is None or attribute is None:
+            return
+        owner = attribute.getOwner()
+        if owner is None:
+            attribute.setOwner(self.__owner)
+        elif owner is not self.__owner:
+            for source in self.__sources:
+                if source is owner:
+                    return
+            self.__sources = self.__sources + (owner,)
+            for listener in self.__owner.getListeners():
+                owner.addListener(listener)
+
+    def getAttributeOwner(self) -> AttributeOwner:
+        """
+        Returns the owner of the attributes of the instance, creating it on first use. When the owner is created, the
+        attributes of the instance start telling it about their changes.
+
+        RETURNS
+        -------
+        AttributeOwner
+            Owner of the attributes of the instance.
+        """
+        if self.__owner is None:
+            self.__owner = AttributeOwner()
+            for attribute in self.__attributes:
+                self.watchAttribute(attribute)
+        return self.__owner
+
+    def addModificationListener(self, listener: AttributeOwner):
+        """
+        Makes the given owner, for example the one counting the changes of an instance list holding the instance,
+        record every change of the instance from now on: it listens to the owner of the instance and to the owners of
+        its attributes owned elsewhere, including the ones the instance is given later.
+
+        PARAMETERS
+        ----------
+        listener : AttributeOwner
+            Owner which records the changes of the instance.
+        """
+        self.getAttributeOwner().addListener(listener)
+        for source in self.__sources:
+            source.addListener(listener)
+
+    def getModificationCount(self) -> int:
+        """
+        Returns the number of changes of the instance: attributes added or removed, and attributes changed in place,
+        since the count is first asked for. The count only grows, so a cache built from the instance is current as
+        long as the count is the one it was built with.
+
+        RETURNS
+        -------
+        int
+            Modification count of the instance.
+        """
+        count = self.getAttributeOwner().getModificationCount()
+        for source in self.__sources:
+            count = count + source.getModificationCount()
+        return count
 
     def getAttribute(self, index: int) -> Attribute:
         """
@@ -137,10 +266,29 @@ class Instance(object):
         int
             Number of continuous and discrete indexed attributes in the attributes list.
         """
-        size = 0
-        for attribute in self.__attributes:
-            size += attribute.continuousAttributeSize()
-        return size
+        return len(self.__continuousValues())
+
+    def __continuousValues(self) -> list:
+        """
+        Returns the cached continuous values of the attributes, building them if the modification count of the instance
+        changed since they are last built. The returned list must not be modified.
+
+        RETURNS
+        -------
+        list
+            Continuous values of the continuous and discrete indexed attributes.
+        """
+        owner = self.__owner if self.__owner is not None else self.getAttributeOwner()
+        count = owner.getModificationCount()
+        for source in self.__sources:
+            count = count + source.getModificationCount()
+        if self.__continuous_values is None or self.__continuous_modification_count != count:
+            values = []
+            for attribute in self.__attributes:
+                values.extend(attribute.continuousAttributes())
+            self.__continuous_values = values
+            self.__continuous_modification_count = count
+        return self.__continuous_values
 
     def continuousAttributes(self) -> list:
         """
@@ -152,9 +300,29 @@ class Instance(object):
         list
             result list that has continuous and discrete indexed attributes.
         """
+        return self.__continuousValues().copy()
+
+    def sparseContinuousAttributes(self) -> list:
+        """
+        Returns the non-zero continuous values of the attributes with their indexes in the continuousAttributes list.
+        A discrete indexed attribute gives a single entry for its index, without building its list of zeros.
+
+        RETURNS
+        -------
+        list
+            List of (index, value) pairs of the non-zero continuous values, in increasing order of index.
+        """
         result = []
-        for attribute in self.__attributes:
-            result.extend(attribute.continuousAttributes())
+        offset = 0
+        for i in range(self.attributeSize()):
+            attribute = self.getAttribute(i)
+            if isinstance(attribute, DiscreteIndexedAttribute):
+                if 0 <= attribute.getIndex() < attribute.getMaxIndex():
+                    result.append((offset + attribute.getIndex(), 1.0))
+            elif isinstance(attribute, ContinuousAttribute):
+                if attribute.getValue() != 0:
+                    result.append((offset, attribute.getValue()))
+            offset = offset + attribute.continuousAttributeSize()
         return result
 
     def getClassLabel(self) -> str:
@@ -177,11 +345,9 @@ class Instance(object):
         str
             A string of attributes separated with comma character.
         """
-        result = ""
-        for attribute in self.__attributes:
-            result = result + attribute.__str__() + ","
-        result = result + self.__class_label
-        return result
+        items = [attribute.__str__() for attribute in self.__attributes]
+        items.append(self.__class_label)
+        return ",".join(items)
 
     def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> Instance:
         """
@@ -212,7 +378,4 @@ class Instance(object):
         Vector
             Vector of continuous attributes and discrete indexed attributes.
         """
-        values = []
-        for attribute in self.__attributes:
-            values.extend(attribute.continuousAttributes())
-        return Vector(values)
+        return Vector(self.__continuousValues())
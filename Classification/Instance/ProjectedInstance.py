@@ -0,0 +1,229 @@
+from __future__ import annotations
+from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.AttributeOwner import AttributeOwner
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+from Math.Vector import Vector
+
+
+class ProjectedInstance(Instance):
+
+    __slots__ = ('__instance', '__indexes', '__continuous_values', '__continuous_modification_count')
+
+    __instance: Instance
+    __indexes: tuple
+    __continuous_values: list
+    __continuous_modification_count: int
+
+    def __init__(self,
+                 instance: Instance,
+                 indexes: tuple):
+        """
+        Constructor of a projection of an instance onto a subset of its attributes. The i'th attribute of the
+        projection is the indexes[i]'th attribute of the given instance; neither the attributes nor the list of
+        attributes are copied. A projection of a projection refers directly to the original instance.
+
+        Adding or removing attributes copies the projected attributes into a list of the projection's own, after which
+        it is an ordinary instance.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to project.
+        indexes : tuple
+            Indexes of the projected attributes in the given instance.
+        """
+        if isinstance(instance, ProjectedInstance) and instance.__instance is not None:
+            indexes = tuple(instance.__indexes[index] for index in indexes)
+            instance = instance.__instance
+        super().__init__(instance.getClassLabel(), ())
+        self.__instance = instance
+        self.__indexes = indexes
+        self.__continuous_values = None
+        self.__continuous_modification_count = 0
+
+    def __materialize(self):
+        """
+        Copies the projected attributes into a list of the instance's own.
+        """
+        if self.__instance is not None:
+            attributes = [self.__instance.getAttribute(index) for index in self.__indexes]
+            self.__instance = None
+            self.__continuous_values = None
+            self.setAttributes(attributes)
+
+    def addDiscreteAttribute(self, value: str):
+        self.__materialize()
+        super().addDiscreteAttribute(value)
+
+    def addContinuousAttribute(self, value: float):
+        self.__materialize()
+        super().addContinuousAttribute(value)
+
+    def addAttribute(self, attribute: Attribute):
+        self.__materialize()
+        super().addAttribute(attribute)
+
+    def addVectorAttribute(self, vector: Vector):
+        self.__materialize()
+        super().addVectorAttribute(vector)
+
+    def removeAttribute(self, index: int):
+        self.__materialize()
+        super().removeAttribute(index)
+
+    def removeAllAttributes(self):
+        self.__materialize()
+        super().removeAllAttributes()
+
+    def getAttribute(self, index: int) -> Attribute:
+        """
+        Accessor for a single attribute.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute to be accessed.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute with index 'index'.
+        """
+        if self.__instance is None:
+            return super().getAttribute(index)
+        return self.__instance.getAttribute(self.__indexes[index])
+
+    def attributeSize(self) -> int:
+        """
+        Returns the number of attributes in the attributes list.
+
+        RETURNS
+        -------
+        int
+            Number of attributes in the attributes list.
+        """
+        if self.__instance is None:
+            return super().attributeSize()
+        return len(self.__indexes)
+
+    def getModificationCount(self) -> int:
+        """
+        Returns the number of changes of the instance. The attributes of a projection are the attributes of the
+        original instance, so its changes are counted by the original instance.
+
+        RETURNS
+        -------
+        int
+            Modification count of the instance.
+        """
+        if self.__instance is None:
+            return super().getModificationCount()
+        return self.__instance.getModificationCount()
+
+    def addModificationListener(self, listener: AttributeOwner):
+        """
+        Makes the given owner record every change of the instance from now on. The changes of the attributes of a
+        projection are changes of the original instance, so the owner listens to the original instance as well.
+
+        PARAMETERS
+        ----------
+        listener : AttributeOwner
+            Owner which records the changes of the instance.
+        """
+        super().addModificationListener(listener)
+        if self.__instance is not None:
+            self.__instance.addModificationListener(listener)
+
+    def __continuousValues(self) -> list:
+        """
+        Returns the continuous values of the projected attributes, cached in the same way Instance caches the
+        continuous values of its attributes. The returned list must not be modified.
+
+        RETURNS
+        -------
+        list
+            Continuous values of the continuous and discrete indexed attributes.
+        """
+        count = self.__instance.getModificationCount()
+        if self.__continuous_values is None or self.__continuous_modification_count != count:
+            values = []
+            for index in self.__indexes:
+                values.extend(self.__instance.getAttribute(index).continuousAttributes())
+            self.__continuous_values = values
+            self.__continuous_modification_count = count
+        return self.__continuous_values
+
+    def continuousAttributeSize(self) -> int:
+        """
+        Returns the number of continuous and discrete indexed attributes in the attributes list.
+
+        RETURNS
+        -------
+        int
+            Number of continuous and discrete indexed attributes in the attributes list.
+        """
+        if self.__instance is None:
+            return super().continuousAttributeSize()
+        return len(self.__continuousValues())
+
+    def continuousAttributes(self) -> list:
+        """
+        The continuousAttributes method creates a new list result and it adds the continuous attributes of the
+        attributes list and also it adds 1 for the discrete indexed attributes.
+
+        RETURNS
+        -------
+        list
+            result list that has continuous and discrete indexed attributes.
+        """
+        if self.__instance is None:
+            return super().continuousAttributes()
+        return self.__continuousValues().copy()
+
+    def __str__(self) -> str:
+        """
+        Converts instance to a String.
+
+        RETURNS
+        -------
+        str
+            A string of attributes separated with comma character.
+        """
+        if self.__instance is None:
+            return super().__str__()
+        items = [self.__instance.getAttribute(index).__str__() for index in self.__indexes]
+        items.append(self.getClassLabel())
+        return ",".join(items)
+
+    def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> Instance:
+        """
+        The getSubSetOfFeatures method takes a FeatureSubSet as an input and returns the projection of the original
+        instance onto the given features of this projection.
+
+        PARAMETERS
+        ----------
+        featureSubSet : FeatureSubSet
+            FeatureSubSet an list of indices.
+
+        RETURNS
+        -------
+        Instance
+            result Instance.
+        """
+        if self.__instance is None:
+            return super().getSubSetOfFeatures(featureSubSet)
+        return ProjectedInstance(self, tuple(featureSubSet.get(i) for i in range(featureSubSet.size())))
+
+    def toVector(self) -> Vector:
+        """
+        The toVector method returns a Vector of continuous attributes and discrete indexed attributes.
+
+        RETURNS
+        -------
+        Vector
+            Vector of continuous attributes and discrete indexed attributes.
+        """
+        if self.__instance is None:
+            return super().toVector()
+        return Vector(self.__continuousValues())
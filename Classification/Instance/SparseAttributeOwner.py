@@ -0,0 +1,54 @@
+from Classification.Attribute.AttributeOwner import AttributeOwner
+
+
+class SparseAttributeOwner(AttributeOwner):
+
+    __slots__ = ('__attributes', '__index', '__owner')
+
+    __attributes: dict
+    __index: int
+    __owner: AttributeOwner
+
+    def __init__(self,
+                 attributes: dict,
+                 index: int,
+                 owner: AttributeOwner):
+        """
+        Constructor for the owner of a zero attribute of a sparse instance which is not stored. The attribute is stored
+        in the attributes of the instance only when it is changed, so reading the zero attributes of a sparse instance
+        does not make it dense.
+
+        PARAMETERS
+        ----------
+        attributes : dict
+            Stored attributes of the sparse instance, by their indexes.
+        index : int
+            Index of the zero attribute.
+        owner : AttributeOwner
+            Owner of the attributes of the sparse instance.
+        """
+        super().__init__()
+        self.__attributes = attributes
+        self.__index = index
+        self.__owner = owner
+
+    def __getstate__(self):
+        return super().__getstate__(), self.__attributes, self.__index, self.__owner
+
+    def __setstate__(self, state):
+        super().__setstate__(state[0])
+        self.__attributes, self.__index, self.__owner = state[1:]
+
+    def attributeModified(self, attribute):
+        """
+        Stores the changed attribute in the attributes of the sparse instance, and records the change for the instance.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute which is changed.
+        """
+        super().attributeModified(attribute)
+        if self.__attributes.get(self.__index) is not attribute:
+            self.__attributes[self.__index] = attribute
+        self.__owner.attributeModified(attribute)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseAttributeOwner import SparseAttributeOwner
+from Math.Vector import Vector
+
+
+class SparseInstance(Instance):
+
+    __slots__ = ('__size', '__attributes', '__sparse_values', '__sparse_modification_count')
+
+    __size: int
+    __attributes: dict
+    __sparse_values: list
+    __sparse_modification_count: int
+
+    def __init__(self,
+                 classLabel: str,
+                 size: int,
+                 values: dict = None):
+        """
+        Constructor of an instance of continuous attributes, most of which are zero. Only the non-zero attributes are
+        stored; reading an attribute with a zero value gives a new zero attribute, which is stored only when it is
+        changed in place, so reading the attributes does not make the instance dense.
+
+        Adding or removing attributes copies all attributes into a list of the instance's own, after which it is an
+        ordinary instance.
+
+        PARAMETERS
+        ----------
+        classLabel : str
+            Class label of the instance.
+        size : int
+            Number of attributes of the instance.
+        values : dict
+            Dictionary mapping the indexes of the non-zero attributes to their values.
+        """
+        super().__init__(classLabel, ())
+        self.__size = size
+        self.__attributes = {}
+        owner = self.getAttributeOwner()
+        if values is not None:
+            for index in sorted(values):
+                if values[index] != 0:
+                    attribute = ContinuousAttribute(values[index])
+                    attribute.setOwner(owner)
+                    self.__attributes[index] = attribute
+        self.__sparse_values = None
+        self.__sparse_modification_count = 0
+
+    def __materialize(self):
+        """
+        Copies all attributes into a list of the instance's own, a new zero attribute for each attribute not stored.
+        """
+        if self.__attributes is not None:
+            attributes = []
+            for i in range(self.__size):
+                attribute = self.__attributes.get(i)
+                attributes.append(ContinuousAttribute(0.0) if attribute is None else attribute)
+            self.__attributes = None
+            self.__sparse_values = None
+            self.setAttributes(attributes)
+
+    def addDiscreteAttribute(self, value: str):
+        self.__materialize()
+        super().addDiscreteAttribute(value)
+
+    def addContinuousAttribute(self, value: float):
+        self.__materialize()
+        super().addContinuousAttribute(value)
+
+    def addAttribute(self, attribute: Attribute):
+        self.__materialize()
+        super().addAttribute(attribute)
+
+    def addVectorAttribute(self, vector: Vector):
+        self.__materialize()
+        super().addVectorAttribute(vector)
+
+    def removeAttribute(self, index: int):
+        self.__materialize()
+        super().removeAttribute(index)
+
+    def removeAllAttributes(self):
+        self.__materialize()
+        super().removeAllAttributes()
+
+    def getAttribute(self, index: int) -> Attribute:
+        """
+        Accessor for a single attribute. An attribute which is not stored is read as a new zero attribute, which is
+        stored when it is changed.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute to be accessed.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute with index 'index'.
+        """
+        if self.__attributes is None:
+            return super().getAttribute(index)
+        if index < 0:
+            index = index + self.__size
+        attribute = self.__attributes.get(index)
+        if attribute is None:
+            if index < 0 or index >= self.__size:
+                raise IndexError("list index out of range")
+            attribute = ContinuousAttribute(0.0)
+            attribute.setOwner(SparseAttributeOwner(self.__attributes, index, self.getAttributeOwner()))
+        return attribute
+
+    def attributeSize(self) -> int:
+        """
+        Returns the number of attributes in the attributes list.
+
+        RETURNS
+        -------
+        int
+            Number of attributes in the attributes list.
+        """
+        if self.__attributes is None:
+            return super().attributeSize()
+        return self.__size
+
+    def continuousAttributeSize(self) -> int:
+        """
+        Returns the number of continuous and discrete indexed attributes in the attributes list.
+
+        RETURNS
+        -------
+        int
+            Number of continuous and discrete indexed attributes in the attributes list.
+        """
+        if self.__attributes is None:
+            return super().continuousAttributeSize()
+        return self.__size
+
+    def sparseContinuousAttributes(self) -> list:
+        """
+        Returns the non-zero continuous values of the attributes with their indexes. The values are cached in the same
+        way Instance caches the continuous values of its attributes. The returned list must not be modified.
+
+        RETURNS
+        -------
+        list
+            List of (index, value) pairs of the non-zero continuous values, in increasing order of index.
+        """
+        if self.__attributes is None:
+            return super().sparseContinuousAttributes()
+        count = self.getModificationCount()
+        if self.__sparse_values is None or self.__sparse_modification_count != count:
+            values = []
+            for index in sorted(self.__attributes):
+                value = self.__attributes[index].getValue()
+                if value != 0:
+                    values.append((index, value))
+            self.__sparse_values = values
+            self.__sparse_modification_count = count
+        return self.__sparse_values
+
+    def continuousAttributes(self) -> list:
+        """
+        The continuousAttributes method creates a new list result and it adds the continuous attributes of the
+        attributes list, zero for the attributes which are not stored.
+
+        RETURNS
+        -------
+        list
+            result list that has continuous attributes.
+        """
+        if self.__attributes is None:
+            return super().continuousAttributes()
+        result = [0.0] * self.__size
+        for index, value in self.sparseContinuousAttributes():
+            result[index] = value
+        return result
+
+    def __str__(self) -> str:
+        """
+        Converts instance to a String.
+
+        RETURNS
+        -------
+        str
+            A string of attributes separated with comma character.
+        """
+        if self.__attributes is None:
+            return super().__str__()
+        items = [(0.0).__str__()] * self.__size
+        for index, attribute in self.__attributes.items():
+            items[index] = attribute.__str__()
+        items.append(self.getClassLabel())
+        return ",".join(items)
+
+    def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> Instance:
+        """
+        The getSubSetOfFeatures method takes a FeatureSubSet as an input and returns a sparse instance with the given
+        features of this instance.
+
+        PARAMETERS
+        ----------
+        featureSubSet : FeatureSubSet
+            FeatureSubSet an list of indices.
+
+        RETURNS
+        -------
+        Instance
+            result Instance.
+        """
+        if self.__attributes is None:
+            return super().getSubSetOfFeatures(featureSubSet)
+        result = SparseInstance(self.getClassLabel(), featureSubSet.size())
+        for i in range(featureSubSet.size()):
+            attribute = self.__attributes.get(featureSubSet.get(i))
+            if attribute is not None:
+                result.__attributes[i] = attribute
+                result.watchAttribute(attribute)
+        return result
+
+    def toVector(self) -> Vector:
+        """
+        The toVector method returns a Vector of continuous attributes.
+
+        RETURNS
+        -------
+        Vector
+            Vector of continuous attributes.
+        """
+        if self.__attributes is None:
+            return super().toVector()
+        return Vector(self.continuousAttributes())
@@ -0,0 +1,1336 @@
+from __future__ import annotations
+import random
+
+import numpy as np
+from Math.DiscreteDistribution import DiscreteDistribution
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+from Sampling.Bootstrap import Bootstrap
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.BinaryAttribute import BinaryAttribute
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataFileReader import DataFileReader
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.ColumnarRowOwner import ColumnarRowOwner
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.VersionedList import VersionedList
+from Classification.InstanceList.Moments import Moments
+
+
+class ColumnarInstanceList(InstanceList):
+
+    __definition: DataDefinition
+    __column_types: list
+    __column_index: list
+    __categories: list
+    __category_codes: list
+    __max_index: list
+    __values: np.ndarray
+    __codes: np.ndarray
+    __labels: np.ndarray
+    __class_labels: list
+    __class_label_codes: dict
+    __continuous_matrix: np.ndarray
+    __row_owners: list
+    __changed_rows: set
+    __list_version: int
+    __owns_columns: bool
+
+    def __init__(self,
+                 listOrDefinition=None,
+                 separator: str = None,
+                 fileName: str = None,
+                 processes: int = 1):
+        """
+        Constructor for a columnar instance list. Instead of a list of Instance objects, the data is kept as columns: a
+        dense float matrix for the continuous attributes, an integer code matrix for the discrete, binary and discrete
+        indexed attributes, and an integer array of class label codes. Instance objects are only built on demand by
+        get and getInstances, so the statistics methods never touch them.
+
+        Instances handed out can be changed in place, by a filter for example, and the list returned by getInstances can
+        be changed. The columns are kept equal to the instances: each instance built or added is listened to by the
+        owner of its row, which records the row as changed, and the list of instances counts its own changes. Before
+        the columns are read, the changed rows are converted again from their instances; if the list itself is
+        changed, or a changed instance no longer has the attribute types of the columns, all rows are converted again.
+        Telling whether the columns are current takes constant time.
+
+        The constructor accepts the same arguments as InstanceList. With a data definition, a separator and a file name
+        the data file is read; with a list of instances (or an InstanceList) the instances are converted to columns
+        using a data definition inferred from the first instance.
+
+        PARAMETERS
+        ----------
+        listOrDefinition
+            Data definition of the data set, or a list of instances.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        processes : int
+            Number of processes parsing the data file in parallel.
+        """
+        super().__init__()
+        if isinstance(listOrDefinition, DataDefinition):
+            self.__initColumns(listOrDefinition)
+            if fileName is not None:
+                self.__readFile(separator, fileName, processes)
+        else:
+            if isinstance(listOrDefinition, InstanceList):
+                listOrDefinition = listOrDefinition.getInstances()
+            self.__initColumns(DataDefinition())
+            if listOrDefinition is not None:
+                self.addAll(listOrDefinition)
+
+    def __initColumns(self, definition: DataDefinition):
+        """
+        Creates empty columns for the given data definition. Continuous attributes are mapped to the columns of the
+        value matrix, all other attributes to the columns of the code matrix.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the columns.
+        """
+        self.__definition = definition
+        self.__column_types = [definition.getAttributeType(i) for i in range(definition.attributeCount())]
+        self.__column_index = []
+        self.__categories = []
+        self.__category_codes = []
+        self.__max_index = []
+        value_count = 0
+        code_count = 0
+        for i in range(definition.attributeCount()):
+            attribute_type = definition.getAttributeType(i)
+            if attribute_type is AttributeType.CONTINUOUS:
+                self.__column_index.append(value_count)
+                value_count = value_count + 1
+                self.__categories.append(None)
+                self.__category_codes.append(None)
+                self.__max_index.append(1)
+            else:
+                self.__column_index.append(code_count)
+                code_count = code_count + 1
+                if attribute_type is AttributeType.DISCRETE_INDEXED:
+                    self.__categories.append(list(definition.getAttributeValues(i)))
+                    self.__category_codes.append(None)
+                    self.__max_index.append(definition.numberOfValues(i))
+                else:
+                    if attribute_type is AttributeType.BINARY:
+                        self.__categories.append(["False", "True"])
+                        self.__category_codes.append({"False": 0, "True": 1})
+                    else:
+                        self.__categories.append([])
+                        self.__category_codes.append({})
+                    self.__max_index.append(0)
+        self.__values = np.zeros((0, value_count), dtype=np.float64)
+        self.__codes = np.zeros((0, code_count), dtype=np.int32)
+        self.__labels = np.zeros(0, dtype=np.int32)
+        self.__class_labels = []
+        self.__class_label_codes = {}
+        self.__continuous_matrix = None
+        self.list = VersionedList()
+        self.__row_owners = []
+        self.__changed_rows = set()
+        self.__list_version = self.list.getVersion()
+        self.__owns_columns = True
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        for index in range(len(self.__row_owners)):
+            if self.__row_owners[index] is not None:
+                self.list[index].addModificationListener(self.__row_owners[index])
+
+    def initWithArrays(self,
+                       definition: DataDefinition,
+                       categories: list,
+                       classLabels: list,
+                       values: np.ndarray,
+                       codes: np.ndarray,
+                       labels: np.ndarray):
+        """
+        Constructor for a columnar instance list from already built columns. The arrays are used as they are, so they
+        can be memory mapped; they are never modified in place.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the columns.
+        categories : list
+            Values of the codes of each attribute, None for continuous attributes.
+        classLabels : list
+            Class labels of the class label codes.
+        values : np.ndarray
+            Matrix of the continuous attribute values.
+        codes : np.ndarray
+            Matrix of the discrete attribute codes.
+        labels : np.ndarray
+            Class label codes of the rows.
+        """
+        self.__initColumns(definition)
+        for i in range(len(categories)):
+            if categories[i] is not None:
+                self.__categories[i] = list(categories[i])
+                if self.__category_codes[i] is not None:
+                    self.__category_codes[i] = {value: code for code, value in enumerate(self.__categories[i])}
+        for classLabel in classLabels:
+            self.__classLabelCode(classLabel)
+        self.__values = values
+        self.__codes = codes
+        self.__labels = labels
+        self.list = VersionedList([None] * labels.shape[0])
+        self.__row_owners = [None] * labels.shape[0]
+        self.__list_version = self.list.getVersion()
+        self.__owns_columns = False
+
+    def __definitionOf(self, instance: Instance) -> DataDefinition:
+        """
+        Infers the data definition from the attribute types of the given instance.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance whose attribute types will be used.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the instance.
+        """
+        attribute_types = []
+        value_list = []
+        for i in range(instance.attributeSize()):
+            attribute = instance.getAttribute(i)
+            attribute_types.append(self.__attributeType(attribute))
+            if attribute_types[i] is AttributeType.DISCRETE_INDEXED:
+                value_list.append([""] * attribute.getMaxIndex())
+            else:
+                value_list.append([])
+        return DataDefinition(attribute_types, value_list)
+
+    @staticmethod
+    def __attributeType(attribute) -> AttributeType:
+        """
+        Returns the type of the given attribute.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute whose type is found.
+
+        RETURNS
+        -------
+        AttributeType
+            Type of the attribute.
+        """
+        if isinstance(attribute, BinaryAttribute):
+            return AttributeType.BINARY
+        elif isinstance(attribute, DiscreteIndexedAttribute):
+            return AttributeType.DISCRETE_INDEXED
+        elif isinstance(attribute, DiscreteAttribute):
+            return AttributeType.DISCRETE
+        return AttributeType.CONTINUOUS
+
+    def __fits(self, instance: Instance) -> bool:
+        """
+        Checks if the given instance can be stored in a row of the columns, that is its attributes have the types of
+        the columns and its discrete indexed attributes have the maximum indexes of the columns. The types of the
+        columns are the ones of the data definition when the columns are built, a filter may change the data definition
+        since.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to check.
+
+        RETURNS
+        -------
+        bool
+            True if the instance fits the columns.
+        """
+        if instance.attributeSize() != len(self.__column_types):
+            return False
+        for i in range(len(self.__column_types)):
+            attribute = instance.getAttribute(i)
+            attribute_type = self.__column_types[i]
+            if self.__attributeType(attribute) is not attribute_type:
+                return False
+            if attribute_type is AttributeType.DISCRETE_INDEXED and \
+                    (attribute.getMaxIndex() != self.__max_index[i] or
+                     attribute.getIndex() >= len(self.__categories[i])):
+                return False
+        return True
+
+    def __encodeRow(self, instance: Instance) -> tuple:
+        """
+        Converts the attributes and the class label of the given instance to a row of the columns.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to convert.
+
+        RETURNS
+        -------
+        tuple
+            Values of the continuous attributes, codes of the other attributes and the class label code of the row.
+        """
+        row_values = []
+        row_codes = []
+        for i in range(len(self.__column_types)):
+            attribute_type = self.__column_types[i]
+            attribute = instance.getAttribute(i)
+            if attribute_type is AttributeType.CONTINUOUS:
+                row_values.append(attribute.getValue())
+            elif attribute_type is AttributeType.DISCRETE:
+                row_codes.append(self.__categoryCode(i, attribute.getValue()))
+            elif attribute_type is AttributeType.BINARY:
+                row_codes.append(self.__category_codes[i][attribute.getValue()])
+            else:
+                row_codes.append(attribute.getIndex())
+                if attribute.getIndex() >= 0:
+                    self.__categories[i][attribute.getIndex()] = attribute.getValue()
+        return row_values, row_codes, self.__classLabelCode(instance.getClassLabel())
+
+    def __categoryCode(self,
+                       attributeIndex: int,
+                       value: str) -> int:
+        """
+        Returns the integer code of a discrete value of the given attribute, adding the value to the categories of the
+        attribute if it is seen for the first time.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        value : str
+            Discrete value.
+
+        RETURNS
+        -------
+        int
+            Code of the value.
+        """
+        codes = self.__category_codes[attributeIndex]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self.__categories[attributeIndex].append(value)
+        return code
+
+    def __classLabelCode(self, classLabel: str) -> int:
+        """
+        Returns the integer code of the given class label, adding the label if it is seen for the first time.
+
+        PARAMETERS
+        ----------
+        classLabel : str
+            Class label.
+
+        RETURNS
+        -------
+        int
+            Code of the class label.
+        """
+        code = self.__class_label_codes.get(classLabel)
+        if code is None:
+            code = len(self.__class_labels)
+            self.__class_label_codes[classLabel] = code
+            self.__class_labels.append(classLabel)
+        return code
+
+    def __readFile(self,
+                   separator: str,
+                   fileName: str,
+                   processes: int = 1):
+        """
+        Reads the data file with a DataFileReader as column chunks, in parallel if more than one process is given, and
+        converts each chunk column by column: continuous columns are already parsed into arrays, and the local codes of
+        the other columns are mapped to the codes of the list through their distinct values. The chunks are converted
+        in the order of the file, so the codes are those of reading the file line by line.
+
+        PARAMETERS
+        ----------
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        processes : int
+            Number of processes parsing the data file.
+        """
+        reader = DataFileReader(self.__definition, separator, fileName, processes=processes)
+        value_chunks = []
+        code_chunks = []
+        label_chunks = []
+        for columns, labels in reader.readColumnChunks():
+            label_values, label_codes = labels
+            values = np.empty((len(label_codes), self.__values.shape[1]), dtype=np.float64)
+            codes = np.empty((len(label_codes), self.__codes.shape[1]), dtype=np.int32)
+            for i in range(len(columns)):
+                attribute_type = self.__definition.getAttributeType(i)
+                column = self.__column_index[i]
+                if attribute_type is AttributeType.CONTINUOUS:
+                    values[:, column] = columns[i]
+                    continue
+                distinct_values, local_codes = columns[i]
+                if attribute_type is AttributeType.DISCRETE:
+                    mapping = [self.__categoryCode(i, value) for value in distinct_values]
+                elif attribute_type is AttributeType.BINARY:
+                    mapping = [value in reader.BINARY_TRUE_VALUES for value in distinct_values]
+                else:
+                    mapping = [reader.featureValueIndex(i, value) for value in distinct_values]
+                codes[:, column] = np.array(mapping, dtype=np.int32)[local_codes]
+            value_chunks.append(values)
+            code_chunks.append(codes)
+            mapping = [self.__classLabelCode(label) for label in label_values]
+            label_chunks.append(np.array(mapping, dtype=np.int32)[label_codes])
+        for i in range(self.__definition.attributeCount()):
+            if self.__definition.getAttributeType(i) is AttributeType.DISCRETE_INDEXED:
+                self.__categories[i] = list(self.__definition.getAttributeValues(i))
+                self.__max_index[i] = self.__definition.numberOfValues(i)
+        if len(label_chunks) > 0:
+            self.__appendRows(np.concatenate(value_chunks), np.concatenate(code_chunks), np.concatenate(label_chunks))
+
+    def __appendRows(self,
+                     values,
+                     codes,
+                     labels):
+        """
+        Appends the given rows to the columns. Rows appended here have no instances built yet.
+
+        PARAMETERS
+        ----------
+        values
+            Values of the continuous attributes of each row.
+        codes
+            Codes of the discrete attributes of each row.
+        labels
+            Class label codes of each row.
+        """
+        count = len(labels)
+        if count == 0:
+            return
+        self.__values = np.concatenate((self.__values,
+                                        np.asarray(values, dtype=np.float64).reshape(count, self.__values.shape[1])))
+        self.__codes = np.concatenate((self.__codes,
+                                       np.asarray(codes, dtype=np.int32).reshape(count, self.__codes.shape[1])))
+        self.__labels = np.concatenate((self.__labels, np.asarray(labels, dtype=np.int32)))
+        self.__continuous_matrix = None
+        self.__owns_columns = True
+        current = self.list.getVersion() == self.__list_version
+        self.list.extend([None] * count)
+        if current:
+            self.__list_version = self.list.getVersion()
+        self.__row_owners.extend([None] * count)
+
+    def __putInstances(self,
+                       start: int,
+                       instances: list):
+        """
+        Puts the given instances in the rows starting at the given index, and listens to them with the owners of the
+        rows.
+
+        PARAMETERS
+        ----------
+        start : int
+            Index of the first row.
+        instances : list
+            Instances of the rows.
+        """
+        current = self.list.getVersion() == self.__list_version
+        self.list[start: start + len(instances)] = instances
+        if current:
+            self.__list_version = self.list.getVersion()
+        for i in range(len(instances)):
+            owner = ColumnarRowOwner(self.__changed_rows, start + i)
+            instances[i].addModificationListener(owner)
+            self.__row_owners[start + i] = owner
+
+    def __convertRows(self, rows: list) -> bool:
+        """
+        Converts the given rows to the columns again from their instances. Columns shared with other lists, or memory
+        mapped, are copied first.
+
+        PARAMETERS
+        ----------
+        rows : list
+            Indexes of the rows.
+
+        RETURNS
+        -------
+        bool
+            False if an instance no longer fits the columns, in which case no row is converted.
+        """
+        for index in rows:
+            if not self.__fits(self.list[index]):
+                return False
+        if not self.__owns_columns:
+            self.__values = np.array(self.__values)
+            self.__codes = np.array(self.__codes)
+            self.__labels = np.array(self.__labels)
+            self.__owns_columns = True
+        for index in rows:
+            values, codes, label = self.__encodeRow(self.list[index])
+            self.__values[index] = values
+            self.__codes[index] = codes
+            self.__labels[index] = label
+        self.__continuous_matrix = None
+        return True
+
+    def __refreshColumns(self):
+        """
+        Keeps the columns equal to the instances. The rows whose instances are changed since are converted again. If
+        the list of instances is changed, or a changed instance no longer fits the columns, all rows are converted
+        again, the rows whose instances are not built yet being built from the columns first; the data definition is
+        kept if the instances still have its attribute types, otherwise it is inferred from the first instance.
+        """
+        if self.__list_version == self.list.getVersion():
+            if not self.__changed_rows:
+                return
+            rows = sorted(self.__changed_rows)
+            self.__changed_rows.clear()
+            if self.__convertRows(rows):
+                return
+        instances = list(self.getInstances())
+        definition = self.__definition
+        if len(instances) > 0:
+            inferred = self.__definitionOf(instances[0])
+            if [inferred.getAttributeType(i) for i in range(inferred.attributeCount())] != \
+                    [definition.getAttributeType(i) for i in range(definition.attributeCount())]:
+                definition = inferred
+        self.__initColumns(definition)
+        self.addAll(instances)
+
+    def __buildInstance(self, index: int) -> Instance:
+        """
+        Builds the Instance object for the row with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the row.
+
+        RETURNS
+        -------
+        Instance
+            Instance with the attributes and the class label of the row.
+        """
+        instance = Instance(self.__class_labels[self.__labels[index]])
+        for i in range(self.__definition.attributeCount()):
+            attribute_type = self.__definition.getAttributeType(i)
+            column = self.__column_index[i]
+            if attribute_type is AttributeType.CONTINUOUS:
+                instance.addAttribute(ContinuousAttribute(float(self.__values[index, column])))
+            else:
+                code = int(self.__codes[index, column])
+                if attribute_type is AttributeType.DISCRETE:
+                    instance.addAttribute(DiscreteAttribute(self.__categories[i][code]))
+                elif attribute_type is AttributeType.BINARY:
+                    instance.addAttribute(BinaryAttribute(code == 1))
+                else:
+                    value = self.__categories[i][code] if code >= 0 else ""
+                    instance.addAttribute(DiscreteIndexedAttribute(value, code, self.__max_index[i]))
+        return instance
+
+    def __reorder(self, order: np.ndarray):
+        """
+        Reorders the rows (and the already built instances) with the given permutation.
+
+        PARAMETERS
+        ----------
+        order : np.ndarray
+            New order of the rows.
+        """
+        self.__values = self.__values[order]
+        self.__codes = self.__codes[order]
+        self.__labels = self.__labels[order]
+        if self.__continuous_matrix is not None:
+            self.__continuous_matrix = self.__continuous_matrix[order]
+        self.__owns_columns = True
+        self.list = VersionedList(self.list[i] for i in order)
+        self.__list_version = self.list.getVersion()
+        self.__row_owners = [self.__row_owners[i] for i in order]
+        for i in range(len(self.__row_owners)):
+            if self.__row_owners[i] is not None:
+                self.__row_owners[i].setIndex(i)
+        self.detachStatistics()
+
+    @staticmethod
+    def __occurrenceOrder(codes: np.ndarray) -> np.ndarray:
+        """
+        Returns the distinct codes in the order of their first occurrence.
+
+        PARAMETERS
+        ----------
+        codes : np.ndarray
+            Array of codes.
+
+        RETURNS
+        -------
+        np.ndarray
+            Distinct codes ordered by first occurrence.
+        """
+        if codes.size == 0:
+            return codes
+        unique, first = np.unique(codes, return_index=True)
+        return unique[np.argsort(first)]
+
+    @staticmethod
+    def distributionOfCodes(codes: np.ndarray, names: list) -> DiscreteDistribution:
+        """
+        Builds the distribution of the given codes. The items of the distribution are the names of the codes, inserted
+        in the order of their first occurrence, so the result is identical to adding the names one by one.
+
+        PARAMETERS
+        ----------
+        codes : np.ndarray
+            Array of non-negative codes.
+        names : list
+            Names of the codes.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the names of the codes.
+        """
+        distribution = DiscreteDistribution()
+        if codes.size > 0:
+            counts = np.bincount(codes)
+            order = ColumnarInstanceList.__occurrenceOrder(codes)
+            distribution.addDistribution({names[code]: int(counts[code]) for code in order})
+        return distribution
+
+    @staticmethod
+    def toMatrix(values: np.ndarray) -> Matrix:
+        """
+        Converts a two dimensional array to a Matrix.
+
+        PARAMETERS
+        ----------
+        values : np.ndarray
+            Two dimensional array.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix with the same values.
+        """
+        return Moments.toMatrix(values)
+
+    def __columnCodes(self, attributeIndex: int):
+        """
+        Returns the codes of the given attribute together with the values of the codes. Discrete attributes are already
+        coded, continuous attributes are coded by their distinct values.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        tuple
+            Codes of the rows and the values of the codes.
+        """
+        column = self.__column_index[attributeIndex]
+        if self.__definition.getAttributeType(attributeIndex) is AttributeType.CONTINUOUS:
+            unique, inverse = np.unique(self.__values[:, column], return_inverse=True)
+            return inverse.reshape(-1), unique.tolist()
+        return self.__codes[:, column], self.__categories[attributeIndex]
+
+    def __isCoded(self, attributeIndex: int) -> bool:
+        return self.__definition.getAttributeType(attributeIndex) is not AttributeType.CONTINUOUS
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition of the columns.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the columns.
+        """
+        return self.__definition
+
+    def getColumn(self, attributeIndex: int) -> np.ndarray:
+        """
+        Returns the column of the given attribute. Continuous attributes return their values, all other attributes
+        return the integer codes of their values.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Column of the attribute.
+        """
+        self.__refreshColumns()
+        if self.__isCoded(attributeIndex):
+            return self.__codes[:, self.__column_index[attributeIndex]]
+        return self.__values[:, self.__column_index[attributeIndex]]
+
+    def getCategories(self, attributeIndex: int) -> list:
+        """
+        Returns the values corresponding to the codes of a discrete attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Values of the codes, None for continuous attributes.
+        """
+        self.__refreshColumns()
+        return self.__categories[attributeIndex]
+
+    def valueMatrix(self) -> np.ndarray:
+        """
+        Accessor for the matrix of the continuous attribute values, one column for each continuous attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Matrix of continuous attribute values.
+        """
+        self.__refreshColumns()
+        return self.__values
+
+    def codeMatrix(self) -> np.ndarray:
+        """
+        Accessor for the matrix of the discrete attribute codes, one column for each discrete, binary and discrete
+        indexed attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Matrix of discrete attribute codes.
+        """
+        self.__refreshColumns()
+        return self.__codes
+
+    def getClassLabelCodes(self) -> np.ndarray:
+        """
+        Accessor for the class label codes of the rows.
+
+        RETURNS
+        -------
+        np.ndarray
+            Class label codes.
+        """
+        self.__refreshColumns()
+        return self.__labels
+
+    def getClassLabelNames(self) -> list:
+        """
+        Returns the class labels corresponding to the class label codes.
+
+        RETURNS
+        -------
+        list
+            Class labels of the codes.
+        """
+        self.__refreshColumns()
+        return self.__class_labels
+
+    def getClassLabelIndex(self) -> dict:
+        """
+        Returns the dictionary mapping each class label to its code. The returned dictionary must not be modified.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping class labels to their codes.
+        """
+        self.__refreshColumns()
+        return self.__class_label_codes
+
+    def getRows(self,
+                start: int,
+                end: int) -> ColumnarInstanceList:
+        """
+        Returns the rows from start up to but not including end as a new columnar instance list. The columns of the
+        result are slices of the columns of this list, so rows of a memory mapped list are only read when they are
+        used.
+
+        PARAMETERS
+        ----------
+        start : int
+            Index of the first row.
+        end : int
+            Index after the last row.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Rows between start and end.
+        """
+        self.__refreshColumns()
+        self.__owns_columns = False
+        result = ColumnarInstanceList()
+        result.initWithArrays(self.__definition, self.__categories, self.__class_labels, self.__values[start:end],
+                              self.__codes[start:end], self.__labels[start:end])
+        return result
+
+    def formatRows(self,
+                   start: int,
+                   end: int) -> str:
+        """
+        Formats the rows with indexes from start to end as the lines of a data file, the lines being the strings of the
+        instances of the rows. Rows whose instances are built or added are formatted from the instances, so the lines
+        are the instances as they are now; the other rows are formatted column by column, without building instances.
+
+        PARAMETERS
+        ----------
+        start : int
+            Index of the first row.
+        end : int
+            Index after the last row.
+
+        RETURNS
+        -------
+        str
+            Lines of the rows, each ending with a new line.
+        """
+        self.__refreshColumns()
+        if start >= end:
+            return ""
+        columns = []
+        for i in range(self.__definition.attributeCount()):
+            column = self.__column_index[i]
+            if self.__definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                columns.append(map(str, self.__values[start:end, column].tolist()))
+            else:
+                names = [DiscreteAttribute(value).__str__() for value in self.__categories[i]]
+                names.append("")
+                columns.append([names[code] for code in self.__codes[start:end, column].tolist()])
+        columns.append([self.__class_labels[code] for code in self.__labels[start:end].tolist()])
+        lines = map(",".join, zip(*columns))
+        instances = self.list[start:end]
+        if any(instance is not None for instance in instances):
+            lines = [line if instance is None else instance.__str__() for line, instance in zip(lines, instances)]
+        return "\n".join(lines) + "\n"
+
+    def continuousMatrix(self) -> np.ndarray:
+        """
+        Returns the dense matrix of the continuous attributes of all rows, where each discrete indexed attribute is
+        expanded to its 1-of-L encoding. Row i of the matrix is equal to get(i).continuousAttributes(). The matrix is
+        built once and reused until the list changes.
+
+        RETURNS
+        -------
+        np.ndarray
+            Matrix of continuous attributes.
+        """
+        self.__refreshColumns()
+        if self.__continuous_matrix is None:
+            widths = []
+            for i in range(self.__definition.attributeCount()):
+                attribute_type = self.__definition.getAttributeType(i)
+                if attribute_type is AttributeType.CONTINUOUS or attribute_type is AttributeType.DISCRETE_INDEXED:
+                    widths.append(self.__max_index[i])
+                else:
+                    widths.append(0)
+            matrix = np.zeros((self.size(), sum(widths)), dtype=np.float64)
+            start = 0
+            for i in range(self.__definition.attributeCount()):
+                attribute_type = self.__definition.getAttributeType(i)
+                if attribute_type is AttributeType.CONTINUOUS:
+                    matrix[:, start] = self.__values[:, self.__column_index[i]]
+                elif attribute_type is AttributeType.DISCRETE_INDEXED:
+                    codes = self.__codes[:, self.__column_index[i]]
+                    rows = np.flatnonzero(codes >= 0)
+                    matrix[rows, start + codes[rows]] = 1.0
+                start = start + widths[i]
+            self.__continuous_matrix = matrix
+        return self.__continuous_matrix
+
+    def setWeights(self, weights: list):
+        """
+        Weights are not supported by the columns, whose distributions and moments count every row once. The weighted
+        unique rows are found with collapseDuplicates, which gives an ordinary instance list.
+
+        PARAMETERS
+        ----------
+        weights : list
+            Integer weights of the instances, only None is accepted.
+        """
+        if weights is not None:
+            raise ValueError("Columnar instance lists can not have weights")
+        super().setWeights(weights)
+
+    def add(self, instance: Instance):
+        """
+        Adds instance to the instance list.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to be added.
+        """
+        self.addAll([instance])
+
+    def addAll(self, instanceList: list):
+        """
+        Adds a list of instances to the current instance list. The attributes of the instances are converted to the
+        columns, the instances themselves are kept as the instances of the new rows.
+
+        PARAMETERS
+        ----------
+        instanceList : list
+            List of instances to be added.
+        """
+        self.__refreshColumns()
+        if self.size() == 0 and self.__definition.attributeCount() == 0 and len(instanceList) > 0:
+            self.__initColumns(self.__definitionOf(instanceList[0]))
+        values = []
+        codes = []
+        labels = []
+        for instance in instanceList:
+            row_values, row_codes, label = self.__encodeRow(instance)
+            values.append(row_values)
+            codes.append(row_codes)
+            labels.append(label)
+        self.__appendRows(values, codes, labels)
+        self.__putInstances(self.size() - len(labels), list(instanceList))
+
+    def size(self) -> int:
+        """
+        Returns size of the instance list.
+
+        RETURNS
+        -------
+        int
+            Size of the instance list.
+        """
+        return len(self.list)
+
+    def __iter__(self):
+        return map(self.get, range(self.size()))
+
+    def get(self, index: int) -> Instance:
+        """
+        Accessor for a single instance with the given index. The instance is built from the columns the first time it
+        is accessed.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the instance.
+
+        RETURNS
+        -------
+        Instance
+            Instance with index 'index'.
+        """
+        instance = self.list[index]
+        if instance is None:
+            if index < 0:
+                index = index + self.size()
+            instance = self.__buildInstance(index)
+            self.__putInstances(index, [instance])
+        return instance
+
+    def sortWrtAttribute(self, attributeIndex: int):
+        """
+        Sorts attribute list according to the attribute with index 'attributeIndex'. The sort is stable as the sort of
+        InstanceList, discrete attributes are sorted with respect to their values not their codes.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            index of the attribute.
+        """
+        self.__refreshColumns()
+        column = self.getColumn(attributeIndex)
+        if self.__isCoded(attributeIndex):
+            categories = self.__categories[attributeIndex]
+            rank = np.empty(len(categories), dtype=np.int64)
+            rank[np.argsort(np.array(categories, dtype=object), kind='stable')] = np.arange(len(categories))
+            column = rank[column]
+        self.__reorder(np.argsort(column, kind='stable'))
+
+    def sort(self):
+        """
+        Sorts the instance list with respect to the class labels.
+        """
+        self.__refreshColumns()
+        names = np.array(self.__class_labels, dtype=object)
+        rank = np.empty(len(names), dtype=np.int64)
+        rank[np.argsort(names, kind='stable')] = np.arange(len(names))
+        self.__reorder(np.argsort(rank[self.__labels], kind='stable'))
+
+    def shuffle(self, seed: int):
+        """
+        Shuffles the instance list. The permutation is the same as the one InstanceList produces for the same seed.
+
+        PARAMETERS
+        ----------
+        seed : int
+            Seed is used for random number generation.
+        """
+        self.__refreshColumns()
+        order = list(range(self.size()))
+        random.seed(seed)
+        random.shuffle(order)
+        self.__reorder(np.array(order, dtype=np.intp))
+
+    def bootstrap(self, seed: int) -> Bootstrap:
+        """
+        Creates a bootstrap sample from the current instance list.
+
+        PARAMETERS
+        ----------
+        seed : int
+            To create a different bootstrap sample, we need a new seed for each sample.
+
+        RETURNS
+        -------
+        Bootstrap
+            Bootstrap sample.
+        """
+        return Bootstrap(self.getInstances(), seed)
+
+    def getClassLabels(self) -> list:
+        """
+        Extracts the class labels of each instance in the instance list and returns them in a list.
+
+        RETURNS
+        -------
+        list
+            A list of class labels.
+        """
+        self.__refreshColumns()
+        return [self.__class_labels[code] for code in self.__labels.tolist()]
+
+    def getDistinctClassLabels(self) -> list:
+        """
+        Returns the distinct class labels in the order of their first occurrence.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        self.__refreshColumns()
+        return [self.__class_labels[code] for code in self.__occurrenceOrder(self.__labels)]
+
+    def getUnionOfPossibleClassLabels(self) -> list:
+        """
+        Returns the distinct class labels. Rows of a columnar list do not store possible class labels.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        return self.getDistinctClassLabels()
+
+    def getAttributeValueList(self, attributeIndex: int) -> list:
+        """
+        Extracts distinct values of a given attribute in the order of their first occurrence.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            A list of distinct values of the attribute.
+        """
+        self.__refreshColumns()
+        codes, names = self.__columnCodes(attributeIndex)
+        return [names[code] for code in self.__occurrenceOrder(codes)]
+
+    def getAttributeValueIndex(self, attributeIndex: int) -> dict:
+        """
+        Extracts distinct values of a given attribute as a dictionary mapping each value to its index in the order of
+        first occurrence.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping distinct values of the attribute to their indexes.
+        """
+        value_index = {}
+        for value in self.getAttributeValueList(attributeIndex):
+            value_index[value] = len(value_index)
+        return value_index
+
+    def continuousAttributeAverage(self, index: int) -> list:
+        """
+        Calculates the mean of a single attribute for this instance list (m_i).
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            The mean value of the instances as an attribute.
+        """
+        self.__refreshColumns()
+        attribute_type = self.__definition.getAttributeType(index)
+        if attribute_type is AttributeType.DISCRETE_INDEXED:
+            counts = np.bincount(self.__codes[:, self.__column_index[index]], minlength=self.__max_index[index])
+            return (counts / self.size()).tolist()
+        elif attribute_type is AttributeType.CONTINUOUS:
+            return [float(self.__values[:, self.__column_index[index]].mean())]
+        return None
+
+    def continuousAttributeStandardDeviation(self, index: int) -> list:
+        """
+        Calculates the standard deviation of a single continuous attribute for this instance list (m_i).
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            The standard deviation of the instances as an attribute.
+        """
+        self.__refreshColumns()
+        attribute_type = self.__definition.getAttributeType(index)
+        if attribute_type is AttributeType.DISCRETE_INDEXED:
+            counts = np.bincount(self.__codes[:, self.__column_index[index]], minlength=self.__max_index[index])
+            averages = counts / self.size()
+            values = counts * (1 - averages) ** 2 + (self.size() - counts) * averages ** 2
+            return np.sqrt(values / (self.size() - 1)).tolist()
+        elif attribute_type is AttributeType.CONTINUOUS:
+            return [float(self.__values[:, self.__column_index[index]].std(ddof=1))]
+        return None
+
+    def attributeDistribution(self, index: int) -> DiscreteDistribution:
+        """
+        The attributeDistribution method takes an index as an input and if the attribute of the instance at given index
+        is discrete, it returns the distribution of the attributes of that instance.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the attribute.
+        """
+        self.__refreshColumns()
+        if self.__isCoded(index):
+            return self.distributionOfCodes(self.__codes[:, self.__column_index[index]], self.__categories[index])
+        return DiscreteDistribution()
+
+    def attributeClassDistribution(self, attributeIndex: int) -> list:
+        """
+        The attributeClassDistribution method takes an attribute index as an input. For each distinct value of the
+        attribute, in the order of first occurrence, it returns the distribution of the class labels of the rows having
+        that value.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Distribution of the class labels.
+        """
+        self.__refreshColumns()
+        codes, names = self.__columnCodes(attributeIndex)
+        distributions = []
+        for code in self.__occurrenceOrder(codes):
+            distributions.append(self.distributionOfCodes(self.__labels[codes == code], self.__class_labels))
+        return distributions
+
+    def discreteIndexedAttributeClassDistribution(self, attributeIndex: int, attributeValue: int) -> \
+            DiscreteDistribution:
+        """
+        Returns the distribution of the class labels of the rows whose discrete indexed attribute has the given index.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        attributeValue : int
+            Value of the attribute.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        self.__refreshColumns()
+        codes = self.__codes[:, self.__column_index[attributeIndex]]
+        return self.distributionOfCodes(self.__labels[codes == attributeValue], self.__class_labels)
+
+    def classDistribution(self) -> DiscreteDistribution:
+        """
+        The classDistribution method returns the distribution of all the class labels of instances.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        self.__refreshColumns()
+        return self.distributionOfCodes(self.__labels, self.__class_labels)
+
+    def allAttributesDistribution(self) -> list:
+        """
+        The allAttributesDistribution method returns the distributions of all the attributes of instances.
+
+        RETURNS
+        -------
+        list
+            Distributions of all the attributes of instances.
+        """
+        self.__refreshColumns()
+        distributions = []
+        for i in range(self.__definition.attributeCount()):
+            if self.__isCoded(i):
+                distributions.append(self.distributionOfCodes(self.__codes[:, self.__column_index[i]],
+                                                              self.__categories[i]))
+            else:
+                distributions.append(DiscreteDistribution())
+        return distributions
+
+    def average(self) -> Instance:
+        """
+        Returns the mean of all the attributes for instances in the list. For discrete attributes the most occurring
+        value is returned.
+
+        RETURNS
+        -------
+        Instance
+            Mean of all the attributes for instances in the list.
+        """
+        self.__refreshColumns()
+        result = Instance(self.__class_labels[self.__labels[0]])
+        for i in range(self.__definition.attributeCount()):
+            column = self.__column_index[i]
+            if self.__isCoded(i):
+                codes = self.__codes[:, column]
+                order = self.__occurrenceOrder(codes)
+                counts = np.bincount(codes)[order]
+                result.addAttribute(DiscreteAttribute(self.__categories[i][order[np.argmax(counts)]]))
+            else:
+                result.addAttribute(ContinuousAttribute(float(self.__values[:, column].mean())))
+        return result
+
+    def continuousAverage(self) -> list:
+        """
+        Calculates mean of the attributes of instances.
+
+        RETURNS
+        -------
+        list
+            Mean of the attributes of instances.
+        """
+        return self.continuousMatrix().mean(axis=0).tolist()
+
+    def standardDeviation(self) -> Instance:
+        """
+        Returns the standard deviation of attributes for instances.
+
+        RETURNS
+        -------
+        Instance
+            Standard deviation of attributes for instances.
+        """
+        self.__refreshColumns()
+        result = Instance(self.__class_labels[self.__labels[0]])
+        for i in range(self.__definition.attributeCount()):
+            if self.__isCoded(i):
+                result.addAttribute(None)
+            else:
+                result.addAttribute(ContinuousAttribute(float(self.__values[:, self.__column_index[i]].std(ddof=1))))
+        return result
+
+    def continuousStandardDeviation(self) -> list:
+        """
+        Returns the standard deviation of continuous attributes for instances.
+
+        RETURNS
+        -------
+        list
+            Standard deviation of continuous attributes for instances.
+        """
+        return self.continuousMatrix().std(axis=0, ddof=1).tolist()
+
+    def moments(self,
+                full: bool = True,
+                welford: bool = False) -> Moments:
+        """
+        Finds the moments of the continuous attributes from the continuous matrix. In the Welford mode the rows are
+        added one at a time.
+
+        PARAMETERS
+        ----------
+        full : bool
+            If True, the covariances are found as well as the variances.
+        welford : bool
+            If True, the rows are added one at a time with Welford's update.
+
+        RETURNS
+        -------
+        Moments
+            Moments of the continuous attributes.
+        """
+        matrix = self.continuousMatrix()
+        if welford:
+            return Moments.ofRows(matrix.tolist(), full, True)
+        result = Moments(matrix.shape[1], full)
+        result.addMatrix(matrix)
+        return result
+
+    def covariance(self, average: Vector = None) -> Matrix:
+        """
+        Calculates a covariance Matrix by using an average Vector.
+
+        PARAMETERS
+        ----------
+        average : Vector
+            Vector input. If None, the mean of the instances is used.
+
+        RETURNS
+        -------
+        Matrix
+            Covariance Matrix.
+        """
+        return self.moments().getCovariance(average)
+
+    def getInstances(self) -> list:
+        """
+        Accessor for the instances. All instances that are not built yet are built from the columns.
+
+        RETURNS
+        -------
+        list
+            Instances.
+        """
+        for i in range(self.size()):
+            if self.list[i] is None:
+                self.__putInstances(i, [self.__buildInstance(i)])
+        return self.list
@@ -0,0 +1,58 @@
+from Classification.Attribute.AttributeOwner import AttributeOwner
+
+
+class ColumnarRowOwner(AttributeOwner):
+
+    __slots__ = ('__changed_rows', '__index')
+
+    __changed_rows: set
+    __index: int
+
+    def __init__(self,
+                 changedRows: set,
+                 index: int):
+        """
+        Constructor for the owner listening to the instance of a row of a columnar instance list. When the instance is
+        changed, the index of the row is added to the changed rows of the list, so that only the changed rows are
+        converted to the columns again.
+
+        PARAMETERS
+        ----------
+        changedRows : set
+            Indexes of the changed rows of the list.
+        index : int
+            Index of the row.
+        """
+        super().__init__()
+        self.__changed_rows = changedRows
+        self.__index = index
+
+    def __getstate__(self):
+        return super().__getstate__(), self.__changed_rows, self.__index
+
+    def __setstate__(self, state):
+        super().__setstate__(state[0])
+        self.__changed_rows, self.__index = state[1:]
+
+    def setIndex(self, index: int):
+        """
+        Mutator for the index of the row, when the rows of the list are reordered.
+
+        PARAMETERS
+        ----------
+        index : int
+            New index of the row.
+        """
+        self.__index = index
+
+    def attributeModified(self, attribute):
+        """
+        Records that the instance of the row is changed.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute which is changed.
+        """
+        super().attributeModified(attribute)
+        self.__changed_rows.add(self.__index)
@@ -3,11 +3,13 @@ import random
 import math
 from functools import cmp_to_key
 
+import numpy as np
+
+from Classification.Attribute.AttributeOwner import AttributeOwner
 from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataFileReader import DataFileReader
 from Classification.Instance.Instance import Instance
-from Classification.Attribute.AttributeType import AttributeType
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
-from Classification.Attribute.BinaryAttribute import BinaryAttribute
 from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Sampling.Bootstrap import Bootstrap
 from Classification.Instance.CompositeInstance import CompositeInstance
@@ -17,17 +19,30 @@ from Math.DiscreteDistribution import DiscreteDistribution
 from Math.Vector import Vector
 from Math.Matrix import Matrix
 
+from Classification.InstanceList.InstanceListSnapshot import InstanceListSnapshot
+from Classification.InstanceList.InstanceListStatistics import InstanceListStatistics
+from Classification.InstanceList.Moments import Moments
+
 from Classification.Model.Model import Model
 
 
 class InstanceList(object):
 
     list: list
+    __statistics: InstanceListStatistics = None
+    __version: AttributeOwner = None
+    __statistics_version: int = 0
+    __statistics_size: int = 0
+    __weights: list = None
+    __class_label_index: dict = None
+    __class_label_codes: np.ndarray = None
+    __class_label_snapshot: InstanceListSnapshot = None
 
     def __init__(self,
                  listOrDefinition = None,
                  separator: str = None,
-                 fileName: str = None):
+                 fileName: str = None,
+                 processes: int = 1):
         """
         Constructor for an instance list with a given data definition, data file and a separator character. Each
         instance must be stored in a separate line separated with the character separator. The last item must be the
@@ -40,7 +55,9 @@ class InstanceList(object):
         blue;3;1.3;false
 
         where the first attribute is a discrete attribute, second and third attributes are continuous attributes, the
-        fourth item is the class label.
+        fourth item is the class label. The file is read in chunks by a DataFileReader, so the whole file is never held
+        in memory as a list of lines. With more than one process, byte ranges of the file are parsed in parallel, and
+        the instances are in the order of the file as they are when it is read in one process.
 
         PARAMETERS
         ----------
@@ -50,6 +67,8 @@ class InstanceList(object):
             Separator character which separates the attribute values in the data file.
         fileName : str
             Name of the data set file.
+        processes : int
+            Number of processes parsing the data file.
         """
         if listOrDefinition is None:
             self.list = []
@@ -59,26 +78,9 @@ class InstanceList(object):
             else:
                 if isinstance(listOrDefinition, DataDefinition):
                     self.list = []
-                    file = open(fileName, 'r', encoding='utf8')
-                    lines = file.readlines()
-                    file.close()
-                    for line in lines:
-                        attribute_list = line.strip().split(separator)
-                        if len(attribute_list) == listOrDefinition.attributeCount() + 1:
-                            current = Instance(attribute_list[len(attribute_list) - 1])
-                            for i in range(len(attribute_list) - 1):
-                                if listOrDefinition.getAttributeType(i) is AttributeType.DISCRETE:
-                                    current.addAttribute(DiscreteAttribute(attribute_list[i]))
-                                elif listOrDefinition.getAttributeType(i) is AttributeType.DISCRETE_INDEXED:
-                                    current.addAttribute(DiscreteIndexedAttribute(attribute_list[i],
-                                        listOrDefinition.featureValueIndex(i, attribute_list[i]),
-                                        listOrDefinition.numberOfValues(i)))
-                                elif listOrDefinition.getAttributeType(i) is AttributeType.BINARY:
-                                    current.addAttribute(
-                                        BinaryAttribute(attribute_list[i] in ["True", "true", "Yes", "yes", "y", "Y"]))
-                                elif listOrDefinition.getAttributeType(i) is AttributeType.CONTINUOUS:
-                                    current.addAttribute(ContinuousAttribute(float(attribute_list[i])))
-                            self.list.append(current)
+                    for instances in DataFileReader(listOrDefinition, separator, fileName,
+                                                    processes=processes).readInstances():
+                        self.list.extend(instances)
 
     def add(self, instance: Instance):
         """
@@ -90,6 +92,12 @@ class InstanceList(object):
             Instance to be added.
         """
         self.list.append(instance)
+        if self.__weights is not None:
+            self.__weights.append(1)
+        if self.__statistics is not None:
+            self.__statistics.add(instance)
+            instance.addModificationListener(self.__version)
+            self.__statistics_size = self.__statistics_size + 1
 
     def addAll(self, instanceList: list):
         """
@@ -101,6 +109,272 @@ class InstanceList(object):
             List of instances to be added.
         """
         self.list.extend(instanceList)
+        if self.__weights is not None:
+            self.__weights.extend([1] * len(instanceList))
+        if self.__statistics is not None:
+            self.__statistics.addAll(instanceList)
+            for instance in instanceList:
+                instance.addModificationListener(self.__version)
+            self.__statistics_size = self.__statistics_size + len(instanceList)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.__statistics is not None:
+            for instance in self.list:
+                if instance is not None:
+                    instance.addModificationListener(self.__version)
+
+    def __listChanged(self):
+        """
+        Records that the list is reordered, so that attached statistics are found again on the next use.
+        """
+        if self.__version is not None:
+            self.__version.attributeModified(None)
+
+    def __statisticsCurrent(self) -> bool:
+        """
+        Checks if the statistics attached to the list summarize its current instances. The instances the statistics
+        summarize are listened to by the version of the list, which also counts the reorderings of the list, so the
+        statistics are current if the version and the size of the list are the ones they are found with, plus the
+        instances added by add and addAll since. Instances added to out of date statistics leave them out of date.
+
+        RETURNS
+        -------
+        bool
+            True if attached statistics are up to date.
+        """
+        return self.__statistics is not None and self.__version.getModificationCount() == self.__statistics_version \
+            and len(self.list) == self.__statistics_size
+
+    def getStatistics(self) -> InstanceListStatistics:
+        """
+        Returns the sufficient statistics of the instances and attaches them to the list. Once attached, the statistics
+        are updated by add and addAll instead of being found again, and classDistribution, attributeDistribution,
+        allAttributesDistribution, continuousAverage, continuousStandardDeviation and covariance are answered from
+        them without scanning the instances. The distributions then list the items in the order they are first added.
+        If the instances are changed in place, or the list is sorted, shuffled or its size is changed other than with
+        add and addAll, the statistics are found again on the next call. The instances tell the changes to the version
+        of the list when the statistics are attached, so telling whether the statistics are current takes constant
+        time, and changes of instances of other lists are not seen.
+
+        RETURNS
+        -------
+        InstanceListStatistics
+            Statistics of the instances.
+        """
+        if not self.__statisticsCurrent():
+            if self.__version is None:
+                self.__version = AttributeOwner()
+            instances = self.getInstances()
+            for instance in instances:
+                instance.addModificationListener(self.__version)
+            self.__statistics = InstanceListStatistics(instances, self.__weights)
+            self.__statistics_version = self.__version.getModificationCount()
+            self.__statistics_size = len(instances)
+        return self.__statistics
+
+    def detachStatistics(self):
+        """
+        Detaches the statistics from the list, so that they are no longer updated and statistics are found by scanning
+        the instances.
+        """
+        self.__statistics = None
+
+    def getWeight(self, index: int) -> int:
+        """
+        Accessor for the weight of the instance with the given index, that is the number of times the instance
+        occurs in the data.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the instance.
+
+        RETURNS
+        -------
+        int
+            Weight of the instance with index 'index'.
+        """
+        if self.__weights is None:
+            return 1
+        return self.__weights[index]
+
+    def getWeights(self) -> list:
+        """
+        Accessor for the weights of the instances.
+
+        RETURNS
+        -------
+        list
+            Integer weights of the instances, None if every instance counts once.
+        """
+        return self.__weights
+
+    def setWeights(self, weights: list):
+        """
+        Sets the weights of the instances. An instance with weight w counts as w copies of it in the distributions,
+        the averages, the standard deviations, the covariance and the statistics of the list. The weights follow the
+        instances when the list is sorted or shuffled, and instances added later have weight 1.
+
+        PARAMETERS
+        ----------
+        weights : list
+            Integer weights of the instances, None if every instance counts once.
+        """
+        self.__weights = weights
+        self.__statistics = None
+
+    def totalWeight(self) -> int:
+        """
+        Returns the sum of the weights of the instances, that is the number of instances the list stands for.
+
+        RETURNS
+        -------
+        int
+            Sum of the weights of the instances.
+        """
+        if self.__weights is None:
+            return self.size()
+        return sum(self.__weights)
+
+    def __classLabelCodesCurrent(self) -> bool:
+        """
+        Checks if the cached class label codes are codes of the current instances, that is the list has the instances
+        they are found from in the same order. Class labels can not be changed in place, so changes of the attributes
+        of the instances leave the codes current, while any change of the list itself, including one made through
+        getInstances, makes them found again.
+        """
+        return self.__class_label_codes is not None and self.__class_label_snapshot.hasSameInstances(self.list)
+
+    def __encodeClassLabels(self):
+        """
+        Codes the class labels of the instances with integers, the code of a class label being the number of distinct
+        class labels occurring before it, and caches the codes with the mapping of class labels to codes.
+        """
+        if not self.__classLabelCodesCurrent():
+            class_label_index = {}
+            codes = []
+            for instance in self.list:
+                class_label = instance.getClassLabel()
+                code = class_label_index.get(class_label)
+                if code is None:
+                    code = len(class_label_index)
+                    class_label_index[class_label] = code
+                codes.append(code)
+            self.__class_label_index = class_label_index
+            self.__class_label_codes = np.array(codes, dtype=np.int32)
+            self.__class_label_snapshot = InstanceListSnapshot(self.list)
+
+    def getClassLabelIndex(self) -> dict:
+        """
+        Returns the integer encoding of the class labels: a dictionary mapping each distinct class label to its code,
+        which is its index in getClassLabelNames. The encoding is cached until the list changes, and the returned
+        dictionary must not be modified.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping class labels to their codes.
+        """
+        self.__encodeClassLabels()
+        return self.__class_label_index
+
+    def getClassLabelNames(self) -> list:
+        """
+        Returns the class labels corresponding to the class label codes. For an ordinary instance list these are the
+        distinct class labels in the order of their first occurrence.
+
+        RETURNS
+        -------
+        list
+            Class labels of the codes.
+        """
+        return list(self.getClassLabelIndex())
+
+    def getClassLabelCodes(self) -> np.ndarray:
+        """
+        Returns the class label codes of the instances, that is the class label of each instance coded with
+        getClassLabelIndex. The codes are cached until the list changes, and the returned array must not be modified.
+
+        RETURNS
+        -------
+        np.ndarray
+            Class label codes of the instances.
+        """
+        self.__encodeClassLabels()
+        return self.__class_label_codes
+
+    def detachClassLabelCodes(self):
+        """
+        Drops the cached class label codes, so that they are found again on the next use. Subclasses call it when they
+        reorder the instances without changing their number.
+        """
+        self.__class_label_codes = None
+
+    def collapseDuplicates(self) -> InstanceList:
+        """
+        Collapses the duplicate instances into weighted unique instances. Two instances are duplicates if they have the
+        same attribute values and the same class label, compared value by value, so values containing commas are not
+        mistaken for several values. The unique instances are in the order they first occur, and
+        the weight of each is the sum of the weights of its duplicates, so the distributions and the moments of the
+        result are those of this list. The result is always an ordinary instance list.
+
+        RETURNS
+        -------
+        InstanceList
+            Instance list of the unique instances with their weights.
+        """
+        unique = {}
+        instances = []
+        weights = []
+        for i in range(self.size()):
+            instance = self.get(i)
+            key = (tuple(instance.getAttribute(j).__str__() for j in range(instance.attributeSize())),
+                   instance.getClassLabel())
+            index = unique.get(key)
+            if index is None:
+                unique[key] = len(instances)
+                instances.append(instance)
+                weights.append(self.getWeight(i))
+            else:
+                weights[index] = weights[index] + self.getWeight(i)
+        result = InstanceList(instances)
+        result.setWeights(weights)
+        return result
+
+    def __weightedDistribution(self, items) -> DiscreteDistribution:
+        """
+        Returns the distribution of the given items, each item counting as many times as the weight of the instance at
+        the same index.
+
+        PARAMETERS
+        ----------
+        items
+            Items of the instances, in the order of the instances.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Weighted distribution of the items.
+        """
+        distribution = DiscreteDistribution()
+        for item, weight in zip(items, self.__weights):
+            InstanceListStatistics.addWeightedItem(distribution, item, weight)
+        return distribution
+
+    def __reorder(self, order: list):
+        """
+        Puts the instances and their weights in the given order.
+
+        PARAMETERS
+        ----------
+        order : list
+            Indexes of the instances in their new order.
+        """
+        self.list[:] = [self.list[i] for i in order]
+        self.__weights = [self.__weights[i] for i in order]
+        self.__class_label_codes = None
+        self.__listChanged()
 
     def size(self) -> int:
         """
@@ -113,6 +387,9 @@ class InstanceList(object):
         """
         return len(self.list)
 
+    def __iter__(self):
+        return iter(self.list)
+
     def get(self, index: int) -> Instance:
         """
         Accessor for a single instance with the given index.
@@ -150,13 +427,24 @@ class InstanceList(object):
         attributeIndex : int
             index of the attribute.
         """
-        self.list.sort(key=cmp_to_key(self.makeComparator(attributeIndex)))
+        if self.__weights is None:
+            self.list.sort(key=cmp_to_key(self.makeComparator(attributeIndex)))
+            self.__class_label_codes = None
+            self.__listChanged()
+        else:
+            key = cmp_to_key(self.makeComparator(attributeIndex))
+            self.__reorder(sorted(range(len(self.list)), key=lambda i: key(self.list[i])))
 
     def sort(self):
         """
         Sorts attributes list.
         """
-        self.list.sort()
+        if self.__weights is None:
+            self.list.sort()
+            self.__class_label_codes = None
+            self.__listChanged()
+        else:
+            self.__reorder(sorted(range(len(self.list)), key=self.list.__getitem__))
 
     def shuffle(self, seed: int):
         """
@@ -167,8 +455,16 @@ class InstanceList(object):
         seed : int
             Seed is used for random number generation.
         """
-        random.seed(seed)
-        random.shuffle(self.list)
+        if self.__weights is None:
+            random.seed(seed)
+            random.shuffle(self.list)
+            self.__class_label_codes = None
+            self.__listChanged()
+        else:
+            order = list(range(len(self.list)))
+            random.seed(seed)
+            random.shuffle(order)
+            self.__reorder(order)
 
     def bootstrap(self, seed: int) -> Bootstrap:
         """
@@ -209,11 +505,7 @@ class InstanceList(object):
         list
             A list of distinct class labels.
         """
-        class_labels = []
-        for instance in self.list:
-            if not instance.getClassLabel() in class_labels:
-                class_labels.append(instance.getClassLabel())
-        return class_labels
+        return list(self.getClassLabelIndex())
 
     def getUnionOfPossibleClassLabels(self) -> list:
         """
@@ -224,16 +516,14 @@ class InstanceList(object):
         list
             A list of distinct class labels.
         """
-        possible_class_labels = []
+        possible_class_labels = {}
         for instance in self.list:
             if isinstance(instance, CompositeInstance):
                 for possible_class_label in instance.getPossibleClassLabels():
-                    if possible_class_label not in possible_class_labels:
-                        possible_class_labels.append(possible_class_label)
+                    possible_class_labels[possible_class_label] = True
             else:
-                if not instance.getClassLabel() in possible_class_labels:
-                    possible_class_labels.append(instance.getClassLabel())
-        return possible_class_labels
+                possible_class_labels[instance.getClassLabel()] = True
+        return list(possible_class_labels)
 
     def getAttributeValueList(self, attributeIndex: int) -> list:
         """
@@ -249,11 +539,29 @@ class InstanceList(object):
         list
             An list of distinct values of a discrete attribute.
         """
-        value_list = []
+        return list(self.getAttributeValueIndex(attributeIndex))
+
+    def getAttributeValueIndex(self, attributeIndex: int) -> dict:
+        """
+        Extracts distinct discrete values of a given attribute as a dictionary mapping each value to its index in the
+        order of first occurrence, that is, its index in getAttributeValueList.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the discrete attribute.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping distinct values of a discrete attribute to their indexes.
+        """
+        value_index = {}
         for instance in self.list:
-            if not instance.getAttribute(attributeIndex).getValue() in value_list:
-                value_list.append(instance.getAttribute(attributeIndex).getValue())
-        return value_list
+            value = instance.getAttribute(attributeIndex).getValue()
+            if value not in value_index:
+                value_index[value] = len(value_index)
+        return value_index
 
     def __attributeAverage(self, index: int) -> Attribute:
         """
@@ -272,15 +580,18 @@ class InstanceList(object):
             The mean value of the instances as an attribute.
         """
         if isinstance(self.list[0].getAttribute(index), DiscreteAttribute):
+            if self.__weights is not None:
+                return DiscreteAttribute(self.__weightedDistribution(
+                    instance.getAttribute(index).getValue() for instance in self.list).getMaxItem())
             values = []
             for instance in self.list:
                 values.append(instance.getAttribute(index).getValue())
             return DiscreteAttribute(Model.getMaximum(values))
         elif isinstance(self.list[0].getAttribute(index), ContinuousAttribute):
             total = 0.0
-            for instance in self.list:
-                total += instance.getAttribute(index).getValue()
-            return ContinuousAttribute(total / len(self.list))
+            for i in range(len(self.list)):
+                total += self.getWeight(i) * self.list[i].getAttribute(index).getValue()
+            return ContinuousAttribute(total / self.totalWeight())
         else:
             return None
 
@@ -301,45 +612,18 @@ class InstanceList(object):
         if isinstance(self.list[0].getAttribute(index), DiscreteIndexedAttribute):
             max_index_size = self.list[0].getAttribute(index).getMaxIndex()
             values = [0.0] * max_index_size
-            for instance in self.list:
-                value_index = instance.getAttribute(index).getIndex()
-                values[value_index] = values[value_index] + 1
+            for i in range(len(self.list)):
+                value_index = self.list[i].getAttribute(index).getIndex()
+                values[value_index] = values[value_index] + self.getWeight(i)
+            total_weight = self.totalWeight()
             for i in range(len(values)):
-                values[i] = values[i] / len(self.list)
+                values[i] = values[i] / total_weight
             return values
         elif isinstance(self.list[0].getAttribute(index), ContinuousAttribute):
             total = 0.0
-            for instance in self.list:
-                total += instance.getAttribute(index).getValue()
-            return [total / len(self.list)]
-        else:
-            return None
-
-    def __attributeStandardDeviation(self, index: int) -> Attribute:
-        """
-        Calculates the standard deviation of a single attribute for this instance list (m_i). If the attribute is
-        discrete, None returned. If the attribute is continuous, the standard deviation  of the values all instances are
-        returned.
-
-        PARAMETERS
-        ----------
-        index : int
-            Index of the attribute.
-
-        RETURNS
-        -------
-        Attribute
-            The standard deviation of the instances as an attribute.
-        """
-        if isinstance(self.list[0].getAttribute(index), ContinuousAttribute):
-            total = 0.0
-            for instance in self.list:
-                total += instance.getAttribute(index).getValue()
-            average = total / len(self.list)
-            total = 0.0
-            for instance in self.list:
-                total += math.pow(instance.getAttribute(index).getValue() - average, 2)
-            return ContinuousAttribute(math.sqrt(total / (len(self.list) - 1)))
+            for i in range(len(self.list)):
+                total += self.getWeight(i) * self.list[i].getAttribute(index).getValue()
+            return [total / self.totalWeight()]
         else:
             return None
 
@@ -359,31 +643,25 @@ class InstanceList(object):
         """
         if isinstance(self.list[0].getAttribute(index), DiscreteIndexedAttribute):
             max_index_size = self.list[0].getAttribute(index).getMaxIndex()
-            averages = [0.0] * max_index_size
-            for instance in self.list:
-                value_index = instance.getAttribute(index).getIndex()
-                averages[value_index] = averages[value_index] + 1
-            for i in range(len(averages)):
-                averages[i] = averages[i] / len(self.list)
+            averages = self.continuousAttributeAverage(index)
             values = [0.0] * max_index_size
-            for instance in self.list:
-                value_index = instance.getAttribute(index).getIndex()
+            for j in range(len(self.list)):
+                value_index = self.list[j].getAttribute(index).getIndex()
                 for i in range(max_index_size):
                     if i == value_index:
-                        values[i] += math.pow(1 - averages[i], 2)
+                        values[i] += self.getWeight(j) * math.pow(1 - averages[i], 2)
                     else:
-                        values[i] += math.pow(averages[i], 2)
+                        values[i] += self.getWeight(j) * math.pow(averages[i], 2)
+            total_weight = self.totalWeight()
             for i in range(len(values)):
-                values[i] = math.sqrt(values[i] / (len(self.list) - 1))
+                values[i] = math.sqrt(values[i] / (total_weight - 1))
             return values
         elif isinstance(self.list[0].getAttribute(index), ContinuousAttribute):
+            average = self.continuousAttributeAverage(index)[0]
             total = 0.0
-            for instance in self.list:
-                total += instance.getAttribute(index).getValue()
-            average = total / len(self.list)
-            for instance in self.list:
-                total += math.pow(instance.getAttribute(index).getValue() - average, 2)
-            return [math.sqrt(total / (len(self.list) - 1))]
+            for i in range(len(self.list)):
+                total += self.getWeight(i) * math.pow(self.list[i].getAttribute(index).getValue() - average, 2)
+            return [math.sqrt(total / (self.totalWeight() - 1))]
         else:
             return None
 
@@ -402,8 +680,12 @@ class InstanceList(object):
         DiscreteDistribution
             Distribution of the attribute.
         """
+        if self.__statistics is not None:
+            return self.getStatistics().getAttributeDistribution(index)
         distribution = DiscreteDistribution()
         if isinstance(self.list[0].getAttribute(index), DiscreteAttribute):
+            if self.__weights is not None:
+                return self.__weightedDistribution(instance.getAttribute(index).getValue() for instance in self.list)
             for instance in self.list:
                 distribution.addItem(instance.getAttribute(index).getValue())
         return distribution
@@ -425,12 +707,19 @@ class InstanceList(object):
             Distribution of the class labels.
         """
         distributions = []
-        value_list = self.getAttributeValueList(attributeIndex)
-        for _ in value_list:
+        value_index = self.getAttributeValueIndex(attributeIndex)
+        for _ in value_index:
             distributions.append(DiscreteDistribution())
+        if self.__weights is not None:
+            for i in range(len(self.list)):
+                instance = self.list[i]
+                InstanceListStatistics.addWeightedItem(
+                    distributions[value_index[instance.getAttribute(attributeIndex).getValue()]],
+                    instance.getClassLabel(), self.__weights[i])
+            return distributions
         for instance in self.list:
-            distributions[value_list.index(instance.getAttribute(attributeIndex).getValue())].addItem(instance.
-                                                                                                     getClassLabel())
+            distributions[value_index[instance.getAttribute(attributeIndex).getValue()]].addItem(instance.
+                                                                                                getClassLabel())
         return distributions
 
     def discreteIndexedAttributeClassDistribution(self, attributeIndex: int, attributeValue: int) -> \
@@ -453,9 +742,10 @@ class InstanceList(object):
             Distribution of the class labels.
         """
         distribution = DiscreteDistribution()
-        for instance in self.list:
+        for i in range(len(self.list)):
+            instance = self.list[i]
             if instance.getAttribute(attributeIndex).getIndex() == attributeValue:
-                distribution.addItem(instance.getClassLabel())
+                InstanceListStatistics.addWeightedItem(distribution, instance.getClassLabel(), self.getWeight(i))
         return distribution
 
     def classDistribution(self) -> DiscreteDistribution:
@@ -467,9 +757,14 @@ class InstanceList(object):
         DiscreteDistribution
             Distribution of the class labels.
         """
+        if self.__statistics is not None:
+            return self.getStatistics().getClassDistribution()
+        if self.__weights is not None:
+            return self.__weightedDistribution(instance.getClassLabel() for instance in self.list)
         distribution = DiscreteDistribution()
-        for instance in self.list:
-            distribution.addItem(instance.getClassLabel())
+        if len(self.list) > 0:
+            counts = np.bincount(self.getClassLabelCodes()).tolist()
+            distribution.addDistribution(dict(zip(self.getClassLabelNames(), counts)))
         return distribution
 
     def allAttributesDistribution(self) -> list:
@@ -481,14 +776,55 @@ class InstanceList(object):
         list
             Distributions of all the attributes of instances.
         """
+        if self.__statistics is not None:
+            return self.getStatistics().getAttributeDistributions()
         distributions = []
         for i in range(self.list[0].attributeSize()):
             distributions.append(self.attributeDistribution(i))
         return distributions
 
+    def moments(self,
+                full: bool = True,
+                welford: bool = False) -> Moments:
+        """
+        Finds the mean, the variances and, if full is True, the covariances of the continuous attributes (with the
+        discrete indexed attributes expanded to their 1-of-L encoding) in a single scan of the instances.
+
+        PARAMETERS
+        ----------
+        full : bool
+            If True, the covariances are found as well as the variances.
+        welford : bool
+            If True, the instances are added one at a time with Welford's update instead of in vectorized chunks.
+
+        RETURNS
+        -------
+        Moments
+            Moments of the continuous attributes.
+        """
+        return Moments.ofRows((instance.continuousAttributes() for instance in self.list), full, welford,
+                              self.__weights)
+
+    def __continuousOffsets(self) -> list:
+        """
+        Returns, for each attribute, the index of its first value in the continuous attributes of an instance.
+
+        RETURNS
+        -------
+        list
+            Offsets of the attributes in the continuous attributes.
+        """
+        offsets = []
+        offset = 0
+        for i in range(self.list[0].attributeSize()):
+            offsets.append(offset)
+            offset = offset + self.list[0].getAttribute(i).continuousAttributeSize()
+        return offsets
+
     def average(self) -> Instance:
         """
-        Returns the mean of all the attributes for instances in the list.
+        Returns the mean of all the attributes for instances in the list. The means of the continuous attributes are
+        found in a single scan.
 
         RETURNS
         -------
@@ -496,27 +832,42 @@ class InstanceList(object):
             Mean of all the attributes for instances in the list.
         """
         result = Instance(self.list[0].getClassLabel())
+        mean = self.continuousAverage()
+        offsets = self.__continuousOffsets()
         for i in range(self.list[0].attributeSize()):
-            result.addAttribute(self.__attributeAverage(i))
+            if isinstance(self.list[0].getAttribute(i), ContinuousAttribute):
+                result.addAttribute(ContinuousAttribute(mean[offsets[i]]))
+            else:
+                result.addAttribute(self.__attributeAverage(i))
         return result
 
     def continuousAverage(self) -> list:
         """
-        Calculates mean of the attributes of instances.
+        Calculates mean of the attributes of instances. The sums are found in a single scan, adding the continuous
+        attributes of each instance as one array operation.
 
         RETURNS
         -------
         list
             Mean of the attributes of instances.
         """
-        result = []
-        for i in range(self.list[0].attributeSize()):
-            result.extend(self.continuousAttributeAverage(i))
-        return result
+        if self.__statistics is not None:
+            return self.getStatistics().getMoments().getMean()
+        if len(self.list) == 0:
+            return []
+        total = np.zeros(self.list[0].continuousAttributeSize(), dtype=np.float64)
+        if self.__weights is not None:
+            for i in range(len(self.list)):
+                total += self.__weights[i] * np.asarray(self.list[i].continuousAttributes(), dtype=np.float64)
+            return (total / self.totalWeight()).tolist()
+        for instance in self.list:
+            total += instance.continuousAttributes()
+        return (total / len(self.list)).tolist()
 
     def standardDeviation(self) -> Instance:
         """
-        Returns the standard deviation of attributes for instances.
+        Returns the standard deviation of attributes for instances. The standard deviations of the continuous
+        attributes are found in a single scan.
 
         RETURNS
         -------
@@ -524,8 +875,13 @@ class InstanceList(object):
             Standard deviation of attributes for instances.
         """
         result = Instance(self.list[0].getClassLabel())
+        standard_deviation = self.moments(False).getStandardDeviation()
+        offsets = self.__continuousOffsets()
         for i in range(self.list[0].attributeSize()):
-            result.addAttribute(self.__attributeStandardDeviation(i))
+            if isinstance(self.list[0].getAttribute(i), ContinuousAttribute):
+                result.addAttribute(ContinuousAttribute(standard_deviation[offsets[i]]))
+            else:
+                result.addAttribute(None)
         return result
 
     def continuousStandardDeviation(self) -> list:
@@ -537,37 +893,69 @@ class InstanceList(object):
         list
             Standard deviation of continuous attributes for instances.
         """
-        result = []
-        for i in range(self.list[0].attributeSize()):
-            result.extend(self.continuousAttributeStandardDeviation(i))
-        return result
+        if self.__statistics is not None:
+            return self.getStatistics().getMoments().getStandardDeviation()
+        return self.moments(False).getStandardDeviation()
 
-    def covariance(self, average: Vector) -> Matrix:
+    def covariance(self, average: Vector = None) -> Matrix:
         """
-        Calculates a covariance Matrix by using an average Vector.
+        Calculates a covariance Matrix by using an average Vector. The outer products of the deviations are added in a
+        single scan of the instances, each as one array operation, in the order of the instances; so the result is the
+        same as adding the products one by one. If no average is given, the covariance is found from the moments of
+        the instances.
 
         PARAMETERS
         ----------
         average : Vector
-            Vector input.
+            Vector input. If None, the mean of the instances is used.
 
         RETURNS
         -------
         Matrix
             Covariance Matrix.
         """
-        result = Matrix(self.list[0].continuousAttributeSize(), self.list[0].continuousAttributeSize())
-        for instance in self.list:
-            continuous_attributes = instance.continuousAttributes()
-            for i in range(instance.continuousAttributeSize()):
-                xi = continuous_attributes[i]
-                mi = average.getValue(i)
-                for j in range(instance.continuousAttributeSize()):
-                    xj = continuous_attributes[j]
-                    mj = average.getValue(j)
-                    result.addValue(i, j, (xi - mi) * (xj - mj))
-        result.divideByConstant(len(self.list) - 1)
-        return result
+        if self.__statistics is not None:
+            return self.getStatistics().getMoments().getCovariance(average)
+        if average is None:
+            return self.moments().getCovariance()
+        center = np.array([average.getValue(i) for i in range(average.size())], dtype=np.float64)
+        result = np.zeros((center.size, center.size), dtype=np.float64)
+        for i in range(len(self.list)):
+            deviation = np.asarray(self.list[i].continuousAttributes(), dtype=np.float64) - center
+            if self.__weights is None:
+                result += np.outer(deviation, deviation)
+            else:
+                result += self.__weights[i] * np.outer(deviation, deviation)
+        return Moments.toMatrix(result / (self.totalWeight() - 1))
+
+    def formatRows(self,
+                   start: int,
+                   end: int) -> str:
+        """
+        Formats the instances with indexes from start to end as the lines of a data file, each line being the string
+        of an instance. The lines of a chunk of instances are joined at once, and an instance with a weight gives as
+        many lines as its weight.
+
+        PARAMETERS
+        ----------
+        start : int
+            Index of the first instance.
+        end : int
+            Index after the last instance.
+
+        RETURNS
+        -------
+        str
+            Lines of the instances, each ending with a new line.
+        """
+        if start >= end:
+            return ""
+        lines = [self.get(i).__str__() for i in range(start, end)]
+        if self.__weights is not None:
+            lines = [line for i, line in zip(range(start, end), lines) for _ in range(self.__weights[i])]
+        if len(lines) == 0:
+            return ""
+        return "\n".join(lines) + "\n"
 
     def getInstances(self) -> list:
         """
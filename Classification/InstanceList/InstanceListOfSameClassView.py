@@ -0,0 +1,25 @@
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListOfSameClass import InstanceListOfSameClass
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class InstanceListOfSameClassView(InstanceListView, InstanceListOfSameClass):
+
+    def __init__(self,
+                 classLabel: str,
+                 parent: InstanceList,
+                 indexes):
+        """
+        Constructor for a view of the instances of a parent instance list, all of which have the same class label.
+
+        PARAMETERS
+        ----------
+        classLabel : str
+            Class labels of instance list.
+        parent : InstanceList
+            Instance list whose instances are viewed.
+        indexes
+            Indexes of the viewed instances in the parent, as a list or an array of integers.
+        """
+        InstanceListOfSameClass.__init__(self, classLabel)
+        InstanceListView.__init__(self, parent, indexes)
@@ -0,0 +1,36 @@
+import operator
+
+
+class InstanceListSnapshot(object):
+
+    __instances: list
+
+    def __init__(self, instances):
+        """
+        Constructor for a snapshot of the instances of an instance list in their order. Something computed from which
+        instances the list has, and not from their attributes, is current as long as the list has the same instances
+        in the same order. Checking never reads an attribute, it compares the instances by identity.
+
+        PARAMETERS
+        ----------
+        instances
+            Instances of the list, in their order.
+        """
+        self.__instances = list(instances)
+
+    def hasSameInstances(self, instances) -> bool:
+        """
+        Checks if the given instances are the instances of the snapshot in the same order, whether or not they are
+        changed since.
+
+        PARAMETERS
+        ----------
+        instances
+            Instances of the list, in their order.
+
+        RETURNS
+        -------
+        bool
+            True if the instances are the ones of the snapshot.
+        """
+        return len(instances) == len(self.__instances) and all(map(operator.is_, instances, self.__instances))
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import numpy as np
+from Math.DiscreteDistribution import DiscreteDistribution
+
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.Moments import Moments
+
+
+class InstanceListStatistics(object):
+
+    __class_distribution: DiscreteDistribution
+    __attribute_distributions: list
+    __moments: Moments
+
+    def __init__(self,
+                 instances: list = None,
+                 weights: list = None):
+        """
+        Constructor for the sufficient statistics of a list of instances: the number of instances, the number of
+        instances of each class, the number of occurrences of each value of each discrete attribute, and the moments
+        (sums, sums of squares and co-moments) of the continuous attributes. Statistics are updated as instances are
+        added, and statistics of two lists can be merged or subtracted, so that none of them needs the instances again.
+        An instance with an integer weight w counts as w copies of it.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances whose statistics are found.
+        weights : list
+            Weights of the instances, None if every instance counts once.
+        """
+        self.__class_distribution = DiscreteDistribution()
+        self.__attribute_distributions = None
+        self.__moments = Moments(0)
+        if instances is not None:
+            self.addAll(instances, weights)
+
+    @staticmethod
+    def addWeightedItem(distribution: DiscreteDistribution,
+                        item: str,
+                        weight: int):
+        """
+        Adds weight occurrences of the given item to the given distribution.
+
+        PARAMETERS
+        ----------
+        distribution : DiscreteDistribution
+            Distribution to add to.
+        item : str
+            Item to add.
+        weight : int
+            Number of occurrences of the item.
+        """
+        if weight == 1:
+            distribution.addItem(item)
+        else:
+            occurrences = DiscreteDistribution()
+            occurrences[item] = weight
+            distribution.addDistribution(occurrences)
+
+    @staticmethod
+    def removeWeightedItem(distribution: DiscreteDistribution,
+                           item: str,
+                           weight: int):
+        """
+        Removes weight occurrences of the given item from the given distribution.
+
+        PARAMETERS
+        ----------
+        distribution : DiscreteDistribution
+            Distribution to remove from.
+        item : str
+            Item to remove.
+        weight : int
+            Number of occurrences of the item.
+        """
+        if weight == 1:
+            distribution.removeItem(item)
+        else:
+            occurrences = DiscreteDistribution()
+            occurrences[item] = weight
+            distribution.removeDistribution(occurrences)
+
+    def __countAttributes(self,
+                          instance: Instance,
+                          weight: int):
+        """
+        Adds the class label and the discrete attribute values of the given instance to the distributions.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to count.
+        weight : int
+            Weight of the instance.
+        """
+        if self.__attribute_distributions is None:
+            self.__attribute_distributions = [DiscreteDistribution() for _ in range(instance.attributeSize())]
+        self.addWeightedItem(self.__class_distribution, instance.getClassLabel(), weight)
+        for i in range(instance.attributeSize()):
+            attribute = instance.getAttribute(i)
+            if isinstance(attribute, DiscreteAttribute):
+                self.addWeightedItem(self.__attribute_distributions[i], attribute.getValue(), weight)
+
+    def add(self,
+            instance: Instance,
+            weight: int = 1):
+        """
+        Adds a single instance to the statistics. The moments are updated with Welford's update in O(d^2) time, d
+        being the number of continuous attributes.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to add.
+        weight : int
+            Weight of the instance.
+        """
+        self.__countAttributes(instance, weight)
+        self.__moments.addValues(instance.continuousAttributes(), weight)
+
+    def addAll(self,
+               instances: list,
+               weights: list = None):
+        """
+        Adds a list of instances to the statistics. The moments of the continuous attributes of the instances are found
+        as a matrix and merged into the current moments.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to add.
+        weights : list
+            Weights of the instances, None if every instance counts once.
+        """
+        if len(instances) == 0:
+            return
+        rows = []
+        for i in range(len(instances)):
+            self.__countAttributes(instances[i], 1 if weights is None else weights[i])
+            rows.append(instances[i].continuousAttributes())
+        self.__moments.addMatrix(np.array(rows, dtype=np.float64), weights)
+
+    def merge(self, statistics: InstanceListStatistics):
+        """
+        Adds the instances summarized by the given statistics.
+
+        PARAMETERS
+        ----------
+        statistics : InstanceListStatistics
+            Statistics of the instances to add.
+        """
+        self.__class_distribution.addDistribution(statistics.__class_distribution)
+        if statistics.__attribute_distributions is not None:
+            if self.__attribute_distributions is None:
+                self.__attribute_distributions = [DiscreteDistribution()
+                                                  for _ in range(len(statistics.__attribute_distributions))]
+            for i in range(len(statistics.__attribute_distributions)):
+                self.__attribute_distributions[i].addDistribution(statistics.__attribute_distributions[i])
+        self.__moments.merge(statistics.__moments)
+
+    def subtract(self, statistics: InstanceListStatistics):
+        """
+        Removes the instances summarized by the given statistics, which must be a part of the instances summarized by
+        these statistics.
+
+        PARAMETERS
+        ----------
+        statistics : InstanceListStatistics
+            Statistics of the instances to remove.
+        """
+        self.__class_distribution.removeDistribution(statistics.__class_distribution)
+        if statistics.__attribute_distributions is not None:
+            for i in range(len(statistics.__attribute_distributions)):
+                self.__attribute_distributions[i].removeDistribution(statistics.__attribute_distributions[i])
+        self.__moments.subtract(statistics.__moments)
+
+    @staticmethod
+    def __copy(distribution: DiscreteDistribution) -> DiscreteDistribution:
+        result = DiscreteDistribution()
+        result.addDistribution(distribution)
+        return result
+
+    def getCount(self) -> int:
+        """
+        Accessor for the number of instances.
+
+        RETURNS
+        -------
+        int
+            Number of instances.
+        """
+        return int(self.__class_distribution.getSum())
+
+    def getClassDistribution(self) -> DiscreteDistribution:
+        """
+        Returns the number of instances of each class, in the order the classes are first added.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        return self.__copy(self.__class_distribution)
+
+    def getAttributeDistribution(self, index: int) -> DiscreteDistribution:
+        """
+        Returns the number of occurrences of each value of a discrete attribute. The distribution of a continuous
+        attribute is empty.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the values of the attribute.
+        """
+        return self.__copy(self.__attribute_distributions[index])
+
+    def getAttributeDistributions(self) -> list:
+        """
+        Returns the distributions of the values of all attributes.
+
+        RETURNS
+        -------
+        list
+            Distributions of the values of all attributes.
+        """
+        if self.__attribute_distributions is None:
+            return []
+        return [self.__copy(distribution) for distribution in self.__attribute_distributions]
+
+    def getMoments(self) -> Moments:
+        """
+        Accessor for the moments of the continuous attributes.
+
+        RETURNS
+        -------
+        Moments
+            Moments of the continuous attributes.
+        """
+        return self.__moments
@@ -0,0 +1,174 @@
+from Math.DiscreteDistribution import DiscreteDistribution
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataFileReader import DataFileReader
+from Classification.DataSet.DataSetCache import DataSetCache
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStatistics import InstanceListStatistics
+
+
+class InstanceListStream(object):
+
+    __definition: DataDefinition
+    __separator: str
+    __file_name: str
+    __cache_directory: str
+    __chunk_size: int
+
+    def __init__(self,
+                 definition: DataDefinition,
+                 separator: str,
+                 fileName: str,
+                 cacheDirectory: str = None,
+                 chunkSize: int = DataFileReader.DEFAULT_CHUNK_SIZE):
+        """
+        Constructor for a stream of the instances of a data file. The instances are read chunkSize rows at a time and
+        each chunk is given as an instance list, so the whole data set is never held in memory. Learners that only
+        need sufficient statistics, such as the class distribution, the distributions of the discrete attributes and
+        the moments of the continuous attributes, can be trained in a single pass over the stream.
+
+        If a cache directory is given and it holds a valid cache of the data file, the chunks are read from the memory
+        mapped cache instead of parsing the data file. The stream never writes a cache, since that needs the whole data
+        set. Discrete indexed attributes must have their value lists in the data definition, since the statistics of a
+        chunk can not grow with the values first seen in later chunks.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        cacheDirectory : str
+            Directory of the binary cache of the data file.
+        chunkSize : int
+            Number of instances in a chunk.
+        """
+        self.__definition = definition
+        self.__separator = separator
+        self.__file_name = fileName
+        self.__cache_directory = cacheDirectory
+        self.__chunk_size = chunkSize
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the data set.
+        """
+        return self.__definition
+
+    def chunks(self):
+        """
+        Reads the data set chunk by chunk and yields, for each chunk, the instance list of that chunk. Each call starts
+        a new pass over the data set.
+
+        RETURNS
+        -------
+        generator
+            Instance lists of the chunks.
+        """
+        if self.__cache_directory is not None:
+            columns = DataSetCache(self.__cache_directory).open(self.__definition, self.__separator, self.__file_name)
+            if columns is not None:
+                for start in range(0, columns.size(), self.__chunk_size):
+                    yield columns.getRows(start, min(start + self.__chunk_size, columns.size()))
+                return
+        reader = DataFileReader(self.__definition, self.__separator, self.__file_name, self.__chunk_size)
+        for instances in reader.readInstances():
+            yield InstanceList(instances)
+
+    def classDistribution(self) -> DiscreteDistribution:
+        """
+        Returns the distribution of the class labels in a single pass.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        result = DiscreteDistribution()
+        for chunk in self.chunks():
+            for class_label in chunk.getClassLabels():
+                result.addItem(class_label)
+        return result
+
+    def statistics(self) -> InstanceListStatistics:
+        """
+        Returns the sufficient statistics of all instances in a single pass.
+
+        RETURNS
+        -------
+        InstanceListStatistics
+            Statistics of the instances.
+        """
+        result = InstanceListStatistics()
+        for chunk in self.chunks():
+            result.addAll(chunk.getInstances())
+        return result
+
+    def classStatistics(self) -> dict:
+        """
+        Returns the sufficient statistics of the instances of each class in a single pass. The classes are in the order
+        they first occur, which is the order of the class partitions of the whole instance list.
+
+        RETURNS
+        -------
+        dict
+            Dictionary mapping each class label to the statistics of its instances.
+        """
+        result = {}
+        for chunk in self.chunks():
+            class_instances = {}
+            for instance in chunk.getInstances():
+                instances = class_instances.get(instance.getClassLabel())
+                if instances is None:
+                    instances = []
+                    class_instances[instance.getClassLabel()] = instances
+                instances.append(instance)
+            for class_label, instances in class_instances.items():
+                if class_label not in result:
+                    result[class_label] = InstanceListStatistics()
+                result[class_label].addAll(instances)
+        return result
+
+    def average(self,
+                classLabel: str,
+                statistics: InstanceListStatistics) -> Instance:
+        """
+        Returns the mean of all the attributes of the instances summarized by the given statistics, as InstanceList
+        average does: the mean of each continuous attribute and the most occurring value of each discrete attribute.
+
+        PARAMETERS
+        ----------
+        classLabel : str
+            Class label of the mean instance.
+        statistics : InstanceListStatistics
+            Statistics of the instances.
+
+        RETURNS
+        -------
+        Instance
+            Mean of all the attributes of the instances.
+        """
+        result = Instance(classLabel)
+        mean = statistics.getMoments().getMean()
+        offset = 0
+        for i in range(self.__definition.attributeCount()):
+            attribute_type = self.__definition.getAttributeType(i)
+            if attribute_type is AttributeType.CONTINUOUS:
+                result.addAttribute(ContinuousAttribute(mean[offset]))
+                offset = offset + 1
+            else:
+                result.addAttribute(DiscreteAttribute(statistics.getAttributeDistribution(i).getMaxItem()))
+                if attribute_type is AttributeType.DISCRETE_INDEXED:
+                    offset = offset + self.__definition.numberOfValues(i)
+        return result
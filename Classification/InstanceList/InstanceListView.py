@@ -0,0 +1,245 @@
+from __future__ import annotations
+import random
+from functools import cmp_to_key
+
+import numpy as np
+
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class InstanceListView(InstanceList):
+
+    __parent: InstanceList
+    __indexes: np.ndarray
+    __instances: list
+    __get: object
+
+    def __init__(self,
+                 parent: InstanceList,
+                 indexes):
+        """
+        Constructor for a view of the instances of a parent instance list. The view keeps a reference to the parent
+        and an array of indexes into it, and behaves as an instance list of the instances at those indexes without
+        copying them. A view of a view refers directly to the parent of that view, so the indexes are composed once and
+        views of views never form chains.
+
+        Sorting and shuffling a view reorder its own indexes and leave the parent untouched. Adding instances to a
+        view, or asking for its list of instances with getInstances, copies the instances into a list of its own, after
+        which it is an ordinary instance list. The parent must not be reordered while views of it are in use, since a
+        view sees the instances at its indexes in the current order of the parent. If the parent has weights, the view
+        has the weights of the instances at its indexes.
+
+        PARAMETERS
+        ----------
+        parent : InstanceList
+            Instance list whose instances are viewed.
+        indexes
+            Indexes of the viewed instances in the parent, as a list or an array of integers.
+        """
+        indexes = np.asarray(indexes, dtype=np.intp)
+        if parent.getWeights() is not None:
+            weights = parent.getWeights()
+            self.setWeights([weights[i] for i in indexes.tolist()])
+        if isinstance(parent, InstanceListView) and parent.__instances is None:
+            indexes = parent.__indexes[indexes]
+            parent = parent.__parent
+        self.__parent = parent
+        self.__indexes = indexes
+        self.__instances = None
+        if type(parent).get is InstanceList.get:
+            self.__get = parent.list.__getitem__
+        else:
+            self.__get = parent.get
+
+    @property
+    def list(self):
+        """
+        The instances of the view. Until the view is materialized the view itself serves as the sequence of its
+        instances, so that the methods of InstanceList iterate the parent through the indexes.
+        """
+        if self.__instances is None:
+            return self
+        return self.__instances
+
+    @list.setter
+    def list(self, instances: list):
+        self.__instances = instances
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __getitem__(self, index: int) -> Instance:
+        return self.get(index)
+
+    def __iter__(self):
+        if self.__instances is None:
+            return map(self.__get, self.__indexes.tolist())
+        return iter(self.__instances)
+
+    def __materialize(self):
+        """
+        Copies the viewed instances into a list of the view's own.
+        """
+        if self.__instances is None:
+            self.__instances = list(map(self.__get, self.__indexes.tolist()))
+
+    def __reorderWeights(self, order: list):
+        """
+        Puts the weights of the viewed instances in the given order.
+
+        PARAMETERS
+        ----------
+        order : list
+            Indexes of the viewed instances in their new order.
+        """
+        weights = self.getWeights()
+        if weights is not None:
+            self.setWeights([weights[i] for i in order])
+
+    def getParent(self) -> InstanceList:
+        """
+        Accessor for the parent instance list.
+
+        RETURNS
+        -------
+        InstanceList
+            Instance list whose instances are viewed.
+        """
+        return self.__parent
+
+    def getIndexes(self) -> np.ndarray:
+        """
+        Accessor for the indexes of the viewed instances in the parent.
+
+        RETURNS
+        -------
+        np.ndarray
+            Indexes of the viewed instances.
+        """
+        return self.__indexes
+
+    def isMaterialized(self) -> bool:
+        """
+        Checks if the instances are copied into a list of the view's own.
+
+        RETURNS
+        -------
+        bool
+            True if the view holds its own list of instances.
+        """
+        return self.__instances is not None
+
+    def add(self, instance: Instance):
+        """
+        Adds instance to the instance list. The viewed instances are copied first.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to be added.
+        """
+        self.__materialize()
+        super().add(instance)
+
+    def addAll(self, instanceList: list):
+        """
+        Adds a list of instances to the current instance list. The viewed instances are copied first.
+
+        PARAMETERS
+        ----------
+        instanceList : list
+            List of instances to be added.
+        """
+        self.__materialize()
+        super().addAll(instanceList)
+
+    def size(self) -> int:
+        """
+        Returns size of the instance list.
+
+        RETURNS
+        -------
+        int
+            Size of the instance list.
+        """
+        if self.__instances is None:
+            return self.__indexes.shape[0]
+        return len(self.__instances)
+
+    def get(self, index: int) -> Instance:
+        """
+        Accessor for a single instance with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the instance.
+
+        RETURNS
+        -------
+        Instance
+            Instance with index 'index'.
+        """
+        if self.__instances is None:
+            return self.__get(int(self.__indexes[index]))
+        return self.__instances[index]
+
+    def sortWrtAttribute(self, attributeIndex: int):
+        """
+        Sorts attribute list according to the attribute with index 'attributeIndex'. The indexes of the view are sorted
+        with the comparator of InstanceList, so the order is the one the stable sort of the instances gives.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            index of the attribute.
+        """
+        if self.__instances is None:
+            key = cmp_to_key(self.makeComparator(attributeIndex))
+            keys = [key(instance) for instance in self]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self.__indexes = self.__indexes[np.array(order, dtype=np.intp)]
+            self.__reorderWeights(order)
+            self.detachClassLabelCodes()
+        else:
+            super().sortWrtAttribute(attributeIndex)
+
+    def sort(self):
+        """
+        Sorts attributes list. The viewed instances are copied first.
+        """
+        self.__materialize()
+        super().sort()
+
+    def shuffle(self, seed: int):
+        """
+        Shuffles the instance list. The indexes of the view are shuffled, which gives the same permutation as shuffling
+        the instances with the same seed.
+
+        PARAMETERS
+        ----------
+        seed : int
+            Seed is used for random number generation.
+        """
+        if self.__instances is None:
+            order = list(range(self.__indexes.shape[0]))
+            random.seed(seed)
+            random.shuffle(order)
+            self.__indexes = self.__indexes[np.array(order, dtype=np.intp)]
+            self.__reorderWeights(order)
+            self.detachClassLabelCodes()
+        else:
+            super().shuffle(seed)
+
+    def getInstances(self) -> list:
+        """
+        Accessor for the instances. The viewed instances are copied into a list of the view's own, which is returned.
+
+        RETURNS
+        -------
+        list
+            Instances.
+        """
+        self.__materialize()
+        return self.__instances
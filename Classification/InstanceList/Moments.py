@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+
+
+class Moments(object):
+
+    __count: int
+    __mean: np.ndarray
+    __comoment: np.ndarray
+    __full: bool
+
+    DEFAULT_CHUNK_SIZE = 4096
+
+    def __init__(self,
+                 size: int,
+                 full: bool = True):
+        """
+        Constructor for an empty set of moments of size dimensional vectors. The moments are the number of vectors,
+        their mean and their co-moment, the sum of the outer products of the deviations from the mean, from which the
+        variances and the covariance matrix are found. If full is False, only the diagonal of the co-moment is kept,
+        which is enough for the standard deviations.
+
+        Vectors can be added one at a time with Welford's update, or a matrix of vectors at a time, in which case the
+        moments of the matrix are found with NumPy and merged with the current moments. Both are numerically stable,
+        since deviations are always taken from the running mean and never from zero.
+
+        PARAMETERS
+        ----------
+        size : int
+            Size of the vectors.
+        full : bool
+            If True, the full co-moment matrix is kept, otherwise only its diagonal.
+        """
+        self.__count = 0
+        self.__full = full
+        self.__mean = np.zeros(size, dtype=np.float64)
+        if full:
+            self.__comoment = np.zeros((size, size), dtype=np.float64)
+        else:
+            self.__comoment = np.zeros(size, dtype=np.float64)
+
+    @staticmethod
+    def ofRows(rows: list,
+               full: bool = True,
+               welford: bool = False,
+               weights: list = None) -> Moments:
+        """
+        Finds the moments of the given rows in a single scan. In the default mode the rows are converted to NumPy
+        arrays DEFAULT_CHUNK_SIZE rows at a time; in the Welford mode the rows are added one by one, which keeps
+        nothing but the moments in memory. If weights are given, each row counts as many times as its weight.
+
+        PARAMETERS
+        ----------
+        rows : list
+            List of rows, each being a list of floats. Any iterable of rows can be given.
+        full : bool
+            If True, the full co-moment matrix is kept, otherwise only its diagonal.
+        welford : bool
+            If True, the rows are added one by one with Welford's update.
+        weights : list
+            Integer weights of the rows, None if every row counts once.
+
+        RETURNS
+        -------
+        Moments
+            Moments of the rows.
+        """
+        result = None
+        chunk = []
+        start = 0
+        for row in rows:
+            if result is None:
+                result = Moments(len(row), full)
+            if welford:
+                result.addValues(row, 1 if weights is None else weights[start])
+                start = start + 1
+            else:
+                chunk.append(row)
+                if len(chunk) == Moments.DEFAULT_CHUNK_SIZE:
+                    result.addMatrix(np.array(chunk, dtype=np.float64),
+                                     None if weights is None else weights[start:start + len(chunk)])
+                    start = start + len(chunk)
+                    chunk = []
+        if result is None:
+            return Moments(0, full)
+        if len(chunk) > 0:
+            result.addMatrix(np.array(chunk, dtype=np.float64), None if weights is None else weights[start:])
+        return result
+
+    def addValues(self,
+                  values: list,
+                  weight: int = 1):
+        """
+        Adds a single vector with Welford's update. A vector with weight w is added as w copies of it.
+
+        PARAMETERS
+        ----------
+        values : list
+            Values of the vector.
+        weight : int
+            Weight of the vector.
+        """
+        x = np.asarray(values, dtype=np.float64)
+        if self.__count == 0:
+            self.__count = weight
+            self.__mean = x.copy()
+            self.__comoment = np.zeros((x.size, x.size) if self.__full else x.size, dtype=np.float64)
+            return
+        self.__count = self.__count + weight
+        delta = x - self.__mean
+        self.__mean = self.__mean + delta * weight / self.__count
+        if self.__full:
+            self.__comoment += weight * np.outer(delta, x - self.__mean)
+        else:
+            self.__comoment += weight * delta * (x - self.__mean)
+
+    def addMatrix(self,
+                  values: np.ndarray,
+                  weights: list = None):
+        """
+        Adds the rows of the given matrix. The moments of the matrix are found around its own mean and merged with the
+        current moments. If weights are given, each row counts as many times as its weight.
+
+        PARAMETERS
+        ----------
+        values : np.ndarray
+            Matrix whose rows are the vectors to add.
+        weights : list
+            Integer weights of the rows, None if every row counts once.
+        """
+        if values.shape[0] == 0:
+            return
+        if weights is None:
+            count = values.shape[0]
+            mean = values.mean(axis=0)
+            deviations = values - mean
+            if self.__full:
+                comoment = deviations.T @ deviations
+            else:
+                comoment = np.einsum('ij,ij->j', deviations, deviations)
+        else:
+            w = np.asarray(weights, dtype=np.float64)
+            count = int(sum(weights))
+            if count == 0:
+                return
+            mean = (w @ values) / count
+            deviations = values - mean
+            if self.__full:
+                comoment = (deviations * w[:, np.newaxis]).T @ deviations
+            else:
+                comoment = np.einsum('i,ij,ij->j', w, deviations, deviations)
+        self.__combine(count, mean, comoment, 1)
+
+    def merge(self, moments: Moments):
+        """
+        Adds the vectors summarized by the given moments.
+
+        PARAMETERS
+        ----------
+        moments : Moments
+            Moments of the vectors to add.
+        """
+        self.__combine(moments.__count, moments.__mean, self.__sameShape(moments), 1)
+
+    def subtract(self, moments: Moments):
+        """
+        Removes the vectors summarized by the given moments, which must be a part of the vectors summarized by these
+        moments.
+
+        PARAMETERS
+        ----------
+        moments : Moments
+            Moments of the vectors to remove.
+        """
+        self.__combine(moments.__count, moments.__mean, self.__sameShape(moments), -1)
+
+    def __sameShape(self, moments: Moments) -> np.ndarray:
+        """
+        Returns the co-moment of the given moments in the shape of the co-moment of these moments.
+        """
+        if self.__full and not moments.__full:
+            raise ValueError("Full moments can not be combined with diagonal moments")
+        if not self.__full and moments.__full:
+            return np.diagonal(moments.__comoment)
+        return moments.__comoment
+
+    def __combine(self,
+                  count: int,
+                  mean: np.ndarray,
+                  comoment: np.ndarray,
+                  sign: int):
+        """
+        Adds (sign 1) or removes (sign -1) a group of vectors with the given count, mean and co-moment, using the
+        pairwise update of Chan, Golub and LeVeque.
+        """
+        if count == 0:
+            return
+        if self.__count == 0 and sign > 0:
+            self.__count = count
+            self.__mean = np.array(mean, dtype=np.float64)
+            self.__comoment = np.array(comoment, dtype=np.float64)
+            return
+        total = self.__count + sign * count
+        if total == 0:
+            self.__count = 0
+            self.__mean = np.zeros_like(self.__mean)
+            self.__comoment = np.zeros_like(self.__comoment)
+            return
+        if sign > 0:
+            delta = mean - self.__mean
+            new_mean = self.__mean + delta * (count / total)
+            factor = self.__count * count / total
+            if self.__full:
+                self.__comoment = self.__comoment + comoment + factor * np.outer(delta, delta)
+            else:
+                self.__comoment = self.__comoment + comoment + factor * delta * delta
+        else:
+            new_mean = (self.__count * self.__mean - count * mean) / total
+            delta = mean - new_mean
+            factor = total * count / self.__count
+            if self.__full:
+                self.__comoment = self.__comoment - comoment - factor * np.outer(delta, delta)
+            else:
+                self.__comoment = self.__comoment - comoment - factor * delta * delta
+        self.__count = total
+        self.__mean = new_mean
+
+    def getCount(self) -> int:
+        """
+        Accessor for the number of vectors.
+
+        RETURNS
+        -------
+        int
+            Number of vectors.
+        """
+        return self.__count
+
+    def getMean(self) -> list:
+        """
+        Accessor for the mean of the vectors.
+
+        RETURNS
+        -------
+        list
+            Mean of the vectors.
+        """
+        return self.__mean.tolist()
+
+    def getSum(self) -> list:
+        """
+        Returns the sum of the vectors.
+
+        RETURNS
+        -------
+        list
+            Sum of the vectors.
+        """
+        return (self.__count * self.__mean).tolist()
+
+    def getSumOfSquares(self) -> list:
+        """
+        Returns the sum of the squares of each dimension of the vectors.
+
+        RETURNS
+        -------
+        list
+            Sums of squares, the diagonal of the co-moment plus count times the squared mean.
+        """
+        if self.__full:
+            diagonal = np.diagonal(self.__comoment)
+        else:
+            diagonal = self.__comoment
+        return (diagonal + self.__count * self.__mean * self.__mean).tolist()
+
+    def getVariance(self) -> list:
+        """
+        Returns the sample variance of each dimension.
+
+        RETURNS
+        -------
+        list
+            Sample variances, the diagonal of the co-moment divided by count - 1.
+        """
+        if self.__full:
+            diagonal = np.diagonal(self.__comoment)
+        else:
+            diagonal = self.__comoment
+        return (diagonal / (self.__count - 1)).tolist()
+
+    def getStandardDeviation(self) -> list:
+        """
+        Returns the sample standard deviation of each dimension.
+
+        RETURNS
+        -------
+        list
+            Sample standard deviations.
+        """
+        return [math.sqrt(max(variance, 0.0)) for variance in self.getVariance()]
+
+    def covarianceArray(self, average: Vector = None) -> np.ndarray:
+        """
+        Returns the sample covariance matrix as a NumPy array. If an average is given, deviations are taken from it
+        instead of the mean, as sum((x - a)(x - a)^T) / (count - 1) = (C + count * (m - a)(m - a)^T) / (count - 1),
+        where C is the co-moment and m the mean.
+
+        PARAMETERS
+        ----------
+        average : Vector
+            Vector from which deviations are taken, the mean if None.
+
+        RETURNS
+        -------
+        np.ndarray
+            Covariance matrix.
+        """
+        if not self.__full:
+            raise ValueError("Covariance needs full moments")
+        comoment = self.__comoment
+        if average is not None:
+            shift = self.__mean - np.array([average.getValue(i) for i in range(average.size())], dtype=np.float64)
+            comoment = comoment + self.__count * np.outer(shift, shift)
+        return comoment / (self.__count - 1)
+
+    def getCovariance(self, average: Vector = None) -> Matrix:
+        """
+        Returns the sample covariance matrix.
+
+        PARAMETERS
+        ----------
+        average : Vector
+            Vector from which deviations are taken, the mean if None.
+
+        RETURNS
+        -------
+        Matrix
+            Covariance matrix.
+        """
+        return Moments.toMatrix(self.covarianceArray(average))
+
+    @staticmethod
+    def toMatrix(values: np.ndarray) -> Matrix:
+        """
+        Converts a two dimensional array to a Matrix.
+
+        PARAMETERS
+        ----------
+        values : np.ndarray
+            Two dimensional array.
+
+        RETURNS
+        -------
+        Matrix
+            Matrix with the same values.
+        """
+        result = Matrix(values.shape[0], values.shape[1])
+        rows = values.tolist()
+        for i in range(len(rows)):
+            for j in range(len(rows[i])):
+                result.setValue(i, j, rows[i][j])
+        return result
@@ -1,7 +1,9 @@
+import numpy as np
 from Util.RandomArray import RandomArray
 
 from Classification.InstanceList.InstanceList import InstanceList
-from Classification.InstanceList.InstanceListOfSameClass import InstanceListOfSameClass
+from Classification.InstanceList.InstanceListOfSameClassView import InstanceListOfSameClassView
+from Classification.InstanceList.InstanceListView import InstanceListView
 
 
 class Partition(object):
@@ -15,7 +17,9 @@ class Partition(object):
                  stratified: bool = None):
         """
         Divides the instances in the instance list into partitions so that all instances of a class are grouped in a
-        single partition.
+        single partition. The instances are grouped by sorting the class label codes of the instance list, and each
+        partition is a view of the instance list holding the indexes of its instances, so no list of instances is
+        copied.
         PARAMETERS
         ----------
         ratio
@@ -27,62 +31,84 @@ class Partition(object):
         self.__multi_list = []
         if instanceList is not None:
             if ratio is None:
-                class_labels = instanceList.getDistinctClassLabels()
-                for class_label in class_labels:
-                    self.add(InstanceListOfSameClass(class_label))
-                for instance in instanceList.getInstances():
-                    self.get(class_labels.index(instance.getClassLabel())).add(instance)
+                codes = instanceList.getClassLabelCodes()
+                if codes.shape[0] > 0:
+                    names = instanceList.getClassLabelNames()
+                    order = np.argsort(codes, kind="stable")
+                    ends = np.cumsum(np.bincount(codes, minlength=len(names)))
+                    unique, first = np.unique(codes, return_index=True)
+                    for code in unique[np.argsort(first)].tolist():
+                        start = ends[code - 1] if code > 0 else 0
+                        self.add(InstanceListOfSameClassView(names[code], instanceList, order[start:ends[code]]))
             else:
                 if isinstance(ratio, float):
-                    self.add(InstanceList())
-                    self.add(InstanceList())
+                    groups = [[], []]
                     if stratified:
                         distribution = instanceList.classDistribution()
+                        class_indexes = {}
+                        limits = []
+                        for class_label in distribution:
+                            class_indexes[class_label] = len(limits)
+                            limits.append(instanceList.size() * ratio * distribution.getProbability(class_label))
                         counts = [0] * len(distribution)
                         random_array = RandomArray.indexArray(instanceList.size(), seed)
                         for i in range(instanceList.size()):
-                            instance = instanceList.get(random_array[i])
-                            class_index = distribution.getIndex(instance.getClassLabel())
-                            if counts[class_index] < instanceList.size() * ratio * \
-                                    distribution.getProbability(instance.getClassLabel()):
-                                self.get(0).add(instance)
+                            class_index = class_indexes[instanceList.get(random_array[i]).getClassLabel()]
+                            if counts[class_index] < limits[class_index]:
+                                groups[0].append(random_array[i])
                             else:
-                                self.get(1).add(instance)
+                                groups[1].append(random_array[i])
                             counts[class_index] = counts[class_index] + 1
                     else:
                         instanceList.shuffle(seed)
-                        for i in range(self.size()):
-                            instance = instanceList.get(i)
+                        for i in range(len(groups)):
                             if i < instanceList.size() * ratio:
-                                self.get(0).add(instance)
+                                groups[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                groups[1].append(i)
+                    self.__addViews(instanceList, groups)
                 elif isinstance(ratio, int):
                     attribute_index = ratio
                     if seed is None:
-                        valueList = instanceList.getAttributeValueList(attribute_index)
-                        for _ in valueList:
-                            self.add(InstanceList())
-                        for instance in instanceList.getInstances():
-                            self.get(valueList.index(instance.getAttribute(attribute_index).getValue())).add(instance)
+                        value_index = instanceList.getAttributeValueIndex(attribute_index)
+                        groups = [[] for _ in value_index]
+                        for i, instance in enumerate(instanceList):
+                            groups[value_index[instance.getAttribute(attribute_index).getValue()]].append(i)
+                        self.__addViews(instanceList, groups)
                     elif isinstance(seed, int):
                         attribute_value = seed
-                        self.add(InstanceList())
-                        self.add(InstanceList())
-                        for instance in instanceList.getInstances():
+                        groups = [[], []]
+                        for i, instance in enumerate(instanceList):
                             if instance.getAttribute(attribute_index).getIndex() == attribute_value:
-                                self.get(0).add(instance)
+                                groups[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                groups[1].append(i)
+                        self.__addViews(instanceList, groups)
                     elif isinstance(seed, float):
                         split_value = seed
-                        self.add(InstanceList())
-                        self.add(InstanceList())
-                        for instance in instanceList.getInstances():
+                        groups = [[], []]
+                        for i, instance in enumerate(instanceList):
                             if instance.getAttribute(attribute_index).getValue() < split_value:
-                                self.get(0).add(instance)
+                                groups[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                groups[1].append(i)
+                        self.__addViews(instanceList, groups)
+
+    def __addViews(self,
+                   instanceList: InstanceList,
+                   groups: list):
+        """
+        Adds a view of the given instance list for each group of indexes.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list whose instances are viewed.
+        groups : list
+            List of lists of indexes of the instances in each partition.
+        """
+        for indexes in groups:
+            self.add(InstanceListView(instanceList, indexes))
 
     def add(self, _list: InstanceList):
         """
@@ -0,0 +1,81 @@
+class VersionedList(list):
+
+    __version: int = 0
+
+    def __init__(self, iterable=()):
+        """
+        Constructor for a list which counts the changes made to it, so that something computed from its items can be
+        checked in constant time: the items are unchanged as long as the version is the one it was computed with.
+
+        PARAMETERS
+        ----------
+        iterable
+            Initial items of the list.
+        """
+        super().__init__(iterable)
+        self.__version = 0
+
+    def getVersion(self) -> int:
+        """
+        Accessor for the number of changes made to the list.
+
+        RETURNS
+        -------
+        int
+            Version of the list.
+        """
+        return self.__version
+
+    def __changed(self):
+        self.__version = self.__version + 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.__changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.__changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self.__changed()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self.__changed()
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self.__changed()
+
+    def extend(self, items):
+        super().extend(items)
+        self.__changed()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.__changed()
+
+    def pop(self, index=-1):
+        result = super().pop(index)
+        self.__changed()
+        return result
+
+    def remove(self, item):
+        super().remove(item)
+        self.__changed()
+
+    def clear(self):
+        super().clear()
+        self.__changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.__changed()
+
+    def reverse(self):
+        super().reverse()
+        self.__changed()
@@ -0,0 +1,88 @@
+import random
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class ViewBootstrap(object):
+
+    __instance_list: InstanceList
+    __indexes: list
+    __sample: InstanceListView
+
+    def __init__(self,
+                 instanceList: InstanceList,
+                 seed: int):
+        """
+        A constructor of ViewBootstrap class which takes an instance list and a seed number, then creates a bootstrap
+        sample using this seed as random number. The sample draws the same instances as the Bootstrap of the instances
+        of the list with the same seed, but it is a view holding the indexes of the drawn instances instead of a new
+        list of instances.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Original sample
+        seed : int
+            Random number to create boostrap sample
+        """
+        random.seed(seed)
+        N = instanceList.size()
+        indexes = []
+        for i in range(N):
+            indexes.append(random.randint(0, N - 1))
+        self.__instance_list = instanceList
+        self.__indexes = indexes
+        self.__sample = None
+
+    def getSample(self) -> InstanceListView:
+        """
+        getSample returns the produced bootstrap sample.
+
+        RETURNS
+        -------
+        InstanceListView
+            Produced bootstrap sample
+        """
+        if self.__sample is None:
+            self.__sample = InstanceListView(self.__instance_list, self.__indexes)
+        return self.__sample
+
+    def getMultiplicities(self) -> list:
+        """
+        Returns the number of times each instance of the original sample is drawn into the bootstrap sample.
+
+        RETURNS
+        -------
+        list
+            Multiplicity of each instance of the original sample.
+        """
+        multiplicities = [0] * self.__instance_list.size()
+        for index in self.__indexes:
+            multiplicities[index] = multiplicities[index] + 1
+        return multiplicities
+
+    def getWeightedSample(self) -> InstanceListView:
+        """
+        Returns the bootstrap sample as a view of the distinct drawn instances, in the order they are first drawn,
+        each weighted with the number of times it is drawn (times its own weight, if the original sample has weights).
+        The weighted sample stands for the same data as getSample, and since the instances are in the order of their
+        first occurrence in getSample, ties between classes and values are broken the same way; while a learner scans
+        each drawn instance once.
+
+        RETURNS
+        -------
+        InstanceListView
+            Weighted bootstrap sample.
+        """
+        multiplicities = self.getMultiplicities()
+        indexes = []
+        weights = []
+        for i in self.__indexes:
+            if multiplicities[i] > 0:
+                indexes.append(i)
+                weights.append(multiplicities[i] * self.__instance_list.getWeight(i))
+                multiplicities[i] = 0
+        sample = InstanceListView(self.__instance_list, indexes)
+        sample.setWeights(weights)
+        return sample
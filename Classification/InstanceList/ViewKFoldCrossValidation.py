@@ -0,0 +1,70 @@
+import numpy as np
+from Sampling.CrossValidation import CrossValidation
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class ViewKFoldCrossValidation(CrossValidation):
+
+    __instance_list: InstanceList
+    __N: int
+
+    def __init__(self,
+                 instanceList: InstanceList,
+                 K: int,
+                 seed: int):
+        """
+        A constructor of ViewKFoldCrossValidation class which takes an instance list, a K (K in K-fold cross-validation)
+        and a seed number, then shuffles the instance list using this seed as random number. The folds are the same as
+        the folds of KFoldCrossValidation of the instances of the list with the same seed, but each fold is a view
+        holding the indexes of its instances instead of a new list of instances.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Original sample
+        K : int
+            K in K-fold cross-validation
+        seed : int
+            Random number to create K-fold sample(s)
+        """
+        self.__instance_list = instanceList
+        instanceList.shuffle(seed)
+        self.__N = instanceList.size()
+        self.K = K
+
+    def getTrainFold(self, k: int) -> InstanceListView:
+        """
+        getTrainFold returns the k'th train fold in K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            index for the k'th train fold of the K-fold cross-validation
+
+        RETURNS
+        -------
+        InstanceListView
+            Produced training sample
+        """
+        indexes = np.concatenate((np.arange((k * self.__N) // self.K),
+                                  np.arange(((k + 1) * self.__N) // self.K, self.__N)))
+        return InstanceListView(self.__instance_list, indexes)
+
+    def getTestFold(self, k: int) -> InstanceListView:
+        """
+        getTestFold returns the k'th test fold in K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            index for the k'th test fold of the K-fold cross-validation
+
+        RETURNS
+        -------
+        InstanceListView
+            Produced testing sample
+        """
+        indexes = np.arange((k * self.__N) // self.K, ((k + 1) * self.__N) // self.K)
+        return InstanceListView(self.__instance_list, indexes)
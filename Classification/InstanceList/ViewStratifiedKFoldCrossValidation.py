@@ -0,0 +1,89 @@
+import random
+
+import numpy as np
+from Sampling.CrossValidation import CrossValidation
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class ViewStratifiedKFoldCrossValidation(CrossValidation):
+
+    __instance_list: InstanceList
+    __class_indexes: list
+
+    def __init__(self,
+                 instanceList: InstanceList,
+                 K: int,
+                 seed: int):
+        """
+        A constructor of ViewStratifiedKFoldCrossValidation class which takes an instance list, a K (K in K-fold
+        cross-validation) and a seed number. The indexes of the instances of each class are found in a single pass and
+        shuffled using the seed number. The folds are the same as the folds of StratifiedKFoldCrossValidation of the
+        class instances of the list with the same seed, but each fold is a view holding the indexes of its instances
+        instead of a new list of instances. The instance list itself is not changed.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Original sample
+        K : int
+            K in K-fold cross-validation
+        seed : int
+            Random number to create K-fold sample(s)
+        """
+        self.__instance_list = instanceList
+        class_indexes = {}
+        for i, class_label in enumerate(instanceList.getClassLabels()):
+            indexes = class_indexes.get(class_label)
+            if indexes is None:
+                indexes = []
+                class_indexes[class_label] = indexes
+            indexes.append(i)
+        self.__class_indexes = []
+        for indexes in class_indexes.values():
+            random.seed(seed)
+            random.shuffle(indexes)
+            self.__class_indexes.append(np.array(indexes, dtype=np.intp))
+        self.K = K
+
+    def getTrainFold(self, k: int) -> InstanceListView:
+        """
+        getTrainFold returns the k'th train fold in K-fold stratified cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            index for the k'th train fold of the K-fold stratified cross-validation
+
+        RETURNS
+        -------
+        InstanceListView
+            Produced training sample
+        """
+        parts = []
+        for indexes in self.__class_indexes:
+            N = indexes.shape[0]
+            parts.append(indexes[:(k * N) // self.K])
+            parts.append(indexes[((k + 1) * N) // self.K:])
+        return InstanceListView(self.__instance_list, np.concatenate(parts) if len(parts) > 0 else [])
+
+    def getTestFold(self, k: int) -> InstanceListView:
+        """
+        getTestFold returns the k'th test fold in K-fold stratified cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            index for the k'th test fold of the K-fold stratified cross-validation
+
+        RETURNS
+        -------
+        InstanceListView
+            Produced testing sample
+        """
+        parts = []
+        for indexes in self.__class_indexes:
+            N = indexes.shape[0]
+            parts.append(indexes[(k * N) // self.K:((k + 1) * N) // self.K])
+        return InstanceListView(self.__instance_list, np.concatenate(parts) if len(parts) > 0 else [])
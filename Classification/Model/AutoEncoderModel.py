@@ -59,7 +59,7 @@ class AutoEncoderModel(NeuralNetworkModel):
                 tmp_h = self.__V.multiplyWithVectorFromLeft(r_minus_y)
                 tmp_h.remove(0)
                 tmp_hidden = one_minus_hidden.elementProduct(hidden.elementProduct(tmp_h))
-                delta_w = Matrix(tmp_hidden, self.x)
+                delta_w = Matrix(tmp_hidden, self.denseInputVector())
                 delta_v.multiplyWithConstant(learning_rate)
                 self.__V.add(delta_v)
                 delta_w.multiplyWithConstant(learning_rate)
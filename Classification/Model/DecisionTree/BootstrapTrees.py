@@ -0,0 +1,127 @@
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.ViewBootstrap import ViewBootstrap
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.PresortedIndexLists import PresortedIndexLists
+from Classification.Model.DecisionTree.QuantileHistogram import QuantileHistogram
+from Classification.Parameter.BaggingParameter import BaggingParameter
+
+
+class BootstrapTrees(object):
+
+    __train_set: InstanceList
+    __parameter: BaggingParameter
+    __histogram: QuantileHistogram
+    __node_parameter: BaggingParameter
+
+    worker_trees: BootstrapTrees = None
+
+    def __init__(self,
+                 trainSet: InstanceList,
+                 parameter: BaggingParameter,
+                 randomSubsets: bool):
+        """
+        Constructor for the decision trees of a bootstrap ensemble. The tree with index i is grown on the bootstrap
+        sample of the training set with seed i, so each tree depends only on the training set, the parameters and its
+        index, and the trees can be grown in any order or in other processes. If the parameters have histogram bins,
+        the continuous attributes of the training set are binned once for all trees.
+
+        PARAMETERS
+        ----------
+        trainSet : InstanceList
+            Training set.
+        parameter : BaggingParameter
+            Parameters of the ensemble.
+        randomSubsets : bool
+            True if the nodes choose their attributes from random subsets of the attributes of the parameters, as in
+            random forests.
+        """
+        self.__train_set = trainSet
+        self.__parameter = parameter
+        self.__histogram = None
+        if parameter.getHistogramBins() > 0:
+            self.__histogram = QuantileHistogram(trainSet, parameter.getHistogramBins())
+        self.__node_parameter = parameter if randomSubsets else None
+
+    def tree(self, index: int) -> DecisionTree:
+        """
+        Grows the tree with the given index on its bootstrap sample. The sample is a view of the drawn instances of the
+        training set weighted with the number of times they are drawn, so no sample is copied. The tree finds its
+        splits from the quantile bins of the training set if there are any, from the presorted index lists of its
+        sample otherwise.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the tree, the seed of its bootstrap sample.
+
+        RETURNS
+        -------
+        DecisionTree
+            Tree grown on the bootstrap sample.
+        """
+        sample = ViewBootstrap(self.__train_set, index).getWeightedSample()
+        presorted = PresortedIndexLists(sample) if self.__histogram is None else None
+        return DecisionTree(DecisionNode(data=sample,
+                                         parameter=self.__node_parameter,
+                                         isStump=False,
+                                         histogram=self.__histogram,
+                                         presorted=presorted))
+
+    def trees(self) -> list:
+        """
+        Grows the trees of the ensemble, in a pool of the processes of the parameters if there is more than one. The
+        processes are forked where the platform allows it, so they share the training set and the quantile bins with
+        this process instead of receiving copies of them; only the indexes of the trees and the grown trees pass
+        between the processes. The trees are returned in the order of their indexes, so the ensemble is the one grown
+        in a single process.
+
+        RETURNS
+        -------
+        list
+            Trees of the ensemble.
+        """
+        count = self.__parameter.getEnsembleSize()
+        processes = min(self.__parameter.getProcesses(), count)
+        if processes <= 1:
+            return [self.tree(i) for i in range(count)]
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        with ProcessPoolExecutor(processes, mp_context=context, initializer=BootstrapTrees.initializeWorker,
+                                 initargs=(self,)) as pool:
+            return list(pool.map(BootstrapTrees.workerTree, range(count)))
+
+    @staticmethod
+    def initializeWorker(trees: BootstrapTrees):
+        """
+        Keeps the trees to grow in a worker process.
+
+        PARAMETERS
+        ----------
+        trees : BootstrapTrees
+            Trees of the ensemble.
+        """
+        BootstrapTrees.worker_trees = trees
+
+    @staticmethod
+    def workerTree(index: int) -> DecisionTree:
+        """
+        Grows the tree with the given index in a worker process.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the tree.
+
+        RETURNS
+        -------
+        DecisionTree
+            Tree grown on the bootstrap sample with the index.
+        """
+        return BootstrapTrees.worker_trees.tree(index)
@@ -0,0 +1,85 @@
+import numpy as np
+
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class ContingencyTables(object):
+
+    __tables: dict
+
+    def __init__(self,
+                 data: InstanceList,
+                 attributeIndexes: list):
+        """
+        Constructor for the value by class count tables of the given discrete and discrete indexed attributes of the
+        data of a decision tree node. The attribute values of all the attributes are read in a single pass over the
+        instances, each value is coded by its index, and the table of each attribute is counted with a single bincount
+        of the value codes and the class label codes, so the split scores of all the discrete attributes of the node
+        come from these tables without going through the instances again.
+
+        The rows of the table of a discrete attribute are its values in the order of their first occurrence in the
+        data, the order of InstanceList.getAttributeValueList. The rows of the table of a discrete indexed attribute are
+        its indexes 0 to getMaxIndex() - 1, followed by a row for the instances with any other index. Instances with
+        weights count as many times as their weights.
+
+        PARAMETERS
+        ----------
+        data : InstanceList
+            Data of the node.
+        attributeIndexes : list
+            Indexes of the discrete and discrete indexed attributes.
+        """
+        self.__tables = {}
+        if len(attributeIndexes) == 0 or data.size() == 0:
+            return
+        first = data.get(0)
+        indexed = [isinstance(first.getAttribute(index), DiscreteIndexedAttribute) for index in attributeIndexes]
+        value_indexes = [{} for _ in attributeIndexes]
+        codes = []
+        for instance in data:
+            for j in range(len(attributeIndexes)):
+                attribute = instance.getAttribute(attributeIndexes[j])
+                if indexed[j]:
+                    codes.append(attribute.getIndex())
+                else:
+                    value_index = value_indexes[j]
+                    value = attribute.getValue()
+                    code = value_index.get(value)
+                    if code is None:
+                        code = len(value_index)
+                        value_index[value] = code
+                    codes.append(code)
+        codes = np.array(codes, dtype=np.intp).reshape(data.size(), len(attributeIndexes))
+        class_codes = data.getClassLabelCodes()
+        class_count = len(data.getClassLabelNames())
+        weights = data.getWeights()
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        for j in range(len(attributeIndexes)):
+            column = codes[:, j]
+            if indexed[j]:
+                value_count = first.getAttribute(attributeIndexes[j]).getMaxIndex()
+                column = np.where((column >= 0) & (column < value_count), column, value_count)
+                value_count = value_count + 1
+            else:
+                value_count = len(value_indexes[j])
+            self.__tables[attributeIndexes[j]] = np.bincount(column * class_count + class_codes, weights=weights,
+                                                             minlength=value_count * class_count)\
+                .reshape(value_count, class_count)
+
+    def getTable(self, attributeIndex: int) -> np.ndarray:
+        """
+        Accessor for the value by class count table of an attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Class counts of the instances with each value of the attribute, a row for each value.
+        """
+        return self.__tables[attributeIndex]
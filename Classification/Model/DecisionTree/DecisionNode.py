@@ -1,5 +1,6 @@
 from io import TextIOWrapper
 
+import numpy as np
 from Math.DiscreteDistribution import DiscreteDistribution
 from Util.RandomArray import RandomArray
 
@@ -10,7 +11,11 @@ from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.InstanceList.Partition import Partition
+from Classification.Model.DecisionTree.ContingencyTables import ContingencyTables
 from Classification.Model.DecisionTree.DecisionCondition import DecisionCondition
+from Classification.Model.DecisionTree.PresortedIndexLists import PresortedIndexLists
+from Classification.Model.DecisionTree.QuantileHistogram import QuantileHistogram
+from Classification.Model.DecisionTree.SplitEntropy import SplitEntropy
 from Classification.Model.Model import Model
 from Classification.Parameter.RandomForestParameter import RandomForestParameter
 
@@ -27,7 +32,9 @@ class DecisionNode(object):
                      data: InstanceList,
                      condition=None,
                      parameter=None,
-                     isStump=False
+                     isStump=False,
+                     histogram: QuantileHistogram = None,
+                     presorted: PresortedIndexLists = None
                      ):
         """
         The DecisionNode method takes InstanceList data as input and then it sets the class label parameter by finding
@@ -35,20 +42,29 @@ class DecisionNode(object):
         Later, it adds ordered indices to the indexList and shuffles them randomly. Then, it gets the class distribution
         of given data and finds the best entropy value of these class distribution.
 
-        If an attribute of given data is DiscreteIndexedAttribute, it creates a Distribution according to discrete
-        indexed attribute class distribution and finds the entropy. If it is better than the last best entropy it
-        reassigns the best entropy, best attribute and best split value according to the newly founded best entropy's
-        index. At the end, it also add new distribution to the class distribution.
+        The value by class count tables of all the discrete and discrete indexed attributes are counted together in a
+        single pass over the data, and their split entropies are found from the tables.
+
+        If an attribute of given data is DiscreteIndexedAttribute, it finds the entropy of the split of the instances
+        with each index from the rest. If it is better than the last best entropy it reassigns the best entropy, best
+        attribute and best split value according to the newly founded best entropy's index.
 
         If an attribute of given data is DiscreteAttribute, it directly finds the entropy. If it is better than the last
         best entropy it reassigns the best entropy, best attribute and best split value according to the newly founded
         best entropy's index.
 
-        If an attribute of given data is ContinuousAttribute, it creates two distributions; left and right according
-        to class distribution and discrete distribution respectively, and finds the entropy. If it is better than the
-        last best entropy it reassigns the best entropy, best attribute and best split value according to the newly
-        founded best entropy's index. At the end, it also add new distribution to the right distribution and removes
-        from left distribution.
+        If an attribute of given data is ContinuousAttribute, it sorts the data with respect to the attribute and finds
+        the entropies of the splits between all consecutive distinct values at once, from the cumulative class counts
+        of the sorted class label codes. Going through the splits in increasing order of split value, if a split is
+        better than the last best entropy it reassigns the best entropy, best attribute and best split value.
+
+        If the instances of the given data have weights, each instance counts as many times as its weight in the
+        distributions and the entropies, so the tree is the one grown on the data with the duplicates.
+
+        If a histogram is given, the splits of continuous attributes are found from the class counts of the quantile
+        bins of the histogram, without sorting the instances; only thresholds between the bins are candidate splits.
+        If presorted index lists are given instead, the exact search takes the sorted orders of the instances from them,
+        so the data is neither sorted nor reordered, and the tree is the same.
 
         PARAMETERS
         ----------
@@ -60,15 +76,25 @@ class DecisionNode(object):
             RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        histogram : QuantileHistogram
+            Quantile bins of the continuous attributes of the training set, None for the exact split search.
+        presorted : PresortedIndexLists
+            Presorted index lists of the data for the exact split search, None to sort the data at each node.
         """
+        if presorted is not None:
+            data = presorted.getData()
         best_attribute = -1
         best_split_value = 0
         self.__condition = condition
-        self.__classLabelsDistribution = DiscreteDistribution()
-        labels = data.getClassLabels()
-        for label in labels:
-            self.__classLabelsDistribution.addItem(label)
-        self.__class_label = Model.getMaximum(labels)
+        if data.getWeights() is not None:
+            self.__classLabelsDistribution = data.classDistribution()
+            self.__class_label = self.__classLabelsDistribution.getMaxItem()
+        else:
+            self.__classLabelsDistribution = DiscreteDistribution()
+            labels = data.getClassLabels()
+            for label in labels:
+                self.__classLabelsDistribution.addItem(label)
+            self.__class_label = Model.getMaximum(labels)
         self.leaf = True
         self.children = []
         class_labels = data.getDistinctClassLabels()
@@ -82,46 +108,41 @@ class DecisionNode(object):
         else:
             index_list = [i for i in range(data.get(0).attributeSize())]
             size = data.get(0).attributeSize()
-        class_distribution = data.classDistribution()
         best_entropy = data.classDistribution().entropy()
+        tables = ContingencyTables(data, [index_list[j] for j in range(size)
+                                          if isinstance(data.get(0).getAttribute(index_list[j]), DiscreteAttribute)])
         for j in range(size):
             index = index_list[j]
             if isinstance(data.get(0).getAttribute(index), DiscreteIndexedAttribute):
-                for k in range(data.get(0).getAttribute(index).getMaxIndex()):
-                    distribution = data.discreteIndexedAttributeClassDistribution(index, k)
-                    if distribution.getSum() > 0:
-                        class_distribution.removeDistribution(distribution)
-                        entropy = (class_distribution.entropy() * class_distribution.getSum() + distribution.entropy() * distribution.getSum()) / data.size()
-                        if entropy + self.EPSILON < best_entropy:
-                            best_entropy = entropy
-                            best_attribute = index
-                            best_split_value = k
-                        class_distribution.addDistribution(distribution)
+                for entropy, k in SplitEntropy.discreteIndexedSplits(tables.getTable(index),
+                                                                     data.get(0).getAttribute(index).getMaxIndex()):
+                    if entropy + self.EPSILON < best_entropy:
+                        best_entropy = entropy
+                        best_attribute = index
+                        best_split_value = k
             elif isinstance(data.get(0).getAttribute(index), DiscreteAttribute):
-                entropy = self.__entropyForDiscreteAttribute(data, index)
+                entropy = SplitEntropy.discreteEntropy(tables.getTable(index))
                 if entropy + self.EPSILON < best_entropy:
                     best_entropy = entropy
                     best_attribute = index
             elif isinstance(data.get(0).getAttribute(index), ContinuousAttribute):
-                data.sortWrtAttribute(index)
-                previous_value = -100000000
-                left_distribution = data.classDistribution()
-                right_distribution = DiscreteDistribution()
-                for k in range(data.size()):
-                    instance = data.get(k)
-                    if k == 0:
-                        previous_value = instance.getAttribute(index).getValue()
-                    elif instance.getAttribute(index).getValue() != previous_value:
-                        split_value = (previous_value + instance.getAttribute(index).getValue()) / 2
-                        previous_value = instance.getAttribute(index).getValue()
-                        entropy = (left_distribution.getSum() / data.size()) * left_distribution.entropy() + \
-                                  (right_distribution.getSum() / data.size()) * right_distribution.entropy()
-                        if entropy + self.EPSILON < best_entropy:
-                            best_entropy = entropy
-                            best_split_value = split_value
-                            best_attribute = index
-                    left_distribution.removeItem(instance.getClassLabel())
-                    right_distribution.addItem(instance.getClassLabel())
+                if histogram is not None:
+                    splits = histogram.continuousSplits(data, index)
+                elif presorted is not None:
+                    data = presorted.sortWrtAttribute(index)
+                    splits = SplitEntropy.continuousSplits(presorted.getValues(index),
+                                                           presorted.getClassLabelCodes(),
+                                                           data.getWeights())
+                else:
+                    data.sortWrtAttribute(index)
+                    values = np.array([instance.getAttribute(index).getValue() for instance in data],
+                                      dtype=np.float64)
+                    splits = SplitEntropy.continuousSplits(values, data.getClassLabelCodes(), data.getWeights())
+                for entropy, split_value in splits:
+                    if entropy + self.EPSILON < best_entropy:
+                        best_entropy = entropy
+                        best_split_value = split_value
+                        best_attribute = index
         if best_attribute != -1:
             self.leaf = False
             if isinstance(data.get(0).getAttribute(best_attribute), DiscreteIndexedAttribute):
@@ -129,18 +150,24 @@ class DecisionNode(object):
                                                         attributeIndex=best_attribute,
                                                         attributeValue=best_split_value,
                                                         parameter=parameter,
-                                                        isStump=isStump)
+                                                        isStump=isStump,
+                                                        histogram=histogram,
+                                                        presorted=presorted)
             elif isinstance(data.get(0).getAttribute(best_attribute), DiscreteAttribute):
                 self.__createChildrenForDiscrete(data=data,
                                                  attributeIndex=best_attribute,
                                                  parameter=parameter,
-                                                 isStump=isStump)
+                                                 isStump=isStump,
+                                                 histogram=histogram,
+                                                 presorted=presorted)
             elif isinstance(data.get(0).getAttribute(best_attribute), ContinuousAttribute):
                 self.__createChildrenForContinuous(data=data,
                                                    attributeIndex=best_attribute,
                                                    splitValue=best_split_value,
                                                    parameter=parameter,
-                                                   isStump=isStump)
+                                                   isStump=isStump,
+                                                   histogram=histogram,
+                                                   presorted=presorted)
 
     def constructor2(self, inputFile: TextIOWrapper):
         line = inputFile.readline().strip()
@@ -170,39 +197,44 @@ class DecisionNode(object):
                  data: object,
                  condition=None,
                  parameter=None,
-                 isStump=False):
+                 isStump=False,
+                 histogram: QuantileHistogram = None,
+                 presorted: PresortedIndexLists = None):
         if isinstance(data, InstanceList):
-            self.constructor1(data, condition, parameter, isStump)
+            self.constructor1(data, condition, parameter, isStump, histogram, presorted)
         elif isinstance(data, TextIOWrapper):
             self.constructor2(data)
 
-    def __entropyForDiscreteAttribute(self, data: InstanceList, attributeIndex: int):
+    @staticmethod
+    def __splitPresorted(presorted: PresortedIndexLists, childrenData: Partition) -> list:
         """
-        The entropyForDiscreteAttribute method takes an attributeIndex and creates an ArrayList of DiscreteDistribution.
-        Then loops through the distributions and calculates the total entropy.
+        Returns the presorted index lists of the children for the given partition of the data of the node, a list of
+        None if the node has no presorted index lists.
 
         PARAMETERS
         ----------
-        attributeIndex : int
-            Index of the attribute.
+        presorted : PresortedIndexLists
+            Presorted index lists of the node.
+        childrenData : Partition
+            Data of the children.
 
         RETURNS
         -------
-        float
-            Total entropy for the discrete attribute.
+        list
+            Presorted index lists of the children.
         """
-        total = 0.0
-        distributions = data.attributeClassDistribution(attributeIndex)
-        for distribution in distributions:
-            total += (distribution.getSum() / data.size()) * distribution.entropy()
-        return total
+        if presorted is None:
+            return [None] * childrenData.size()
+        return presorted.split([childrenData.get(i) for i in range(childrenData.size())])
 
     def __createChildrenForDiscreteIndexed(self,
                                            data: InstanceList,
                                            attributeIndex: int,
                                            attributeValue: int,
                                            parameter: RandomForestParameter,
-                                           isStump: bool):
+                                           isStump: bool,
+                                           histogram: QuantileHistogram,
+                                           presorted: PresortedIndexLists):
         """
         The createChildrenForDiscreteIndexed method creates an list of DecisionNodes as children and a partition with
         respect to indexed attribute.
@@ -217,8 +249,13 @@ class DecisionNode(object):
             Like seed, ensembleSize, attributeSubsetSize.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        histogram : QuantileHistogram
+            Quantile bins of the continuous attributes of the training set, None for the exact split search.
+        presorted : PresortedIndexLists
+            Presorted index lists of the data, None to sort the data at each node.
         """
         children_data = Partition(data, attributeIndex, attributeValue)
+        children_presorted = self.__splitPresorted(presorted, children_data)
         self.children.append(
             DecisionNode(data=children_data.get(0),
                          condition=DecisionCondition(attributeIndex,
@@ -227,7 +264,9 @@ class DecisionNode(object):
                                                                               data.get(0).getAttribute(
                                                                                   attributeIndex).getMaxIndex())),
                          parameter=parameter,
-                         isStump=isStump))
+                         isStump=isStump,
+                         histogram=histogram,
+                         presorted=children_presorted[0]))
         self.children.append(
             DecisionNode(data=children_data.get(1),
                          condition=DecisionCondition(attributeIndex,
@@ -236,13 +275,17 @@ class DecisionNode(object):
                                                                               data.get(0).getAttribute(
                                                                                   attributeIndex).getMaxIndex())),
                          parameter=parameter,
-                         isStump=isStump))
+                         isStump=isStump,
+                         histogram=histogram,
+                         presorted=children_presorted[1]))
 
     def __createChildrenForDiscrete(self,
                                     data: InstanceList,
                                     attributeIndex: int,
                                     parameter: RandomForestParameter,
-                                    isStump: bool):
+                                    isStump: bool,
+                                    histogram: QuantileHistogram,
+                                    presorted: PresortedIndexLists):
         """
         The createChildrenForDiscrete method creates an ArrayList of values, a partition with respect to attributes and
         a list of DecisionNodes as children.
@@ -255,22 +298,31 @@ class DecisionNode(object):
             RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        histogram : QuantileHistogram
+            Quantile bins of the continuous attributes of the training set, None for the exact split search.
+        presorted : PresortedIndexLists
+            Presorted index lists of the data, None to sort the data at each node.
         """
         value_list = data.getAttributeValueList(attributeIndex)
         children_data = Partition(data, attributeIndex)
+        children_presorted = self.__splitPresorted(presorted, children_data)
         for i in range(len(value_list)):
             self.children.append(DecisionNode(data=children_data.get(i),
                                               condition=DecisionCondition(attributeIndex=attributeIndex,
                                                                           value=DiscreteAttribute(value_list[i])),
                                               parameter=parameter,
-                                              isStump=isStump))
+                                              isStump=isStump,
+                                              histogram=histogram,
+                                              presorted=children_presorted[i]))
 
     def __createChildrenForContinuous(self,
                                       data: InstanceList,
                                       attributeIndex: int,
                                       splitValue: float,
                                       parameter: RandomForestParameter,
-                                      isStump: bool):
+                                      isStump: bool,
+                                      histogram: QuantileHistogram,
+                                      presorted: PresortedIndexLists):
         """
         The createChildrenForContinuous method creates a list of DecisionNodes as children and a partition with respect
         to continuous attribute and the given split value.
@@ -283,16 +335,21 @@ class DecisionNode(object):
             RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        histogram : QuantileHistogram
+            Quantile bins of the continuous attributes of the training set, None for the exact split search.
+        presorted : PresortedIndexLists
+            Presorted index lists of the data, None to sort the data at each node.
         splitValue : float
             Split value is used for partitioning.
         """
         children_data = Partition(data, attributeIndex, splitValue)
+        children_presorted = self.__splitPresorted(presorted, children_data)
         self.children.append(DecisionNode(children_data.get(0),
                                           DecisionCondition(attributeIndex, ContinuousAttribute(splitValue), "<"),
-                                          parameter, isStump))
+                                          parameter, isStump, histogram, children_presorted[0]))
         self.children.append(DecisionNode(children_data.get(1),
                                           DecisionCondition(attributeIndex, ContinuousAttribute(splitValue), ">"),
-                                          parameter, isStump))
+                                          parameter, isStump, histogram, children_presorted[1]))
 
     def predict(self, instance: Instance) -> str:
         """
@@ -1,3 +1,4 @@
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
@@ -21,7 +22,7 @@ class DecisionTree(ValidatedModel):
         self.__root = root
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.__root = DecisionNode(inputFile)
         inputFile.close()
 
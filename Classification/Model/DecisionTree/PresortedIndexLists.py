@@ -0,0 +1,206 @@
+from __future__ import annotations
+import copy
+
+import numpy as np
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class PresortedIndexLists(object):
+
+    __parent: InstanceList
+    __values: dict
+    __weights: np.ndarray
+    __class_codes: np.ndarray
+    __marks: np.ndarray
+    __data: InstanceList
+    __order: np.ndarray
+    __attributes: list
+    __sorted_lists: list
+    __history: list
+
+    def __init__(self, data: InstanceList):
+        """
+        Constructor for the presorted index lists of the root node of a decision tree grown on the given data, so that
+        the exact split search never sorts the instances of a node (as in SLIQ).
+
+        A node of the exact search sorts its data with respect to each continuous attribute in turn, and passes its
+        data in the final order down to its children. Since the sorts are stable and every node sorts the same
+        attributes in the same order, the order a node scans an attribute in is the order of the index list of that
+        attribute at the root, restricted to the instances of the node. So the instances are argsorted with respect to
+        each continuous attribute at the root only, and each child gets its index lists by a stable partition of the
+        lists of its parent. The orders, and so the trees, are the ones of the exact search, and the data is not
+        reordered.
+
+        The index lists hold indexes into the list the data is a view of, or into the data itself if it is not a view.
+        If a view has an instance more than once, its instances are put in a list of their own first.
+
+        PARAMETERS
+        ----------
+        data : InstanceList
+            Data of the root node.
+        """
+        if isinstance(data, InstanceListView) and not data.isMaterialized():
+            rows = data.getIndexes()
+            if np.unique(rows).shape[0] == rows.shape[0]:
+                self.__parent = data.getParent()
+            else:
+                copied = InstanceList(list(data))
+                copied.setWeights(data.getWeights())
+                data = copied
+                self.__parent = data
+                rows = np.arange(data.size())
+        else:
+            self.__parent = data
+            rows = np.arange(data.size())
+        self.__weights = None
+        if data.getWeights() is not None and self.__parent is not data:
+            self.__weights = np.zeros(self.__parent.size(), dtype=np.asarray(data.getWeights()).dtype)
+            self.__weights[rows] = data.getWeights()
+        self.__class_codes = np.zeros(self.__parent.size(), dtype=np.intp)
+        self.__class_codes[rows] = data.getClassLabelCodes()
+        self.__values = {}
+        self.__marks = np.zeros(self.__parent.size(), dtype=np.intp)
+        self.__data = data
+        self.__order = rows
+        self.__attributes = []
+        self.__sorted_lists = []
+        self.__history = []
+
+    def getData(self) -> InstanceList:
+        """
+        Accessor for the data of the node, in the order the node gets it from its parent.
+
+        RETURNS
+        -------
+        InstanceList
+            Data of the node.
+        """
+        return self.__data
+
+    def getValues(self, attributeIndex: int) -> np.ndarray:
+        """
+        Accessor for the values of a continuous attribute of the data of the node, in the current order of the data.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the continuous attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Values of the attribute.
+        """
+        return self.__valuesOf(attributeIndex)[self.__order]
+
+    def getClassLabelCodes(self) -> np.ndarray:
+        """
+        Accessor for the class label codes of the data of the node, in the current order of the data. The codes are
+        the ones of the data of the root node.
+
+        RETURNS
+        -------
+        np.ndarray
+            Class label codes of the instances.
+        """
+        return self.__class_codes[self.__order]
+
+    def __valuesOf(self, attributeIndex: int) -> np.ndarray:
+        """
+        Returns the values of a continuous attribute of the instances of the root node, as an array indexed like the
+        index lists. The values are read once for the whole tree.
+        """
+        if attributeIndex not in self.__values:
+            values = np.zeros(self.__parent.size(), dtype=np.float64)
+            for row in self.__order.tolist():
+                values[row] = self.__parent.get(row).getAttribute(attributeIndex).getValue()
+            self.__values[attributeIndex] = values
+        return self.__values[attributeIndex]
+
+    def __stableSort(self,
+                     order: np.ndarray,
+                     attributeIndex: int) -> np.ndarray:
+        """
+        Sorts the given index list with respect to an attribute, keeping the order of the instances with equal values.
+        """
+        return order[np.argsort(self.__valuesOf(attributeIndex)[order], kind="stable")]
+
+    def __view(self, order: np.ndarray) -> InstanceList:
+        """
+        Returns a view of the instances of the given index list, having their weights.
+        """
+        view = InstanceListView(self.__parent, order)
+        if self.__weights is not None:
+            view.setWeights(self.__weights[order].tolist())
+        return view
+
+    def sortWrtAttribute(self, attributeIndex: int) -> InstanceList:
+        """
+        Returns the data of the node in the order InstanceList.sortWrtAttribute puts it in. If the attributes sorted
+        so far at this node are the ones its parent sorted, the index list given by the parent is used, otherwise the
+        current index list is sorted.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the continuous attribute.
+
+        RETURNS
+        -------
+        InstanceList
+            Data of the node sorted with respect to the attribute.
+        """
+        position = len(self.__history)
+        self.__history.append(attributeIndex)
+        if self.__attributes[:position + 1] == self.__history:
+            self.__order = self.__sorted_lists[position]
+        else:
+            self.__order = self.__stableSort(self.__order, attributeIndex)
+        self.__data = self.__view(self.__order)
+        return self.__data
+
+    def split(self, children: list) -> list:
+        """
+        Gives the children of the node their index lists. The index lists of the children are the ones the children
+        would have if they sorted their data with respect to the attributes the node sorted its data, in the same
+        order, and they are found by a stable partition of the index lists of the node.
+
+        PARAMETERS
+        ----------
+        children : list
+            Data of the children, views of the data of the node in its final order.
+
+        RETURNS
+        -------
+        list
+            Presorted index lists of the children.
+        """
+        if self.__attributes == self.__history:
+            sorted_lists = self.__sorted_lists
+        else:
+            sorted_lists = []
+            order = self.__order
+            for attribute_index in self.__history:
+                order = self.__stableSort(order, attribute_index)
+                sorted_lists.append(order)
+        for i in range(len(children)):
+            self.__marks[children[i].getIndexes()] = i
+        children_lists = [[] for _ in children]
+        for sorted_list in sorted_lists:
+            marks = self.__marks[sorted_list]
+            grouped = sorted_list[np.argsort(marks, kind="stable")]
+            ends = np.cumsum(np.bincount(marks, minlength=len(children)))
+            for i in range(len(children)):
+                children_lists[i].append(grouped[ends[i - 1] if i > 0 else 0:ends[i]])
+        result = []
+        for i in range(len(children)):
+            child = copy.copy(self)
+            child.__data = children[i]
+            child.__order = children[i].getIndexes()
+            child.__attributes = list(self.__history)
+            child.__sorted_lists = children_lists[i]
+            child.__history = []
+            result.append(child)
+        return result
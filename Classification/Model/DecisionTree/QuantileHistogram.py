@@ -0,0 +1,166 @@
+import numpy as np
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+from Classification.Model.DecisionTree.SplitEntropy import SplitEntropy
+
+
+class QuantileHistogram(object):
+
+    __data: InstanceList
+    __thresholds: list
+    __values: list
+    __bins: list
+    __class_codes: np.ndarray
+    __class_count: int
+
+    def __init__(self,
+                 data: InstanceList,
+                 binCount: int):
+        """
+        Constructor for the quantile bins of the continuous attributes of a training set, used to find the splits of
+        the continuous attributes of decision trees from histograms instead of sorting the instances of each node.
+
+        The distinct values of each continuous attribute are cut into at most binCount bins, each holding about the
+        same number of instances. The thresholds between the bins are the midpoints of the largest value of a bin and
+        the smallest value of the next one, so no instance of the training set lies on a threshold. If an attribute has
+        at most binCount distinct values, each value is a bin of its own, and the candidate splits are the ones of the
+        exact search. The values and the bin of each instance and the class label codes of the instances are found
+        once, here.
+
+        PARAMETERS
+        ----------
+        data : InstanceList
+            Training set. The nodes of the trees must be grown on this list or on views of it.
+        binCount : int
+            Maximum number of bins of each continuous attribute.
+        """
+        if isinstance(data, InstanceListView) and not data.isMaterialized():
+            data = data.getParent()
+        self.__data = data
+        self.__class_codes = data.getClassLabelCodes()
+        self.__class_count = len(data.getClassLabelNames())
+        self.__thresholds = []
+        self.__values = []
+        self.__bins = []
+        for i in range(data.get(0).attributeSize()):
+            if isinstance(data.get(0).getAttribute(i), ContinuousAttribute):
+                values = np.array([instance.getAttribute(i).getValue() for instance in data], dtype=np.float64)
+                thresholds = self.__quantileThresholds(values, binCount)
+                self.__thresholds.append(thresholds)
+                self.__values.append(values)
+                self.__bins.append(np.searchsorted(thresholds, values, side="right").astype(np.int32))
+            else:
+                self.__thresholds.append(None)
+                self.__values.append(None)
+                self.__bins.append(None)
+
+    @staticmethod
+    def __quantileThresholds(values: np.ndarray, binCount: int) -> np.ndarray:
+        """
+        Finds the thresholds between the quantile bins of the given values.
+
+        PARAMETERS
+        ----------
+        values : np.ndarray
+            Values of a continuous attribute.
+        binCount : int
+            Maximum number of bins.
+
+        RETURNS
+        -------
+        np.ndarray
+            Increasing thresholds, one less than the number of bins.
+        """
+        unique, counts = np.unique(values, return_counts=True)
+        if unique.shape[0] <= binCount:
+            return (unique[:-1] + unique[1:]) / 2
+        cumulative = np.cumsum(counts)
+        targets = cumulative[-1] * np.arange(1, binCount) / binCount
+        cuts = np.unique(np.searchsorted(cumulative, targets))
+        cuts = cuts[cuts < unique.shape[0] - 1]
+        return (unique[cuts] + unique[cuts + 1]) / 2
+
+    def getThresholds(self, attributeIndex: int) -> np.ndarray:
+        """
+        Accessor for the thresholds between the bins of a continuous attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        np.ndarray
+            Thresholds of the attribute, None if the attribute is not continuous.
+        """
+        return self.__thresholds[attributeIndex]
+
+    def __rowsOf(self, data: InstanceList) -> np.ndarray:
+        """
+        Returns the indexes in the training set of the instances of the given list, None if the list is neither the
+        training set nor a view of it.
+        """
+        if data is self.__data:
+            return np.arange(data.size())
+        if isinstance(data, InstanceListView) and not data.isMaterialized() and data.getParent() is self.__data:
+            return data.getIndexes()
+        return None
+
+    def continuousSplits(self,
+                         data: InstanceList,
+                         attributeIndex: int) -> list:
+        """
+        Finds the candidate splits of a continuous attribute for the instances of a node. The class counts of the
+        instances are accumulated into the bins of the attribute, and a split between two non-empty bins is evaluated
+        from the cumulative counts, so the cost is linear in the number of instances and bins. As in the exact search,
+        the split value is the midpoint of the largest value of the node below the split and the smallest value of the
+        node above it. Instances with weights count as many times as their weights.
+
+        PARAMETERS
+        ----------
+        data : InstanceList
+            Instances of the node.
+        attributeIndex : int
+            Index of the continuous attribute.
+
+        RETURNS
+        -------
+        list
+            (entropy, split value) pairs of the candidate splits in increasing order of split value, the entropy being
+            the weighted average of the entropies of the class distributions of both sides.
+        """
+        thresholds = self.__thresholds[attributeIndex]
+        rows = self.__rowsOf(data)
+        if rows is not None:
+            values = self.__values[attributeIndex][rows]
+            bins = self.__bins[attributeIndex][rows]
+            class_codes = self.__class_codes[rows]
+            class_count = self.__class_count
+        else:
+            values = np.array([instance.getAttribute(attributeIndex).getValue() for instance in data],
+                              dtype=np.float64)
+            bins = np.searchsorted(thresholds, values, side="right")
+            class_codes = data.getClassLabelCodes()
+            class_count = len(data.getClassLabelNames())
+        weights = data.getWeights()
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        bin_count = thresholds.shape[0] + 1
+        counts = np.bincount(bins * class_count + class_codes, weights=weights,
+                             minlength=bin_count * class_count).reshape(bin_count, class_count)
+        non_empty = np.flatnonzero(counts.sum(axis=1) > 0)
+        if non_empty.shape[0] < 2:
+            return []
+        left = np.cumsum(counts, axis=0)[non_empty[:-1]]
+        right = left[-1] + counts[non_empty[-1]] - left
+        total = left[0].sum() + right[0].sum()
+        entropies = (SplitEntropy.weightedEntropies(left) + SplitEntropy.weightedEntropies(right)) / total
+        largest = np.full(bin_count, -np.inf)
+        np.maximum.at(largest, bins, values)
+        smallest = np.full(bin_count, np.inf)
+        np.minimum.at(smallest, bins, values)
+        split_values = (largest[non_empty[:-1]] + smallest[non_empty[1:]]) / 2
+        return list(zip(entropies.tolist(), split_values.tolist()))
@@ -0,0 +1,118 @@
+import numpy as np
+
+
+class SplitEntropy(object):
+
+    @staticmethod
+    def weightedEntropies(counts: np.ndarray) -> np.ndarray:
+        """
+        Finds, for each row of a table of class counts, the entropy of its class distribution multiplied by its total
+        count, that is the contribution of the row to the entropy of a split.
+
+        PARAMETERS
+        ----------
+        counts : np.ndarray
+            Class counts, a row for each part of the data.
+
+        RETURNS
+        -------
+        np.ndarray
+            Entropy of each row times its total count, zero for empty rows.
+        """
+        sums = counts.sum(axis=1)
+        probabilities = counts / np.maximum(sums, 1e-300)[:, np.newaxis]
+        logarithms = np.log2(np.where(probabilities > 0, probabilities, 1.0))
+        return -(probabilities * logarithms).sum(axis=1) * sums
+
+    @staticmethod
+    def continuousSplits(values: np.ndarray,
+                         classCodes: np.ndarray,
+                         weights=None) -> list:
+        """
+        Finds the entropies of all candidate splits of a continuous attribute at once. The instances are given in
+        increasing order of their values, and a split lies between each pair of consecutive distinct values. The class
+        counts of each run of equal values are accumulated with a single bincount, and their cumulative sums give the
+        class counts of both sides of every split, so no distribution is built or scanned for a single split.
+
+        PARAMETERS
+        ----------
+        values : np.ndarray
+            Values of the attribute, sorted in increasing order.
+        classCodes : np.ndarray
+            Class label codes of the instances in the same order.
+        weights
+            Weights of the instances in the same order, None if every instance counts once.
+
+        RETURNS
+        -------
+        list
+            (entropy, split value) pairs of the candidate splits in increasing order of split value, the entropy being
+            the weighted average of the entropies of the class distributions of both sides, and the split value the
+            midpoint of the values on both sides.
+        """
+        if values.shape[0] < 2:
+            return []
+        starts = np.flatnonzero(values[1:] != values[:-1]) + 1
+        if starts.shape[0] == 0:
+            return []
+        runs = np.zeros(values.shape[0], dtype=np.intp)
+        runs[starts] = 1
+        runs = np.cumsum(runs)
+        class_count = int(classCodes.max()) + 1
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        counts = np.bincount(runs * class_count + classCodes, weights=weights,
+                             minlength=(starts.shape[0] + 1) * class_count).reshape(-1, class_count)
+        below = np.cumsum(counts, axis=0)[:-1]
+        above = below[-1] + counts[-1] - below
+        total = below[0].sum() + above[0].sum()
+        entropies = SplitEntropy.weightedEntropies(np.concatenate((below, above)))
+        entropies = (entropies[:starts.shape[0]] + entropies[starts.shape[0]:]) / total
+        split_values = (values[starts - 1] + values[starts]) / 2
+        return list(zip(entropies.tolist(), split_values.tolist()))
+
+    @staticmethod
+    def discreteEntropy(table: np.ndarray) -> float:
+        """
+        Finds the entropy of the split of the data into the values of a discrete attribute, from the value by class
+        count table of the attribute.
+
+        PARAMETERS
+        ----------
+        table : np.ndarray
+            Class counts of the instances with each value of the attribute, a row for each value.
+
+        RETURNS
+        -------
+        float
+            Weighted average of the entropies of the class distributions of the values.
+        """
+        return float(SplitEntropy.weightedEntropies(table).sum() / table.sum())
+
+    @staticmethod
+    def discreteIndexedSplits(table: np.ndarray,
+                              valueCount: int) -> list:
+        """
+        Finds the entropies of the splits of the data into the instances with a value of a discrete indexed attribute
+        and the rest, for all values at once, from the value by class count table of the attribute.
+
+        PARAMETERS
+        ----------
+        table : np.ndarray
+            Class counts of the instances with each value of the attribute, a row for each value.
+        valueCount : int
+            Number of leading rows of the table whose values are candidate splits.
+
+        RETURNS
+        -------
+        list
+            (entropy, value) pairs of the values having instances in increasing order of value, the entropy being the
+            weighted average of the entropies of the class distributions of the instances with the value and the rest.
+        """
+        values = np.flatnonzero(table[:valueCount].sum(axis=1) > 0)
+        if values.shape[0] == 0:
+            return []
+        rows = table[values]
+        entropies = SplitEntropy.weightedEntropies(np.concatenate((rows, table.sum(axis=0) - rows)))
+        entropies = (entropies[:values.shape[0]] + entropies[values.shape[0]:]) / table.sum()
+        return list(zip(entropies.tolist(), values.tolist()))
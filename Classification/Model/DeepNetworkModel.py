@@ -1,3 +1,4 @@
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.NeuralNetworkModel import NeuralNetworkModel
 from Classification.Parameter.ActivationFunction import ActivationFunction
@@ -27,7 +28,8 @@ class DeepNetworkModel(NeuralNetworkModel):
         sigmoid function and stores the result as hidden and add bias. Then updates weights and at the end it compares
         the performance of these weights with validation set. It updates the bestClassificationPerformance and
         bestWeights according to the current situation. At the end it updates the learning rate via etaDecrease value
-        and finishes with clearing the weights.
+        and finishes with clearing the weights. The update for an instance with a weight is scaled with its weight,
+        and instances with weight zero are skipped.
 
         PARAMETERS
         ----------
@@ -51,6 +53,9 @@ class DeepNetworkModel(NeuralNetworkModel):
         for i in range(epoch):
             trainSet.shuffle(parameters.getSeed())
             for j in range(trainSet.size()):
+                if trainSet.getWeight(j) == 0:
+                    continue
+                rate = learning_rate * trainSet.getWeight(j)
                 self.createInputVector(trainSet.get(j))
                 hidden.clear()
                 hidden_biased.clear()
@@ -82,11 +87,11 @@ class DeepNetworkModel(NeuralNetworkModel):
                         activation_derivative = hidden
                     tmp_hidden = tmp_h.elementProduct(activation_derivative)
                     if k == 0:
-                        delta_weights.insert(0, Matrix(tmp_hidden, self.x))
+                        delta_weights.insert(0, Matrix(tmp_hidden, self.denseInputVector()))
                     else:
                         delta_weights.insert(0, Matrix(tmp_hidden, hidden_biased[k - 1]))
                 for k in range(len(self.__weights)):
-                    delta_weights[k].multiplyWithConstant(learning_rate)
+                    delta_weights[k].multiplyWithConstant(rate)
                     self.__weights[k].add(delta_weights[k])
             current_classification_performance = self.testClassifier(validationSet)
             if current_classification_performance.getAccuracy() > best_classification_performance.getAccuracy():
@@ -98,7 +103,7 @@ class DeepNetworkModel(NeuralNetworkModel):
             self.__weights.append(m)
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.loadClassLabels(inputFile)
         self.__hidden_layer_size = int(inputFile.readline().strip())
         self.__weights = list()
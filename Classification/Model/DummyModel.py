@@ -1,3 +1,4 @@
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
@@ -21,15 +22,28 @@ class DummyModel(Model):
         self.distribution = trainSet.classDistribution()
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.distribution = Model.loadClassDistribution(inputFile)
         inputFile.close()
 
+    def constructor3(self, distribution: DiscreteDistribution):
+        """
+        Constructor which sets the distribution to the given class distribution.
+
+        PARAMETERS
+        ----------
+        distribution : DiscreteDistribution
+            Class distribution of the training data.
+        """
+        self.distribution = distribution
+
     def __init__(self, trainSet: object):
         if isinstance(trainSet, InstanceList):
             self.constructor1(trainSet)
         elif isinstance(trainSet, str):
             self.constructor2(trainSet)
+        elif isinstance(trainSet, DiscreteDistribution):
+            self.constructor3(trainSet)
 
     def predict(self, instance: Instance) -> str:
         """
@@ -2,6 +2,7 @@ from io import TextIOWrapper
 
 from Math.DiscreteDistribution import DiscreteDistribution
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.DistanceMetric.DistanceMetric import DistanceMetric
 from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
 from Classification.Instance.Instance import Instance
@@ -35,7 +36,7 @@ class KMeansModel(GaussianModel):
 
     def constructor2(self, fileName: str):
         self.__distance_metric = EuclidianDistance()
-        inputFile = open(fileName, 'r')
+        inputFile = CompressedFile.open(fileName, 'r')
         self.loadPriorDistribution(inputFile)
         self.__class_means = self.loadInstanceList(inputFile)
         inputFile.close()
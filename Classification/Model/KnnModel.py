@@ -1,6 +1,7 @@
 from functools import cmp_to_key
 from io import TextIOWrapper
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.DistanceMetric.DistanceMetric import DistanceMetric
 from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
 from Classification.Instance.CompositeInstance import CompositeInstance
@@ -37,7 +38,7 @@ class KnnModel(Model):
 
     def constructor2(self, fileName: str):
         self.__distance_metric = EuclidianDistance()
-        inputFile = open(fileName, 'r')
+        inputFile = CompressedFile.open(fileName, 'r')
         self.__k = int(inputFile.readline().strip())
         self.__data = self.loadInstanceList(inputFile)
         inputFile.close()
@@ -77,6 +78,8 @@ class KnnModel(Model):
         nearest_neighbors = self.nearestNeighbors(instance)
         if isinstance(instance, CompositeInstance) and nearest_neighbors.size() == 0:
             predicted_class = instance.getPossibleClassLabels()[0]
+        elif nearest_neighbors.getWeights() is not None:
+            predicted_class = nearest_neighbors.classDistribution().getMaxItem()
         else:
             predicted_class = Model.getMaximum(nearest_neighbors.getClassLabels())
         return predicted_class
@@ -101,7 +104,9 @@ class KnnModel(Model):
         The nearestNeighbors method takes an Instance as an input. First it gets the possible class labels, then loops
         through the data InstanceList and creates new list of KnnInstances and adds the corresponding data with
         the distance between data and given instance. After sorting this newly created list, it loops k times and
-        returns the first k instances as an InstanceList.
+        returns the first k instances as an InstanceList. If the data has weights, an instance with weight w stands for
+        w neighbors, and the nearest instances are taken until their weights add up to k; the returned list has the
+        weights of the neighbors, the last one's cut so that they add up to k.
 
         PARAMETERS
         ----------
@@ -115,6 +120,7 @@ class KnnModel(Model):
         """
         result = InstanceList()
         instances = []
+        weights = []
         possible_class_labels = []
         if isinstance(instance, CompositeInstance):
             possible_class_labels = instance.getPossibleClassLabels()
@@ -123,6 +129,19 @@ class KnnModel(Model):
                     i).getClassLabel() in possible_class_labels:
                 instances.append(KnnInstance(self.__data.get(i), self.__distance_metric.distance(self.__data.get(i),
                                                                                                  instance)))
+                weights.append(self.__data.getWeight(i))
+        if self.__data.getWeights() is not None:
+            key = cmp_to_key(self.makeComparator())
+            neighbor_weights = []
+            remaining = self.__k
+            for i in sorted(range(len(instances)), key=lambda j: key(instances[j])):
+                if remaining <= 0:
+                    break
+                result.add(instances[i].instance)
+                neighbor_weights.append(min(weights[i], remaining))
+                remaining = remaining - weights[i]
+            result.setWeights(neighbor_weights)
+            return result
         instances.sort(key=cmp_to_key(self.makeComparator()))
         for i in range(min(self.__k, len(instances))):
             result.add(instances[i].instance)
@@ -2,7 +2,9 @@ from io import TextIOWrapper
 
 from Math.DiscreteDistribution import DiscreteDistribution
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseInstance import SparseInstance
 from Classification.Model.GaussianModel import GaussianModel
 
 
@@ -31,7 +33,7 @@ class LdaModel(GaussianModel):
         self.w0 = w0
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         size = self.loadPriorDistribution(inputFile)
         self.loadWandW0(inputFile, size)
         inputFile.close()
@@ -61,7 +63,7 @@ class LdaModel(GaussianModel):
                         Ci: str) -> float:
         """
         The calculateMetric method takes an Instance and a String as inputs. It returns the dot product of given
-        Instance and wi plus w0i.
+        Instance and wi plus w0i. For a sparse instance, only its non-zero values are multiplied.
 
         PARAMETERS
         ----------
@@ -75,7 +77,12 @@ class LdaModel(GaussianModel):
         float
             The dot product of given Instance and wi plus w0i.
         """
-        xi = instance.toVector()
         wi = self.w[Ci]
         w0i = self.w0[Ci]
+        if isinstance(instance, SparseInstance):
+            result = 0
+            for index, value in instance.sparseContinuousAttributes():
+                result += wi.getValue(index) * value
+            return result + w0i
+        xi = instance.toVector()
         return wi.dotProduct(xi) + w0i
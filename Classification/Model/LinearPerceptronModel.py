@@ -1,5 +1,6 @@
 from Math.Matrix import Matrix
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.NeuralNetworkModel import NeuralNetworkModel
 from Classification.Parameter.LinearPerceptronParameter import LinearPerceptronParameter
@@ -22,7 +23,8 @@ class LinearPerceptronModel(NeuralNetworkModel):
         Constructor that takes InstanceLists as trainsSet and validationSet. Initially it allocates layer weights,
         then creates an input vector by using given trainSet and finds error. Via the validationSet it finds the
         classification performance and at the end it reassigns the allocated weight Matrix with the matrix that has the
-        best accuracy.
+        best accuracy. The update for an instance with a weight is scaled with its weight, and instances with weight
+        zero are skipped.
 
         PARAMETERS
         ----------
@@ -44,11 +46,11 @@ class LinearPerceptronModel(NeuralNetworkModel):
         for i in range(epoch):
             trainSet.shuffle(parameters.getSeed())
             for j in range(trainSet.size()):
+                if trainSet.getWeight(j) == 0:
+                    continue
                 self.createInputVector(trainSet.get(j))
                 r_minus_y = self.calculateRMinusY(trainSet.get(j), self.x, self.W)
-                delta_w = Matrix(r_minus_y, self.x)
-                delta_w.multiplyWithConstant(learning_rate)
-                self.W.add(delta_w)
+                self.updateInputWeights(self.W, r_minus_y, learning_rate * trainSet.getWeight(j))
             current_classification_performance = self.testClassifier(validationSet)
             if current_classification_performance.getAccuracy() > best_classification_performance.getAccuracy():
                 best_classification_performance = current_classification_performance
@@ -57,7 +59,7 @@ class LinearPerceptronModel(NeuralNetworkModel):
         self.W = best_w
 
     def constructor3(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.loadClassLabels(inputFile)
         self.W = self.loadMatrix(inputFile)
         inputFile.close()
@@ -78,4 +80,4 @@ class LinearPerceptronModel(NeuralNetworkModel):
         """
         The calculateOutput method calculates the Matrix y by multiplying Matrix W with Vector x.
         """
-        self.y = self.W.multiplyWithVectorFromRight(self.x)
+        self.y = self.multiplyWeights(self.W, self.x)
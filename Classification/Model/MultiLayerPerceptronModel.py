@@ -1,6 +1,7 @@
 from Math.Matrix import Matrix
 from Math.Vector import Vector
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.LinearPerceptronModel import LinearPerceptronModel
 from Classification.Parameter.ActivationFunction import ActivationFunction
@@ -40,7 +41,8 @@ class MultiLayerPerceptronModel(LinearPerceptronModel):
         A constructor that takes InstanceLists as trainsSet and validationSet. It  sets the NeuralNetworkModel nodes
         with given InstanceList then creates an input vector by using given trainSet and finds error. Via the
         validationSet it finds the classification performance and reassigns the allocated weight Matrix with the matrix
-        that has the best accuracy and the Matrix V with the best Vector input.
+        that has the best accuracy and the Matrix V with the best Vector input. The update for an instance with a
+        weight is scaled with its weight, and instances with weight zero are skipped.
 
         PARAMETERS
         ----------
@@ -63,6 +65,9 @@ class MultiLayerPerceptronModel(LinearPerceptronModel):
         for i in range(epoch):
             trainSet.shuffle(parameters.getSeed())
             for j in range(trainSet.size()):
+                if trainSet.getWeight(j) == 0:
+                    continue
+                rate = learning_rate * trainSet.getWeight(j)
                 self.createInputVector(trainSet.get(j))
                 hidden = self.calculateHidden(self.x, self.W, self.__activation_function)
                 hidden_biased = hidden.biased()
@@ -81,11 +86,9 @@ class MultiLayerPerceptronModel(LinearPerceptronModel):
                     hidden.reluDerivative()
                     activation_derivative = hidden
                 tmp_hidden = tmp_h.elementProduct(activation_derivative)
-                delta_w = Matrix(tmp_hidden, self.x)
-                delta_v.multiplyWithConstant(learning_rate)
+                delta_v.multiplyWithConstant(rate)
                 self.__V.add(delta_v)
-                delta_w.multiplyWithConstant(learning_rate)
-                self.W.add(delta_w)
+                self.updateInputWeights(self.W, tmp_hidden, rate)
             current_classification_performance = self.testClassifier(validationSet)
             if current_classification_performance.getAccuracy() > best_classification_performance.getAccuracy():
                 best_classification_performance = current_classification_performance
@@ -96,7 +99,7 @@ class MultiLayerPerceptronModel(LinearPerceptronModel):
         self.__V = best_v
 
     def constructor3(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.loadClassLabels(inputFile)
         self.W = self.loadMatrix(inputFile)
         self.__V = self.loadMatrix(inputFile)
@@ -1,5 +1,6 @@
 from Math.DiscreteDistribution import DiscreteDistribution
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.Instance import Instance
 from Classification.Model.GaussianModel import GaussianModel
 import math
@@ -23,7 +24,7 @@ class NaiveBayesModel(GaussianModel):
         self.prior_distribution = priorDistribution
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         size = self.loadPriorDistribution(inputFile)
         self.__class_means = self.loadVectors(inputFile, size)
         self.__class_deviations = self.loadVectors(inputFile, size)
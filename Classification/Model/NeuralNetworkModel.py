@@ -6,6 +6,7 @@ from Math.Vector import Vector
 
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseInstance import SparseInstance
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.ValidatedModel import ValidatedModel
 
@@ -16,9 +17,11 @@ from Classification.Parameter.ActivationFunction import ActivationFunction
 
 class NeuralNetworkModel(ValidatedModel):
     class_labels: list
+    class_label_index: dict
     K: int
     d: int
     x: Vector
+    x_nonzero: list
     y: Vector
     r: Vector
 
@@ -37,6 +40,7 @@ class NeuralNetworkModel(ValidatedModel):
         """
         if trainSet is not None:
             self.class_labels = trainSet.getDistinctClassLabels()
+            self.class_label_index = {class_label: i for i, class_label in enumerate(self.class_labels)}
             self.K = len(self.class_labels)
             self.d = trainSet.get(0).continuousAttributeSize()
 
@@ -100,15 +104,94 @@ class NeuralNetworkModel(ValidatedModel):
     def createInputVector(self, instance: Instance):
         """
         The createInputVector method takes an Instance as an input. It converts given Instance to the Vector
-        and insert 1.0 to the first element.
+        and insert 1.0 to the first element. For a sparse instance, the input vector is built from 1.0 and the
+        non-zero continuous values only, without the dense vector of the instance, and the indexes of its elements in
+        the dense input vector are stored, so that the input vector is multiplied with its non-zero elements only.
 
         PARAMETERS
         ----------
         instance : Instance
             Instance to insert 1.0.
         """
-        self.x = instance.toVector()
-        self.x.insert(0, 1.0)
+        if isinstance(instance, SparseInstance):
+            values = [1.0]
+            self.x_nonzero = [0]
+            for index, value in instance.sparseContinuousAttributes():
+                values.append(value)
+                self.x_nonzero.append(index + 1)
+            self.x = Vector(values)
+        else:
+            self.x = instance.toVector()
+            self.x.insert(0, 1.0)
+            self.x_nonzero = None
+
+    def denseInputVector(self) -> Vector:
+        """
+        Returns the input vector with all of its elements. The input vector of a sparse instance only has its non-zero
+        elements, the dense vector is built from them.
+
+        RETURNS
+        -------
+        Vector
+            Input vector with all of its elements.
+        """
+        if self.x_nonzero is None:
+            return self.x
+        values = [0.0] * (self.d + 1)
+        for j in range(len(self.x_nonzero)):
+            values[self.x_nonzero[j]] = self.x.getValue(j)
+        return Vector(values)
+
+    def multiplyWeights(self, weights: Matrix, input: Vector) -> Vector:
+        """
+        The multiplyWeights method multiplies the given weights Matrix with the given input Vector. If the input is
+        the input vector of a sparse instance, only the columns of its non-zero elements are multiplied.
+
+        PARAMETERS
+        ----------
+        weights : Matrix
+            Matrix to multiply with input Vector.
+        input : Vector
+            Vector to multiply weights.
+
+        RETURNS
+        -------
+        Vector
+            Result of the multiplication.
+        """
+        if input is not self.x or self.x_nonzero is None:
+            return weights.multiplyWithVectorFromRight(input)
+        result = Vector()
+        for i in range(weights.getRow()):
+            total = 0.0
+            for j in range(len(self.x_nonzero)):
+                total += self.x.getValue(j) * weights.getValue(i, self.x_nonzero[j])
+            result.add(total)
+        return result
+
+    def updateInputWeights(self, weights: Matrix, delta: Vector, learningRate: float):
+        """
+        The updateInputWeights method adds the outer product of the given delta Vector and the input vector, multiplied
+        with the learning rate, to the given weights Matrix. For a sparse instance, only the columns of the non-zero
+        elements of the input vector are updated.
+
+        PARAMETERS
+        ----------
+        weights : Matrix
+            Weights of the input layer.
+        delta : Vector
+            Vector to multiply with the input vector.
+        learningRate : float
+            Learning rate.
+        """
+        if self.x_nonzero is None:
+            delta_weights = Matrix(delta, self.x)
+            delta_weights.multiplyWithConstant(learningRate)
+            weights.add(delta_weights)
+        else:
+            for i in range(delta.size()):
+                for j in range(len(self.x_nonzero)):
+                    weights.addValue(i, self.x_nonzero[j], delta.getValue(i) * self.x.getValue(j) * learningRate)
 
     def calculateHidden(self, input: Vector, weights: Matrix, activationFunction: ActivationFunction) -> Vector:
         """
@@ -129,7 +212,7 @@ class NeuralNetworkModel(ValidatedModel):
         Vector
             Result of sigmoid function.
         """
-        z = weights.multiplyWithVectorFromRight(input)
+        z = self.multiplyWeights(weights, input)
         if activationFunction == ActivationFunction.SIGMOID:
             z.sigmoid()
         elif activationFunction == ActivationFunction.TANH:
@@ -196,8 +279,8 @@ class NeuralNetworkModel(ValidatedModel):
             Difference between newly created Vector and normalized output.
         """
         r = Vector()
-        r.initAllZerosExceptOne(self.K, self.class_labels.index(instance.getClassLabel()), 1.0)
-        o = weights.multiplyWithVectorFromRight(inputVector)
+        r.initAllZerosExceptOne(self.K, self.class_label_index[instance.getClassLabel()], 1.0)
+        o = self.multiplyWeights(weights, inputVector)
         y = self.normalizeOutput(o)
         return r.difference(y)
 
@@ -261,6 +344,7 @@ class NeuralNetworkModel(ValidatedModel):
         self.class_labels = list()
         for i in range(self.K):
             self.class_labels.append(inputFile.readline().strip())
+        self.class_label_index = {class_label: i for i, class_label in enumerate(self.class_labels)}
 
     def loadActivationFunction(self, inputFile: TextIOWrapper):
         line = inputFile.readline().strip()
@@ -1,5 +1,6 @@
 from Math.DiscreteDistribution import DiscreteDistribution
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.Instance import Instance
 from Classification.Model.LdaModel import LdaModel
 
@@ -34,7 +35,7 @@ class QdaModel(LdaModel):
         self.w0 = w0
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         size = self.loadPriorDistribution(inputFile)
         self.loadWandW0(inputFile, size)
         self.__W = dict()
@@ -1,3 +1,4 @@
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.Model.Model import Model
@@ -26,7 +27,7 @@ class RandomModel(Model):
         random.seed(seed)
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         self.__seed = int(inputFile.readline().strip())
         random.seed(self.__seed)
         size = int(inputFile.readline().strip())
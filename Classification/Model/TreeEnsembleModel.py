@@ -1,5 +1,6 @@
 from Math.DiscreteDistribution import DiscreteDistribution
 
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Instance.Instance import Instance
 from Classification.Model.DecisionTree.DecisionNode import DecisionNode
 from Classification.Model.DecisionTree.DecisionTree import DecisionTree
@@ -22,7 +23,7 @@ class TreeEnsembleModel(Model):
         self.__forest = forest
 
     def constructor2(self, fileName: str):
-        inputFile = open(fileName, mode='r', encoding='utf-8')
+        inputFile = CompressedFile.open(fileName, mode='r', encoding='utf-8')
         number_of_trees = int(inputFile.readline().strip())
         self.__forest = list()
         for i in range(number_of_trees):
@@ -8,7 +8,7 @@ class ValidatedModel(Model):
     def testClassifier(self, data: InstanceList) -> ClassificationPerformance:
         """
         The testClassifier method takes an InstanceList as an input and returns an accuracy value as
-        ClassificationPerformance.
+        ClassificationPerformance. An instance with a weight counts as many times as its weight.
 
         PARAMETERS
         ----------
@@ -20,9 +20,9 @@ class ValidatedModel(Model):
         ClassificationPerformance
             Accuracy value as ClassificationPerformance.
         """
-        total = data.size()
+        total = data.totalWeight()
         count = 0
         for i in range(data.size()):
             if data.get(i).getClassLabel() == self.predict(data.get(i)):
-                count = count + 1
+                count = count + data.getWeight(i)
         return ClassificationPerformance(count / total)
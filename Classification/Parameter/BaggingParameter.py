@@ -4,8 +4,14 @@ from Classification.Parameter.Parameter import Parameter
 class BaggingParameter(Parameter):
 
     ensemble_size: int
+    histogram_bins: int
+    processes: int
 
-    def __init__(self, seed: int, ensembleSize: int):
+    def __init__(self,
+                 seed: int,
+                 ensembleSize: int,
+                 histogramBins: int = 0,
+                 processes: int = 1):
         """
         Parameters of the bagging trees algorithm.
 
@@ -15,9 +21,16 @@ class BaggingParameter(Parameter):
             Seed is used for random number generation.
         ensembleSize : int
             The number of trees in the bagged forest.
+        histogramBins : int
+            Number of quantile bins of the continuous attributes for histogram based split finding, 0 for the exact
+            split search.
+        processes : int
+            Number of processes growing the trees.
         """
         super().__init__(seed)
         self.ensemble_size = ensembleSize
+        self.histogram_bins = histogramBins
+        self.processes = processes
 
     def getEnsembleSize(self) -> int:
         """
@@ -29,3 +42,25 @@ class BaggingParameter(Parameter):
             The ensemble size.
         """
         return self.ensemble_size
+
+    def getHistogramBins(self) -> int:
+        """
+        Accessor for the histogram bins.
+
+        RETURNS
+        -------
+        int
+            Number of quantile bins of the continuous attributes, 0 for the exact split search.
+        """
+        return self.histogram_bins
+
+    def getProcesses(self) -> int:
+        """
+        Accessor for the processes.
+
+        RETURNS
+        -------
+        int
+            Number of processes growing the trees.
+        """
+        return self.processes
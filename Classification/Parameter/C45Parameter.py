@@ -5,11 +5,13 @@ class C45Parameter(Parameter):
 
     __prune: bool
     __cross_validation_ratio: float
+    __histogram_bins: int
 
     def __init__(self,
                  seed: int,
                  prune: bool,
-                 crossValidationRatio: float):
+                 crossValidationRatio: float,
+                 histogramBins: int = 0):
         """
         Parameters of the C4.5 univariate decision tree classifier.
 
@@ -21,10 +23,14 @@ class C45Parameter(Parameter):
             Boolean value for prune.
         crossValidationRatio : float
             Double value for cross crossValidationRatio ratio.
+        histogramBins : int
+            Number of quantile bins of the continuous attributes for histogram based split finding, 0 for the exact
+            split search.
         """
         super().__init__(seed)
         self.__prune = prune
         self.__cross_validation_ratio = crossValidationRatio
+        self.__histogram_bins = histogramBins
 
     def isPrune(self) -> bool:
         """
@@ -47,3 +53,14 @@ class C45Parameter(Parameter):
             crossValidationRatio.
         """
         return self.__cross_validation_ratio
+
+    def getHistogramBins(self) -> int:
+        """
+        Accessor for the histogramBins.
+
+        RETURNS
+        -------
+        int
+            Number of quantile bins of the continuous attributes, 0 for the exact split search.
+        """
+        return self.__histogram_bins
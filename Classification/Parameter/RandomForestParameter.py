@@ -8,7 +8,9 @@ class RandomForestParameter(BaggingParameter):
     def __init__(self,
                  seed: int,
                  ensembleSize: int,
-                 attributeSubsetSize: int):
+                 attributeSubsetSize: int,
+                 histogramBins: int = 0,
+                 processes: int = 1):
         """
         Parameters of the random forest classifier.
 
@@ -20,8 +22,13 @@ class RandomForestParameter(BaggingParameter):
             The number of trees in the bagged forest.
         attributeSubsetSize : int
             Integer value for the size of attribute subset.
+        histogramBins : int
+            Number of quantile bins of the continuous attributes for histogram based split finding, 0 for the exact
+            split search.
+        processes : int
+            Number of processes growing the trees.
         """
-        super().__init__(seed, ensembleSize)
+        super().__init__(seed, ensembleSize, histogramBins, processes)
         self.__attribute_subset_size = attributeSubsetSize
 
     def getAttributeSubsetSize(self) -> int:
@@ -1,4 +1,6 @@
 from __future__ import annotations
+
+import numpy as np
 from DataStructure.CounterHashMap import CounterHashMap
 
 
@@ -21,13 +23,14 @@ class ConfusionMatrix:
 
     def classify(self,
                  actualClass: str,
-                 predictedClass: str):
+                 predictedClass: str,
+                 count: int = 1):
         """
         The classify method takes two Strings; actual class and predicted class as inputs. If the matrix dictionary
         contains given actual class String as a key, it then assigns the corresponding object of that key to a
         CounterHashMap, if not it creates a new CounterHashMap. Then, it puts the given predicted class String to the
-        counterHashMap and also put this counterHashMap to the matrix dictionary together with the given actual class
-        String.
+        counterHashMap count times and also put this counterHashMap to the matrix dictionary together with the given
+        actual class String.
 
         PARAMETERS
         ----------
@@ -35,14 +38,53 @@ class ConfusionMatrix:
             String input actual class.
         predictedClass : str
             String input predicted class.
+        count : int
+            Number of instances classified, the weight of the instance.
         """
         if actualClass in self.__matrix:
             counter_hash_map = self.__matrix[actualClass]
         else:
             counter_hash_map = CounterHashMap()
-        counter_hash_map.put(predictedClass)
+        if count == 1:
+            counter_hash_map.put(predictedClass)
+        else:
+            counter_hash_map.putNTimes(predictedClass, count)
         self.__matrix[actualClass] = counter_hash_map
 
+    def classifyCodes(self,
+                      actualCodes: np.ndarray,
+                      predictedCodes: np.ndarray,
+                      classLabels: list,
+                      weights: list = None):
+        """
+        Classifies many instances at once from the integer codes of their actual and predicted classes. The pairs of
+        codes are counted with NumPy, and each distinct pair is classified once with its count, in the order of the
+        first occurrence of the pairs, so the matrix is the one classifying the instances one by one gives.
+
+        PARAMETERS
+        ----------
+        actualCodes : np.ndarray
+            Codes of the actual classes of the instances.
+        predictedCodes : np.ndarray
+            Codes of the predicted classes of the instances.
+        classLabels : list
+            Class labels of the codes.
+        weights : list
+            Weights of the instances, None if every instance counts once.
+        """
+        if len(actualCodes) == 0:
+            return
+        pairs = np.asarray(actualCodes, dtype=np.int64) * len(classLabels) + np.asarray(predictedCodes, dtype=np.int64)
+        unique, first, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+        if weights is None:
+            counts = np.bincount(inverse.reshape(-1)).tolist()
+        else:
+            counts = np.bincount(inverse.reshape(-1), weights=np.asarray(weights, dtype=np.float64)).tolist()
+        for index in np.argsort(first, kind="stable").tolist():
+            pair = int(unique[index])
+            self.classify(classLabels[pair // len(classLabels)], classLabels[pair % len(classLabels)],
+                          int(counts[index]))
+
     def addConfusionMatrix(self, confusionMatrix: ConfusionMatrix):
         """
         The addConfusionMatrix method takes a ConfusionMatrix as an input and loops through actual classes of that
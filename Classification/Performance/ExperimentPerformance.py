@@ -1,4 +1,5 @@
 from __future__ import annotations
+from Classification.DataSet.CompressedFile import CompressedFile
 from Classification.Performance.Performance import Performance
 from Classification.Performance.ClassificationPerformance import (
     ClassificationPerformance,
@@ -44,7 +45,7 @@ class ExperimentPerformance:
             String input.
         """
         self.__contains_details = False
-        inputFile = open(fileName, "r", encoding="utf8")
+        inputFile = CompressedFile.open(fileName, "r", encoding="utf8")
         lines = inputFile.readlines()
         inputFile.close()
         for line in lines:
@@ -0,0 +1,74 @@
+import time
+import tracemalloc
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+def readLinesLoader(definition: DataDefinition, separator: str, fileName: str) -> list:
+    """
+    Reference loader that reads the whole file with readlines and checks the attribute type of every cell, as the
+    InstanceList constructor used to do. Used as the baseline of the benchmark.
+    """
+    result = []
+    file = open(fileName, 'r', encoding='utf8')
+    lines = file.readlines()
+    file.close()
+    for line in lines:
+        attribute_list = line.strip().split(separator)
+        if len(attribute_list) == definition.attributeCount() + 1:
+            current = Instance(attribute_list[len(attribute_list) - 1])
+            for i in range(len(attribute_list) - 1):
+                if definition.getAttributeType(i) is AttributeType.DISCRETE:
+                    current.addAttribute(DiscreteAttribute(attribute_list[i]))
+                elif definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                    current.addAttribute(ContinuousAttribute(float(attribute_list[i])))
+            result.append(current)
+    return result
+
+
+def measure(loader, repeat: int):
+    """
+    Returns the best wall clock time of repeat runs of the loader, and the peak traced memory of one more run.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    tracemalloc.start()
+    loader()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(repeat: int = 3):
+    attributeTypes = []
+    for i in range(6):
+        if i % 2 == 0:
+            attributeTypes.append(AttributeType.DISCRETE)
+        else:
+            attributeTypes.append(AttributeType.CONTINUOUS)
+    dataSets = [("chess", DataDefinition(attributeTypes), "../datasets/chess.data"),
+                ("nursery", DataDefinition(8 * [AttributeType.DISCRETE]), "../datasets/nursery.data")]
+    print("%-10s %-22s %10s %14s %12s" % ("dataset", "loader", "seconds", "rows/second", "peak MB"))
+    for name, definition, fileName in dataSets:
+        rows = InstanceList(definition, ",", fileName).size()
+        loaders = [("readlines", lambda: readLinesLoader(definition, ",", fileName)),
+                   ("InstanceList", lambda: InstanceList(definition, ",", fileName)),
+                   ("ColumnarInstanceList", lambda: ColumnarInstanceList(definition, ",", fileName))]
+        for loaderName, loader in loaders:
+            seconds, peak = measure(loader, repeat)
+            print("%-10s %-22s %10.3f %14.0f %12.2f" % (name, loaderName, seconds, rows / seconds, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import gc
+import tracemalloc
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class DictAttribute(object):
+    """
+    Attribute with an instance dictionary, laid out as the attribute classes were before they declared __slots__.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+
+class DictInstance(object):
+    """
+    Instance with an instance dictionary, laid out as the Instance class was before it declared __slots__.
+    """
+
+    def __init__(self, classLabel: str, attributes: list):
+        self.classLabel = classLabel
+        self.attributes = attributes
+
+
+def dictLayoutLoader(definition: DataDefinition, separator: str, fileName: str) -> list:
+    """
+    Reference loader building one dictionary based attribute object per cell, with no sharing of equal discrete
+    values between rows. Used as the baseline of the report.
+    """
+    result = []
+    item_count = definition.attributeCount() + 1
+    input_file = open(fileName, 'r', encoding='utf8')
+    for line in input_file:
+        items = line.strip().split(separator)
+        if len(items) == item_count:
+            attributes = []
+            for i in range(item_count - 1):
+                if definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                    attributes.append(DictAttribute(float(items[i])))
+                else:
+                    attributes.append(DictAttribute(items[i]))
+            result.append(DictInstance(items[item_count - 1], attributes))
+    input_file.close()
+    return result
+
+
+def retainedMemory(loader) -> int:
+    """
+    Returns the number of bytes still allocated by the loader once it returns, that is, the memory held by the loaded
+    data set.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = loader()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main():
+    chessTypes = []
+    for i in range(6):
+        if i % 2 == 0:
+            chessTypes.append(AttributeType.DISCRETE)
+        else:
+            chessTypes.append(AttributeType.CONTINUOUS)
+    dataSets = [("iris", DataDefinition(4 * [AttributeType.CONTINUOUS]), "../datasets/iris.data"),
+                ("dermatology", DataDefinition(34 * [AttributeType.CONTINUOUS]), "../datasets/dermatology.data"),
+                ("car", DataDefinition(6 * [AttributeType.DISCRETE]), "../datasets/car.data"),
+                ("tictactoe", DataDefinition(9 * [AttributeType.DISCRETE]), "../datasets/tictactoe.data"),
+                ("nursery", DataDefinition(8 * [AttributeType.DISCRETE]), "../datasets/nursery.data"),
+                ("chess", DataDefinition(chessTypes), "../datasets/chess.data")]
+    print("%-12s %-22s %12s %14s %10s" % ("dataset", "layout", "retained MB", "bytes/row", "ratio"))
+    for name, definition, fileName in dataSets:
+        rows = InstanceList(definition, ",", fileName).size()
+        layouts = [("dict objects", lambda: dictLayoutLoader(definition, ",", fileName)),
+                   ("slots + shared values", lambda: InstanceList(definition, ",", fileName)),
+                   ("columnar", lambda: ColumnarInstanceList(definition, ",", fileName))]
+        baseline = None
+        for layoutName, loader in layouts:
+            retained = retainedMemory(loader)
+            if baseline is None:
+                baseline = retained
+            print("%-12s %-22s %12.2f %14.1f %10.2f" % (name, layoutName, retained / 1e6, retained / rows,
+                                                        retained / baseline))
+
+
+if __name__ == '__main__':
+    main()
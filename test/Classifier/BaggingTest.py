@@ -35,5 +35,23 @@ class BaggingTest(ClassifierTest):
         self.assertAlmostEqual(0.0, 100 * bagging.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
 
+    def test_TrainHistogram(self):
+        bagging = Bagging()
+        baggingParameter = BaggingParameter(1, 100, 8)
+        bagging.train(self.iris.getInstanceList(), baggingParameter)
+        self.assertAlmostEqual(0.0, 100 * bagging.test(self.iris.getInstanceList()).getErrorRate(), 2)
+        bagging.train(self.bupa.getInstanceList(), baggingParameter)
+        self.assertAlmostEqual(0.0, 100 * bagging.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+
+    def test_TrainParallel(self):
+        for dataSet in [self.bupa, self.car]:
+            sequential = Bagging()
+            sequential.train(dataSet.getInstanceList(), BaggingParameter(1, 10))
+            parallel = Bagging()
+            parallel.train(dataSet.getInstanceList(), BaggingParameter(1, 10, 0, 2))
+            for instance in dataSet.getInstanceList():
+                self.assertEqual(sequential.getModel().predictProbability(instance),
+                                 parallel.getModel().predictProbability(instance))
+
 if __name__ == '__main__':
     unittest.main()
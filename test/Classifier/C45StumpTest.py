@@ -1,6 +1,7 @@
 import unittest
 
 from Classification.Classifier.C45Stump import C45Stump
+from Classification.Parameter.C45Parameter import C45Parameter
 from test.Classifier.ClassifierTest import ClassifierTest
 
 
@@ -24,5 +25,14 @@ class C45StumpTest(ClassifierTest):
         self.assertAlmostEqual(80.92, 100 * c45Stump.test(self.chess.getInstanceList()).getErrorRate(), 2)
 
 
+    def test_TrainHistogram(self):
+        c45Stump = C45Stump()
+        c45Stump.train(self.iris.getInstanceList(), C45Parameter(1, True, 0.2, 1000))
+        self.assertAlmostEqual(33.33, 100 * c45Stump.test(self.iris.getInstanceList()).getErrorRate(), 2)
+        c45Stump.train(self.bupa.getInstanceList(), C45Parameter(1, True, 0.2, 1000))
+        self.assertAlmostEqual(36.81, 100 * c45Stump.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+        c45Stump.train(self.bupa.getInstanceList(), C45Parameter(1, True, 0.2, 8))
+        self.assertAlmostEqual(38.26, 100 * c45Stump.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+
 if __name__ == '__main__':
     unittest.main()
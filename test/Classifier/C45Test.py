@@ -1,6 +1,18 @@
 import unittest
 
+import numpy as np
+from Math.DiscreteDistribution import DiscreteDistribution
+
+from Classification.Attribute.AttributeType import AttributeType
 from Classification.Classifier.C45 import C45
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSetGenerator import DataSetGenerator
+from Classification.Model.DecisionTree.ContingencyTables import ContingencyTables
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.PresortedIndexLists import PresortedIndexLists
+from Classification.Model.DecisionTree.QuantileHistogram import QuantileHistogram
+from Classification.Model.DecisionTree.SplitEntropy import SplitEntropy
 from Classification.Parameter.C45Parameter import C45Parameter
 from test.Classifier.ClassifierTest import ClassifierTest
 
@@ -35,5 +47,71 @@ class C45Test(ClassifierTest):
         self.assertAlmostEqual(14.61, 100 * c45.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
 
+    def test_TrainHistogram(self):
+        c45 = C45()
+        c45Parameter = C45Parameter(1, True, 0.2, 8)
+        c45.train(self.iris.getInstanceList(), c45Parameter)
+        self.assertAlmostEqual(5.33, 100 * c45.test(self.iris.getInstanceList()).getErrorRate(), 2)
+        c45.train(self.bupa.getInstanceList(), c45Parameter)
+        self.assertAlmostEqual(42.03, 100 * c45.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+        c45.train(self.dermatology.getInstanceList(), c45Parameter)
+        self.assertAlmostEqual(4.37, 100 * c45.test(self.dermatology.getInstanceList()).getErrorRate(), 2)
+        histogram = QuantileHistogram(self.bupa.getInstanceList(), 8)
+        for i in range(6):
+            self.assertLessEqual(len(histogram.getThresholds(i)), 7)
+
+    def test_TrainPresorted(self):
+        for dataSet in [self.iris, self.bupa, self.dermatology, self.car, self.tictactoe]:
+            instances = [str(instance) for instance in dataSet.getInstanceList()]
+            presorted = DecisionTree(DecisionNode(dataSet.getInstanceList(),
+                                                  presorted=PresortedIndexLists(dataSet.getInstanceList())))
+            self.assertEqual(instances, [str(instance) for instance in dataSet.getInstanceList()])
+            exact = DecisionTree(DecisionNode(dataSet.getInstanceList()))
+            for instance in dataSet.getInstanceList():
+                self.assertEqual(exact.predict(instance), presorted.predict(instance))
+                self.assertEqual(exact.predictProbability(instance), presorted.predictProbability(instance))
+
+    def test_ContinuousSplits(self):
+        instanceList = self.bupa.getInstanceList()
+        for i in range(6):
+            instanceList.sortWrtAttribute(i)
+            values = np.array([instance.getAttribute(i).getValue() for instance in instanceList])
+            splits = SplitEntropy.continuousSplits(values, instanceList.getClassLabelCodes())
+            self.assertEqual(len(np.unique(values)) - 1, len(splits))
+            below = DiscreteDistribution()
+            above = instanceList.classDistribution()
+            k = 0
+            for entropy, splitValue in splits:
+                while instanceList.get(k).getAttribute(i).getValue() < splitValue:
+                    below.addItem(instanceList.get(k).getClassLabel())
+                    above.removeItem(instanceList.get(k).getClassLabel())
+                    k = k + 1
+                expected = (below.getSum() * below.entropy() + above.getSum() * above.entropy()) / instanceList.size()
+                self.assertAlmostEqual(expected, entropy, 12)
+
+    def test_ContingencyTables(self):
+        instanceList = self.car.getInstanceList()
+        tables = ContingencyTables(instanceList, [i for i in range(6)])
+        for i in range(6):
+            expected = 0.0
+            for distribution in instanceList.attributeClassDistribution(i):
+                expected += distribution.getSum() / instanceList.size() * distribution.entropy()
+            self.assertAlmostEqual(expected, SplitEntropy.discreteEntropy(tables.getTable(i)), 12)
+        generator = DataSetGenerator(DataDefinition(3 * [AttributeType.DISCRETE_INDEXED]), classCount=3, seed=2,
+                                     valueCount=6)
+        instanceList = generator.generate(500)
+        tables = ContingencyTables(instanceList, [0, 1, 2])
+        classDistribution = instanceList.classDistribution()
+        for i in range(3):
+            splits = SplitEntropy.discreteIndexedSplits(tables.getTable(i), 6)
+            self.assertEqual(6, len(splits))
+            for entropy, k in splits:
+                distribution = instanceList.discreteIndexedAttributeClassDistribution(i, k)
+                rest = instanceList.classDistribution()
+                rest.removeDistribution(distribution)
+                expected = (rest.entropy() * rest.getSum() + distribution.entropy() * distribution.getSum()) / \
+                    classDistribution.getSum()
+                self.assertAlmostEqual(expected, entropy, 12)
+
 if __name__ == '__main__':
     unittest.main()
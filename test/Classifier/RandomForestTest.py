@@ -35,5 +35,23 @@ class RandomForestTest(ClassifierTest):
         self.assertAlmostEqual(0.0, 100 * randomForest.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
 
+    def test_TrainHistogram(self):
+        randomForest = RandomForest()
+        randomForestParameter = RandomForestParameter(1, 100, 35, 8)
+        randomForest.train(self.iris.getInstanceList(), randomForestParameter)
+        self.assertAlmostEqual(0.0, 100 * randomForest.test(self.iris.getInstanceList()).getErrorRate(), 2)
+        randomForest.train(self.bupa.getInstanceList(), randomForestParameter)
+        self.assertAlmostEqual(0.0, 100 * randomForest.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+
+    def test_TrainParallel(self):
+        for dataSet in [self.bupa, self.car]:
+            sequential = RandomForest()
+            sequential.train(dataSet.getInstanceList(), RandomForestParameter(1, 10, 2))
+            parallel = RandomForest()
+            parallel.train(dataSet.getInstanceList(), RandomForestParameter(1, 10, 2, 0, 2))
+            for instance in dataSet.getInstanceList():
+                self.assertEqual(sequential.getModel().predictProbability(instance),
+                                 parallel.getModel().predictProbability(instance))
+
 if __name__ == '__main__':
     unittest.main()
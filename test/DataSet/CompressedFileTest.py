@@ -0,0 +1,77 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Classifier.C45 import C45
+from Classification.Classifier.NaiveBayes import NaiveBayes
+from Classification.DataSet.CompressedFile import CompressedFile
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSet import DataSet
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class CompressedFileTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def compress(self, fileName: str, module, compressedName: str) -> str:
+        compressedName = os.path.join(self.directory, compressedName)
+        with open(fileName, "rb") as input_file:
+            with module.open(compressedName, "wb") as output_file:
+                shutil.copyfileobj(input_file, output_file)
+        return compressedName
+
+    def test_CompressionOf(self):
+        self.assertIs(gzip, CompressedFile.compressionOf(self.compress("../../datasets/iris.data", gzip, "iris.gz")))
+        self.assertIs(bz2, CompressedFile.compressionOf(self.compress("../../datasets/iris.data", bz2, "iris")))
+        self.assertIs(lzma, CompressedFile.compressionOf(self.compress("../../datasets/iris.data", lzma, "iris.dat")))
+        self.assertIsNone(CompressedFile.compressionOf("../../datasets/iris.data"))
+        self.assertIs(gzip, CompressedFile.compressionOf(os.path.join(self.directory, "out.gz"), "w"))
+
+    def test_InstanceList(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.CONTINUOUS])
+        bupa = InstanceList(dataDefinition, ",", "../../datasets/bupa.data")
+        for module, name in [(gzip, "bupa.data.gz"), (bz2, "bupa.data.bz2"), (lzma, "bupa.data.xz"), (gzip, "bupa")]:
+            compressed = InstanceList(dataDefinition, ",", self.compress("../../datasets/bupa.data", module, name))
+            self.assertEqual(bupa.size(), compressed.size())
+            for i in range(bupa.size()):
+                self.assertEqual(bupa.get(i).__str__(), compressed.get(i).__str__())
+
+    def test_DataSet(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE])
+        car = DataSet(dataDefinition, ",", "../../datasets/car.data")
+        fileName = os.path.join(self.directory, "car.data.xz")
+        car.writeToFile(fileName)
+        self.assertIs(lzma, CompressedFile.compressionOf(fileName))
+        compressed = DataSet(dataDefinition, ",", fileName)
+        naiveBayes = NaiveBayes()
+        naiveBayes.train(compressed.getInstanceList())
+        self.assertAlmostEqual(12.91, 100 * naiveBayes.test(car.getInstanceList()).getErrorRate(), 2)
+        bupa = DataSet()
+        bupa.initWithFile("../../datasets/bupa.data")
+        compressed = DataSet()
+        compressed.initWithFile(self.compress("../../datasets/bupa.data", bz2, "bupa.txt"))
+        self.assertEqual(bupa.sampleSize(), compressed.sampleSize())
+
+    def test_LoadModel(self):
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        iris = InstanceList(dataDefinition, ",", "../../datasets/iris.data")
+        c45 = C45()
+        c45.loadModel(self.compress("../../models/c45-iris.txt", gzip, "c45-iris.txt.gz"))
+        self.assertAlmostEqual(4.00, 100 * c45.test(iris).getErrorRate(), 2)
+        naiveBayes = NaiveBayes()
+        naiveBayes.loadModel(self.compress("../../models/naiveBayes-iris.txt", bz2, "naiveBayes-iris"))
+        self.assertAlmostEqual(5.33, 100 * naiveBayes.test(iris).getErrorRate(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
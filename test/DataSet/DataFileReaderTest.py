@@ -0,0 +1,108 @@
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataFileReader import DataFileReader
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class DataFileReaderTest(unittest.TestCase):
+
+    def test_ReadInstances(self):
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        dataDefinition = DataDefinition(attributeTypes)
+        chess = InstanceList(dataDefinition, ",", "../../datasets/chess.data")
+        reader = DataFileReader(dataDefinition, ",", "../../datasets/chess.data", 1000)
+        chunks = list(reader.readInstances())
+        self.assertEqual(29, len(chunks))
+        instances = [instance for chunk in chunks for instance in chunk]
+        self.assertEqual(28056, len(instances))
+        for i in range(len(instances)):
+            self.assertEqual(chess.get(i).__str__(), instances[i].__str__())
+
+    def test_ReadColumns(self):
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        reader = DataFileReader(dataDefinition, ",", "../../datasets/iris.data", 100)
+        sizes = []
+        for columns, labels in reader.readColumns():
+            self.assertEqual(4, len(columns))
+            sizes.append(len(labels))
+        self.assertEqual([100, 50], sizes)
+
+    def test_SharedAttributes(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE])
+        car = InstanceList(dataDefinition, ",", "../../datasets/car.data")
+        for i in range(6):
+            attributes = set(id(car.get(j).getAttribute(i)) for j in range(car.size()))
+            self.assertEqual(len(car.getAttributeValueList(i)), len(attributes))
+        self.assertFalse(hasattr(car.get(0), "__dict__"))
+        self.assertFalse(hasattr(car.get(0).getAttribute(0), "__dict__"))
+
+    def test_IndexedValueLists(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE_INDEXED])
+        car = InstanceList(dataDefinition, ",", "../../datasets/car.data")
+        self.assertEqual(["vhigh", "high", "med", "low"], dataDefinition.getAttributeValues(0))
+        self.assertEqual(["small", "med", "big"], dataDefinition.getAttributeValues(4))
+        self.assertEqual(2, dataDefinition.featureValueIndex(3, "more"))
+        self.assertEqual(-1, dataDefinition.featureValueIndex(3, "none"))
+        for i in range(car.size()):
+            instance = car.get(i)
+            for j in range(6):
+                attribute = instance.getAttribute(j)
+                self.assertEqual(dataDefinition.featureValueIndex(j, attribute.getValue()), attribute.getIndex())
+                self.assertEqual(dataDefinition.numberOfValues(j), attribute.getMaxIndex())
+
+    def test_FileRanges(self):
+        ranges = DataFileReader.fileRanges("../../datasets/chess.data", 7)
+        self.assertEqual(7, len(ranges))
+        self.assertEqual(0, ranges[0][0])
+        input_file = open("../../datasets/chess.data", "rb")
+        data = input_file.read()
+        input_file.close()
+        self.assertEqual(len(data), ranges[-1][1])
+        for i in range(1, len(ranges)):
+            self.assertEqual(ranges[i - 1][1], ranges[i][0])
+            self.assertEqual(ord("\n"), data[ranges[i][0] - 1])
+
+    def test_ParallelRead(self):
+        minimumRangeSize = DataFileReader.MINIMUM_RANGE_SIZE
+        DataFileReader.MINIMUM_RANGE_SIZE = 1000
+        try:
+            attributeTypes = [AttributeType.DISCRETE_INDEXED, AttributeType.CONTINUOUS, AttributeType.DISCRETE,
+                              AttributeType.CONTINUOUS, AttributeType.DISCRETE_INDEXED, AttributeType.CONTINUOUS]
+            serialDefinition = DataDefinition(list(attributeTypes))
+            parallelDefinition = DataDefinition(list(attributeTypes))
+            serial = InstanceList(serialDefinition, ",", "../../datasets/chess.data")
+            parallel = InstanceList(parallelDefinition, ",", "../../datasets/chess.data", 3)
+            self.assertEqual(serial.size(), parallel.size())
+            self.assertEqual(serialDefinition.getAttributeValues(0), parallelDefinition.getAttributeValues(0))
+            self.assertEqual(serialDefinition.getAttributeValues(4), parallelDefinition.getAttributeValues(4))
+            for i in range(serial.size()):
+                self.assertEqual(serial.get(i).__str__(), parallel.get(i).__str__())
+                self.assertEqual(serial.get(i).getAttribute(4).getIndex(), parallel.get(i).getAttribute(4).getIndex())
+                self.assertEqual(serial.get(i).getAttribute(4).getMaxIndex(),
+                                 parallel.get(i).getAttribute(4).getMaxIndex())
+            serial.shuffle(5)
+            parallel.shuffle(5)
+            for i in range(serial.size()):
+                self.assertEqual(serial.get(i).__str__(), parallel.get(i).__str__())
+            serial = ColumnarInstanceList(DataDefinition(list(attributeTypes)), ",", "../../datasets/chess.data")
+            parallel = ColumnarInstanceList(DataDefinition(list(attributeTypes)), ",", "../../datasets/chess.data", 3)
+            self.assertTrue((serial.valueMatrix() == parallel.valueMatrix()).all())
+            self.assertTrue((serial.codeMatrix() == parallel.codeMatrix()).all())
+            self.assertTrue((serial.getClassLabelCodes() == parallel.getClassLabelCodes()).all())
+            self.assertEqual(serial.getClassLabelNames(), parallel.getClassLabelNames())
+            for i in range(6):
+                self.assertEqual(serial.getCategories(i), parallel.getCategories(i))
+        finally:
+            DataFileReader.MINIMUM_RANGE_SIZE = minimumRangeSize
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSet import DataSet
+from Classification.DataSet.DataSetCache import DataSetCache
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class DataSetCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_Load(self):
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        dataDefinition = DataDefinition(attributeTypes)
+        chess = InstanceList(dataDefinition, ",", "../../datasets/chess.data")
+        cache = DataSetCache(self.directory)
+        self.assertIsNone(cache.open(dataDefinition, ",", "../../datasets/chess.data"))
+        for i in range(2):
+            dataSet = DataSet(dataDefinition, ",", "../../datasets/chess.data", self.directory)
+            self.assertEqual(chess.size(), dataSet.sampleSize())
+            for j in range(0, chess.size(), 97):
+                self.assertEqual(chess.get(j).__str__(), dataSet.getInstanceList().get(j).__str__())
+        self.assertEqual(3, len(os.listdir(self.directory)))
+
+    def test_Stale(self):
+        fileName = os.path.join(self.directory, "iris.data")
+        shutil.copyfile("../../datasets/iris.data", fileName)
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        cache = DataSetCache(os.path.join(self.directory, "cache"))
+        self.assertEqual(150, cache.load(dataDefinition, ",", fileName).size())
+        os.utime(fileName, ns=(0, 0))
+        self.assertIsNotNone(cache.open(dataDefinition, ",", fileName))
+        output_file = open(fileName, 'a', encoding='utf8')
+        output_file.write("5.0,3.0,1.5,0.2,Iris-setosa\n")
+        output_file.close()
+        self.assertIsNone(cache.open(dataDefinition, ",", fileName))
+        self.assertEqual(151, cache.load(dataDefinition, ",", fileName).size())
+
+
+    def test_DefinitionUnchanged(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE_INDEXED])
+        key = DataSetCache.definitionKey(dataDefinition, ",")
+        car = InstanceList(DataDefinition(6 * [AttributeType.DISCRETE_INDEXED]), ",", "../../datasets/car.data")
+        for i in range(2):
+            dataSet = DataSet(dataDefinition, ",", "../../datasets/car.data", self.directory)
+            self.assertEqual(0, dataDefinition.numberOfValues(0))
+            self.assertEqual(key, DataSetCache.definitionKey(dataDefinition, ","))
+            self.assertEqual(4, dataSet.getDataDefinition().numberOfValues(0))
+            for j in range(0, car.size(), 31):
+                self.assertEqual(car.get(j).__str__(), dataSet.getInstanceList().get(j).__str__())
+        self.assertEqual(3, len(os.listdir(self.directory)))
+
+
+    def test_SameFileName(self):
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        fileNames = []
+        for directory in ["first", "second"]:
+            os.makedirs(os.path.join(self.directory, directory))
+            fileNames.append(os.path.join(self.directory, directory, "iris.data"))
+        shutil.copyfile("../../datasets/iris.data", fileNames[0])
+        with open("../../datasets/iris.data", "r", encoding="utf8") as input_file:
+            lines = input_file.readlines()
+        with open(fileNames[1], "w", encoding="utf8") as output_file:
+            output_file.writelines(lines[:100])
+        cache = DataSetCache(os.path.join(self.directory, "cache"))
+        self.assertEqual(150, cache.load(dataDefinition, ",", fileNames[0]).size())
+        self.assertIsNone(cache.open(dataDefinition, ",", fileNames[1]))
+        self.assertEqual(100, cache.load(dataDefinition, ",", fileNames[1]).size())
+        self.assertEqual(150, cache.open(dataDefinition, ",", fileNames[0]).size())
+
+
+if __name__ == '__main__':
+    unittest.main()
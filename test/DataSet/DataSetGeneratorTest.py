@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Classifier.C45 import C45
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSet import DataSet
+from Classification.DataSet.DataSetGenerator import DataSetGenerator
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.Parameter.C45Parameter import C45Parameter
+
+
+class DataSetGeneratorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.definition = DataDefinition([AttributeType.CONTINUOUS, AttributeType.DISCRETE, AttributeType.BINARY,
+                                          AttributeType.DISCRETE_INDEXED, AttributeType.CONTINUOUS],
+                                         [[], ["a", "b", "c"], [], [], []])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_Generate(self):
+        generator = DataSetGenerator(self.definition, 3, 0.0, 5)
+        instanceList = generator.generate(100000)
+        self.assertEqual(100000, instanceList.size())
+        self.assertEqual(["C1", "C2", "C3"], sorted(instanceList.getDistinctClassLabels()))
+        self.assertEqual(["a", "b", "c"], sorted(instanceList.getAttributeValueList(1)))
+        self.assertEqual(["v1", "v2", "v3", "v4"], generator.getDataDefinition().getAttributeValues(3))
+        self.assertEqual(AttributeType.BINARY, generator.getDataDefinition().getAttributeType(2))
+        same = DataSetGenerator(self.definition, 3, 0.0, 5).generate(1000)
+        for i in range(same.size()):
+            self.assertEqual(same.get(i).__str__(), instanceList.get(i).__str__())
+        other = DataSetGenerator(self.definition, 3, 0.0, 6).generate(1000)
+        self.assertNotEqual(same.formatRows(0, 1000), other.formatRows(0, 1000))
+        self.assertEqual(0, generator.generate(0).size())
+
+    def test_LabelNoise(self):
+        c45 = C45()
+        generator = DataSetGenerator(self.definition, 2, 0.0, 1, separation=3.0)
+        c45.train(generator.generate(5000), C45Parameter(1, True, 0.2))
+        errorRate = c45.test(generator.generate(5000)).getErrorRate()
+        self.assertLess(errorRate, 0.1)
+        noisy = DataSetGenerator(self.definition, 2, 0.4, 1, separation=3.0).generate(5000)
+        self.assertGreater(c45.test(noisy).getErrorRate(), errorRate + 0.15)
+
+    def test_WriteToFile(self):
+        generator = DataSetGenerator(self.definition, 4, 0.1, 3)
+        instanceList = generator.generate(70000)
+        fileName = os.path.join(self.directory, "synthetic.data.gz")
+        generator.writeToFile(fileName, 70000)
+        read = InstanceList(generator.getDataDefinition(), ",", fileName)
+        self.assertEqual(instanceList.size(), read.size())
+        for i in range(0, read.size(), 97):
+            self.assertEqual(instanceList.get(i).__str__(), read.get(i).__str__())
+        self.assertEqual(instanceList.classDistribution(), read.classDistribution())
+
+    def test_WriteToBinaryFile(self):
+        generator = DataSetGenerator(self.definition, 4, 0.1, 3)
+        instanceList = generator.generate(70000)
+        baseName = os.path.join(self.directory, "synthetic")
+        generator.writeToBinaryFile(baseName, 70000)
+        dataSet = DataSet()
+        dataSet.initWithBinaryFile(baseName)
+        self.assertEqual(70000, dataSet.sampleSize())
+        self.assertEqual(instanceList.formatRows(0, 70000), dataSet.getInstanceList().formatRows(0, 70000))
+
+
+if __name__ == '__main__':
+    unittest.main()
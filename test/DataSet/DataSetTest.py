@@ -1,8 +1,21 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 from Classification.Attribute.AttributeType import AttributeType
+from Classification.Classifier.C45 import C45
+from Classification.Classifier.Knn import Knn
 from Classification.DataSet.DataDefinition import DataDefinition
 from Classification.DataSet.DataSet import DataSet
+from Classification.Filter.DiscreteToContinuous import DiscreteToContinuous
+from Classification.Filter.DiscreteToIndexed import DiscreteToIndexed
+from Classification.Filter.LaryToBinary import LaryToBinary
+from Classification.Filter.Normalize import Normalize
+from Classification.Filter.Pca import Pca
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.Parameter.C45Parameter import C45Parameter
+from Classification.Parameter.KnnParameter import KnnParameter
 
 
 class DataSetTest(unittest.TestCase):
@@ -70,6 +83,115 @@ class DataSetTest(unittest.TestCase):
         self.assertEqual("draw;zero;one;two;three;four;five;six;seven;eight;nine;ten;eleven;twelve;thirteen;fourteen;fifteen;sixteen",
                           self.chess.getClasses())
 
+    def assertSameLines(self, dataSet: DataSet, fileName: str):
+        with open(fileName, "r", encoding="utf8") as input_file:
+            lines = input_file.read().split("\n")
+        self.assertEqual(dataSet.sampleSize() + 1, len(lines))
+        for i in range(dataSet.sampleSize()):
+            self.assertEqual(dataSet.getInstanceList().get(i).__str__(), lines[i])
+
+    def test_WriteToFile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            fileName = os.path.join(directory, "chess.data")
+            self.chess.writeToFile(fileName, 1000)
+            self.assertSameLines(self.chess, fileName)
+            chess = DataSet(self.chess.getDataDefinition(), ",", fileName)
+            self.assertSameLines(chess, fileName)
+            columns = ColumnarInstanceList(self.car.getDataDefinition(), ",", "../../datasets/car.data")
+            self.assertEqual(self.car.getInstanceList().formatRows(100, 900), columns.formatRows(100, 900))
+            Normalize(self.dermatology).convert()
+            fileName = os.path.join(directory, "dermatology.data")
+            self.dermatology.writeToFile(fileName)
+            self.assertSameLines(self.dermatology, fileName)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_WriteCachedToFile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            definition = self.dermatology.getDataDefinition()
+            DataSet(definition, ",", "../../datasets/dermatology.data", cacheDirectory=directory)
+            dermatology = DataSet(definition, ",", "../../datasets/dermatology.data", cacheDirectory=directory)
+            Normalize(dermatology).convert()
+            Normalize(self.dermatology).convert()
+            dermatology.getInstanceList().get(1).getAttribute(0).setValue(2)
+            self.dermatology.getInstanceList().get(1).getAttribute(0).setValue(2)
+            fileName = os.path.join(directory, "dermatology.data")
+            dermatology.writeToFile(fileName)
+            self.assertSameLines(dermatology, fileName)
+            written = DataSet(definition, ",", fileName)
+            for i in range(written.sampleSize()):
+                expected = self.dermatology.getInstanceList().get(i)
+                actual = written.getInstanceList().get(i)
+                for j in range(expected.attributeSize()):
+                    self.assertAlmostEqual(expected.getAttribute(j).getValue(), actual.getAttribute(j).getValue(), 9)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_CachedFilters(self):
+        directory = tempfile.mkdtemp()
+        try:
+            for dataSet, fileName, filters in [(self.car, "car.data", [DiscreteToIndexed, DiscreteToContinuous]),
+                                               (self.tictactoe, "tictactoe.data", [LaryToBinary]),
+                                               (self.iris, "iris.data", [Normalize, Pca])]:
+                fileName = os.path.join("../../datasets", fileName)
+                definition = dataSet.getDataDefinition()
+                definition = DataDefinition([definition.getAttributeType(i) for i in range(dataSet.attributeCount())])
+                DataSet(definition, ",", fileName, cacheDirectory=directory)
+                cached = DataSet(definition, ",", fileName, cacheDirectory=directory)
+                for dataFilter in filters:
+                    dataFilter(dataSet).convert()
+                    dataFilter(cached).convert()
+                self.assertEqual(dataSet.attributeCount(), cached.attributeCount())
+                expected = dataSet.getInstanceList()
+                actual = cached.getInstanceList()
+                self.assertEqual(list(expected.classDistribution().items()),
+                                 list(actual.classDistribution().items()))
+                expected_average = expected.continuousAverage()
+                actual_average = actual.continuousAverage()
+                for i in range(len(expected_average)):
+                    self.assertAlmostEqual(expected_average[i], actual_average[i], 9)
+                for i in range(expected.size()):
+                    expected_values = expected.get(i).continuousAttributes()
+                    actual_values = actual.get(i).continuousAttributes()
+                    for j in range(len(expected_values)):
+                        self.assertAlmostEqual(abs(expected_values[j]), abs(actual_values[j]), 9)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_BinaryFile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            Pca(self.iris).convert()
+            self.iris.writeToBinaryFile(os.path.join(directory, "iris"))
+            iris = DataSet()
+            iris.initWithBinaryFile(os.path.join(directory, "iris"))
+            self.assertEqual(self.iris.sampleSize(), iris.sampleSize())
+            for i in range(self.iris.sampleSize()):
+                self.assertEqual(self.iris.getInstanceList().get(i).__str__(), iris.getInstanceList().get(i).__str__())
+            knn = Knn()
+            knn.train(iris.getInstanceList(), KnnParameter(1, 3))
+            self.assertAlmostEqual(knn.test(self.iris.getInstanceList()).getErrorRate(),
+                                   knn.test(iris.getInstanceList()).getErrorRate(), 9)
+            LaryToBinary(self.tictactoe).convert()
+            self.tictactoe.writeToBinaryFile(os.path.join(directory, "tictactoe", "binary"))
+            tictactoe = DataSet()
+            tictactoe.initWithBinaryFile(os.path.join(directory, "tictactoe", "binary"))
+            self.assertEqual(self.tictactoe.attributeCount(), tictactoe.attributeCount())
+            self.assertEqual(AttributeType.BINARY, tictactoe.getDataDefinition().getAttributeType(0))
+            c45 = C45()
+            c45Parameter = C45Parameter(1, True, 0.2)
+            c45.train(tictactoe.getInstanceList(), c45Parameter)
+            self.assertAlmostEqual(3.34, 100 * c45.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
+            car = DataSet(self.car.getDataDefinition(), ",", "../../datasets/car.data", directory)
+            car.writeToBinaryFile(os.path.join(directory, "car"))
+            car = DataSet()
+            car.initWithBinaryFile(os.path.join(directory, "car"))
+            self.assertEqual(self.car.getClasses(), car.getClasses())
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == '__main__':
     unittest.main()
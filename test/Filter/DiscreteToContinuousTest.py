@@ -1,11 +1,17 @@
 import unittest
 
+from Classification.Attribute.AttributeType import AttributeType
 from Classification.Classifier.C45 import C45
+from Classification.Classifier.DeepNetwork import DeepNetwork
 from Classification.Classifier.Knn import Knn
 from Classification.Classifier.LinearPerceptron import LinearPerceptron
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSet import DataSet
 from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
 from Classification.Filter.DiscreteToContinuous import DiscreteToContinuous
+from Classification.Parameter.ActivationFunction import ActivationFunction
 from Classification.Parameter.C45Parameter import C45Parameter
+from Classification.Parameter.DeepNetworkParameter import DeepNetworkParameter
 from Classification.Parameter.KnnParameter import KnnParameter
 from Classification.Parameter.LinearPerceptronParameter import LinearPerceptronParameter
 from test.Classifier.ClassifierTest import ClassifierTest
@@ -25,6 +31,33 @@ class DiscreteToContinuousTest(ClassifierTest):
         linearPerceptron.train(self.tictactoe.getInstanceList(), linearPerceptronParameter)
         self.assertAlmostEqual(2.51, 100 * linearPerceptron.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
+    def test_SparseLinearPerceptron(self):
+        linearPerceptron = LinearPerceptron()
+        linearPerceptronParameter = LinearPerceptronParameter(1, 0.1, 0.99, 0.2, 100)
+        discreteToContinuous = DiscreteToContinuous(self.car, True)
+        discreteToContinuous.convert()
+        linearPerceptron.train(self.car.getInstanceList(), linearPerceptronParameter)
+        self.assertAlmostEqual(5.73, 100 * linearPerceptron.test(self.car.getInstanceList()).getErrorRate(), 2)
+
+    def test_SparseDeepNetwork(self):
+        deepNetwork = DeepNetwork()
+        deepNetworkParameter = DeepNetworkParameter(1, 0.1, 0.99, 0.2, 10, [5], ActivationFunction.SIGMOID)
+        car = DataSet(DataDefinition(6 * [AttributeType.DISCRETE]), ",", "../../datasets/car.data")
+        DiscreteToContinuous(car).convert()
+        deepNetwork.train(car.getInstanceList(), deepNetworkParameter)
+        errorRate = deepNetwork.test(car.getInstanceList()).getErrorRate()
+        DiscreteToContinuous(self.car, True).convert()
+        deepNetwork.train(self.car.getInstanceList(), deepNetworkParameter)
+        self.assertAlmostEqual(errorRate, deepNetwork.test(self.car.getInstanceList()).getErrorRate(), 9)
+
+    def test_SparseKnn(self):
+        knn = Knn()
+        knnParameter = KnnParameter(1, 3, EuclidianDistance())
+        discreteToContinuous = DiscreteToContinuous(self.car, True)
+        discreteToContinuous.convert()
+        knn.train(self.car.getInstanceList(), knnParameter)
+        self.assertAlmostEqual(20.31, 100 * knn.test(self.car.getInstanceList()).getErrorRate(), 2)
+
     def test_Knn(self):
         knn = Knn()
         knnParameter = KnnParameter(1, 3, EuclidianDistance())
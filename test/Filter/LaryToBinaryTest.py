@@ -33,6 +33,22 @@ class LaryToBinaryTest(ClassifierTest):
         knn.train(self.car.getInstanceList(), knnParameter)
         self.assertAlmostEqual(20.31, 100 * knn.test(self.car.getInstanceList()).getErrorRate(), 2)
 
+    def test_PackedKnn(self):
+        knn = Knn()
+        knnParameter = KnnParameter(1, 3, EuclidianDistance())
+        laryToBinary = LaryToBinary(self.car, True)
+        laryToBinary.convert()
+        knn.train(self.car.getInstanceList(), knnParameter)
+        self.assertAlmostEqual(20.31, 100 * knn.test(self.car.getInstanceList()).getErrorRate(), 2)
+
+    def test_PackedC45(self):
+        c45 = C45()
+        c45Parameter = C45Parameter(1, True, 0.2)
+        laryToBinary = LaryToBinary(self.tictactoe, True)
+        laryToBinary.convert()
+        c45.train(self.tictactoe.getInstanceList(), c45Parameter)
+        self.assertAlmostEqual(3.34, 100 * c45.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
+
     def test_C45(self):
         c45 = C45()
         c45Parameter = C45Parameter(1, True, 0.2)
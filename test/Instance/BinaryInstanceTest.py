@@ -0,0 +1,45 @@
+import unittest
+
+from Classification.Attribute.BinaryAttribute import BinaryAttribute
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.BinaryInstance import BinaryInstance
+from Classification.Instance.Instance import Instance
+
+
+class BinaryInstanceTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.instance = BinaryInstance("a", [ContinuousAttribute(2.0)], 70, (1 << 69) | 0b101)
+
+    def test_Attributes(self):
+        self.assertEqual(71, self.instance.attributeSize())
+        self.assertEqual(1, self.instance.continuousAttributeSize())
+        self.assertEqual([2.0], self.instance.continuousAttributes())
+        self.assertEqual("True", self.instance.getAttribute(1).getValue())
+        self.assertEqual("False", self.instance.getAttribute(2).getValue())
+        self.assertEqual("True", self.instance.getAttribute(3).getValue())
+        self.assertEqual("True", self.instance.getAttribute(70).getValue())
+        self.assertEqual("True", self.instance.getAttribute(-1).getValue())
+        self.assertTrue(self.instance.__str__().startswith("2.0,True,False,True,False,"))
+        subSet = self.instance.getSubSetOfFeatures(FeatureSubSet([70, 0, 2]))
+        self.assertEqual("True,2.0,False,a", subSet.__str__())
+        self.instance.removeAttribute(0)
+        self.assertFalse(self.instance.isPacked())
+        self.assertEqual(70, self.instance.attributeSize())
+        self.assertEqual("True", self.instance.getAttribute(0).getValue())
+
+    def test_Distance(self):
+        other = BinaryInstance("b", [ContinuousAttribute(0.5)], 70, 0b110)
+        self.assertEqual(3, self.instance.hammingDistance(other))
+        dense = Instance("a", [self.instance.getAttribute(i) for i in range(71)])
+        otherDense = Instance("b", [ContinuousAttribute(0.5)] + [BinaryAttribute(other.getAttribute(i + 1).getValue()
+                                                                                  == "True") for i in range(70)])
+        distance = EuclidianDistance()
+        self.assertEqual(distance.distance(dense, otherDense), distance.distance(self.instance, other))
+        self.assertEqual(5.25, distance.distance(self.instance, other))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.Instance.Instance import Instance
+
+
+class InstanceTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.attribute = ContinuousAttribute(2.0)
+        self.instance = Instance("a", [self.attribute, DiscreteIndexedAttribute("x", 1, 3), DiscreteAttribute("y")])
+
+    def test_ToVector(self):
+        self.assertEqual([2.0, 0.0, 1.0, 0.0], self.instance.continuousAttributes())
+        self.assertEqual(4, self.instance.continuousAttributeSize())
+        vector = self.instance.toVector()
+        vector.insert(0, 1.0)
+        self.assertEqual(4, self.instance.toVector().size())
+        values = self.instance.continuousAttributes()
+        values.append(5.0)
+        self.assertEqual([2.0, 0.0, 1.0, 0.0], self.instance.continuousAttributes())
+
+    def test_Invalidation(self):
+        self.assertEqual(2.0, self.instance.toVector().getValue(0))
+        self.attribute.setValue(3.0)
+        self.assertEqual(3.0, self.instance.toVector().getValue(0))
+        self.instance.addAttribute(ContinuousAttribute(4.0))
+        self.assertEqual([3.0, 0.0, 1.0, 0.0, 4.0], self.instance.continuousAttributes())
+        self.instance.removeAttribute(0)
+        self.assertEqual([0.0, 1.0, 0.0, 4.0], self.instance.continuousAttributes())
+        self.instance.addContinuousAttribute(6.0)
+        self.assertEqual(5, self.instance.continuousAttributeSize())
+        self.instance.removeAllAttributes()
+        self.assertEqual([], self.instance.continuousAttributes())
+
+    def test_ModificationCount(self):
+        other = Instance("b", [ContinuousAttribute(1.0), DiscreteIndexedAttribute("x", 0, 2)])
+        self.assertEqual([2.0, 0.0, 1.0, 0.0], self.instance.continuousAttributes())
+        count = self.instance.getModificationCount()
+        other.getModificationCount()
+        other.getAttribute(0).setValue(5.0)
+        other.getAttribute(1).setMaxIndex(3)
+        other.addContinuousAttribute(2.0)
+        self.assertEqual(count, self.instance.getModificationCount())
+        self.attribute.setValue(3.0)
+        self.assertLess(count, self.instance.getModificationCount())
+        shared = Instance("c", [self.attribute])
+        self.assertEqual([3.0], shared.continuousAttributes())
+        self.attribute.setValue(4.0)
+        self.assertEqual([4.0], shared.continuousAttributes())
+        self.assertEqual([4.0, 0.0, 1.0, 0.0], self.instance.continuousAttributes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSet import DataSet
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+from Classification.Instance.ProjectedInstance import ProjectedInstance
+
+
+class ProjectedInstanceTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.attribute = ContinuousAttribute(2.0)
+        self.instance = Instance("a", [self.attribute, DiscreteIndexedAttribute("x", 1, 3), DiscreteAttribute("y"),
+                                       ContinuousAttribute(4.0)])
+
+    def test_Projection(self):
+        projected = ProjectedInstance(self.instance, (3, 1, 0))
+        self.assertEqual(3, projected.attributeSize())
+        self.assertIs(self.attribute, projected.getAttribute(2))
+        self.assertEqual("a", projected.getClassLabel())
+        self.assertEqual([4.0, 0.0, 1.0, 0.0, 2.0], projected.continuousAttributes())
+        self.assertEqual(5, projected.toVector().size())
+        self.assertEqual("4.0,x,2.0,a", projected.__str__())
+        self.attribute.setValue(3.0)
+        self.assertEqual([4.0, 0.0, 1.0, 0.0, 3.0], projected.continuousAttributes())
+        subSet = projected.getSubSetOfFeatures(FeatureSubSet([2, 0]))
+        self.assertEqual("3.0,4.0,a", subSet.__str__())
+
+    def test_Materialize(self):
+        projected = ProjectedInstance(self.instance, (2, 0))
+        projected.addContinuousAttribute(5.0)
+        self.assertEqual(3, projected.attributeSize())
+        self.assertEqual([2.0, 5.0], projected.continuousAttributes())
+        self.assertEqual(4, self.instance.attributeSize())
+
+    def test_DataSet(self):
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        chess = DataSet(DataDefinition(attributeTypes), ",", "../../datasets/chess.data")
+        featureSubSet = FeatureSubSet([5, 0, 3])
+        subSet = chess.getSubSetOfFeatures(featureSubSet)
+        self.assertEqual(chess.sampleSize(), subSet.sampleSize())
+        self.assertEqual(3, subSet.attributeCount())
+        self.assertEqual(2, subSet.continuousAttributeCount())
+        for i in range(0, chess.sampleSize(), 97):
+            expected = chess.getInstanceList().get(i).getSubSetOfFeatures(featureSubSet)
+            self.assertEqual(expected.__str__(), subSet.getInstanceList().get(i).__str__())
+            self.assertEqual(expected.continuousAttributes(), subSet.getInstanceList().get(i).continuousAttributes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.Classifier.Lda import Lda
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+from Classification.Instance.SparseInstance import SparseInstance
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class SparseInstanceTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.instance = SparseInstance("a", 6, {1: 2.0, 4: -1.0, 5: 0.0})
+
+    def test_Attributes(self):
+        self.assertEqual(6, self.instance.attributeSize())
+        self.assertEqual(6, self.instance.continuousAttributeSize())
+        self.assertEqual([(1, 2.0), (4, -1.0)], self.instance.sparseContinuousAttributes())
+        self.assertEqual([0.0, 2.0, 0.0, 0.0, -1.0, 0.0], self.instance.continuousAttributes())
+        self.assertEqual(6, self.instance.toVector().size())
+        self.assertEqual("0.0,2.0,0.0,0.0,-1.0,0.0,a", self.instance.__str__())
+        self.instance.getAttribute(3).setValue(5.0)
+        self.assertEqual([(1, 2.0), (3, 5.0), (4, -1.0)], self.instance.sparseContinuousAttributes())
+        subSet = self.instance.getSubSetOfFeatures(FeatureSubSet([4, 0, 3]))
+        self.assertEqual([(0, -1.0), (2, 5.0)], subSet.sparseContinuousAttributes())
+        self.instance.addAttribute(ContinuousAttribute(7.0))
+        self.assertEqual([0.0, 2.0, 0.0, 5.0, -1.0, 0.0, 7.0], self.instance.continuousAttributes())
+
+    def test_ZeroAttributes(self):
+        count = self.instance.getModificationCount()
+        self.assertEqual([0.0, 2.0, 0.0, 0.0, -1.0, 0.0],
+                         [self.instance.getAttribute(i).getValue() for i in range(self.instance.attributeSize())])
+        self.assertIsNot(self.instance.getAttribute(2), self.instance.getAttribute(2))
+        self.assertEqual(count, self.instance.getModificationCount())
+        attribute = self.instance.getAttribute(2)
+        attribute.setValue(3.0)
+        self.assertLess(count, self.instance.getModificationCount())
+        self.assertIs(attribute, self.instance.getAttribute(2))
+        self.assertEqual([(1, 2.0), (2, 3.0), (4, -1.0)], self.instance.sparseContinuousAttributes())
+        self.instance.removeAttribute(0)
+        self.assertEqual([2.0, 3.0, 0.0, -1.0, 0.0], self.instance.continuousAttributes())
+
+    def test_SparseContinuousAttributes(self):
+        instance = Instance("a", [ContinuousAttribute(2.0), DiscreteIndexedAttribute("x", 1, 3), DiscreteAttribute("y"),
+                                  ContinuousAttribute(0.0), ContinuousAttribute(4.0)])
+        self.assertEqual([(0, 2.0), (2, 1.0), (5, 4.0)], instance.sparseContinuousAttributes())
+
+    def test_Distance(self):
+        other = SparseInstance("b", 6, {0: 1.0, 4: 3.0})
+        dense = Instance("a", [ContinuousAttribute(value) for value in self.instance.continuousAttributes()])
+        otherDense = Instance("b", [ContinuousAttribute(value) for value in other.continuousAttributes()])
+        distance = EuclidianDistance()
+        self.assertEqual(distance.distance(dense, otherDense), distance.distance(self.instance, other))
+
+    def test_Lda(self):
+        iris = InstanceList(DataDefinition(4 * [AttributeType.CONTINUOUS]), ",", "../../datasets/iris.data")
+        sparseIris = InstanceList()
+        for instance in iris.getInstances():
+            values = {}
+            for i in range(4):
+                values[i] = instance.getAttribute(i).getValue()
+            sparseIris.add(SparseInstance(instance.getClassLabel(), 4, values))
+        lda = Lda()
+        lda.train(sparseIris)
+        self.assertAlmostEqual(2.00, 100 * lda.test(sparseIris).getErrorRate(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
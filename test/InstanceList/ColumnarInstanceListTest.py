@@ -0,0 +1,130 @@
+import unittest
+
+from Math.Vector import Vector
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class ColumnarInstanceListTest(unittest.TestCase):
+
+    iris: InstanceList
+    car: InstanceList
+    chess: InstanceList
+    columnarIris: ColumnarInstanceList
+    columnarCar: ColumnarInstanceList
+    columnarChess: ColumnarInstanceList
+
+    def setUp(self) -> None:
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        self.iris = InstanceList(dataDefinition, ",", "../../datasets/iris.data")
+        self.columnarIris = ColumnarInstanceList(dataDefinition, ",", "../../datasets/iris.data")
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE])
+        self.car = InstanceList(dataDefinition, ",", "../../datasets/car.data")
+        self.columnarCar = ColumnarInstanceList(dataDefinition, ",", "../../datasets/car.data")
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        dataDefinition = DataDefinition(attributeTypes)
+        self.chess = InstanceList(dataDefinition, ",", "../../datasets/chess.data")
+        self.columnarChess = ColumnarInstanceList(dataDefinition, ",", "../../datasets/chess.data")
+
+    def test_Instances(self):
+        for original, columnar in [(self.iris, self.columnarIris), (self.car, self.columnarCar),
+                                   (self.chess, self.columnarChess)]:
+            self.assertEqual(original.size(), columnar.size())
+            for i in range(original.size()):
+                self.assertEqual(original.get(i).__str__(), columnar.get(i).__str__())
+
+    def test_ClassDistribution(self):
+        for original, columnar in [(self.iris, self.columnarIris), (self.car, self.columnarCar),
+                                   (self.chess, self.columnarChess)]:
+            self.assertEqual(list(original.classDistribution().items()),
+                             list(columnar.classDistribution().items()))
+            self.assertEqual(original.getDistinctClassLabels(), columnar.getDistinctClassLabels())
+
+    def test_AttributeClassDistribution(self):
+        for original, columnar in [(self.car, self.columnarCar), (self.chess, self.columnarChess)]:
+            for i in range(original.get(0).attributeSize()):
+                self.assertEqual(original.getAttributeValueList(i), columnar.getAttributeValueList(i))
+                expected = original.attributeClassDistribution(i)
+                actual = columnar.attributeClassDistribution(i)
+                self.assertEqual(len(expected), len(actual))
+                for j in range(len(expected)):
+                    self.assertEqual(list(expected[j].items()), list(actual[j].items()))
+
+    def test_Covariance(self):
+        average = self.iris.continuousAverage()
+        columnar_average = self.columnarIris.continuousAverage()
+        for i in range(len(average)):
+            self.assertAlmostEqual(average[i], columnar_average[i], 9)
+        expected = self.iris.covariance(Vector(average))
+        actual = self.columnarIris.covariance(Vector(average))
+        for i in range(expected.getRow()):
+            for j in range(expected.getColumn()):
+                self.assertAlmostEqual(expected.getValue(i, j), actual.getValue(i, j), 9)
+
+    def test_Shuffle(self):
+        self.chess.shuffle(1)
+        self.columnarChess.shuffle(1)
+        for i in range(self.chess.size()):
+            self.assertEqual(self.chess.get(i).__str__(), self.columnarChess.get(i).__str__())
+        self.car.sortWrtAttribute(2)
+        self.columnarCar.sortWrtAttribute(2)
+        self.assertEqual(self.car.getClassLabels(), self.columnarCar.getClassLabels())
+
+    def test_FromInstances(self):
+        columnar = ColumnarInstanceList(self.chess)
+        self.assertEqual(self.chess.getClassLabels(), columnar.getClassLabels())
+        self.assertEqual(list(self.chess.attributeDistribution(0).items()),
+                         list(columnar.attributeDistribution(0).items()))
+
+    def test_ChangedInstances(self):
+        self.assertEqual(self.iris.continuousAverage(), self.columnarIris.continuousAverage())
+        for instances in [self.iris.getInstances(), self.columnarIris.getInstances()]:
+            for instance in instances:
+                instance.getAttribute(0).setValue(instance.getAttribute(0).getValue() - 5.0)
+        average = self.iris.continuousAverage()
+        columnar_average = self.columnarIris.continuousAverage()
+        for i in range(len(average)):
+            self.assertAlmostEqual(average[i], columnar_average[i], 9)
+        self.assertAlmostEqual(self.iris.get(0).getAttribute(0).getValue(),
+                               self.columnarIris.getColumn(0)[0], 9)
+        for instances in [self.car.getInstances(), self.columnarCar.getInstances()]:
+            for instance in instances:
+                instance.removeAttribute(0)
+                instance.addAttribute(ContinuousAttribute(len(instance.getClassLabel())))
+        self.assertEqual(list(self.car.attributeDistribution(0).items()),
+                         list(self.columnarCar.attributeDistribution(0).items()))
+        self.assertEqual(self.car.continuousAverage(), self.columnarCar.continuousAverage())
+        self.columnarChess.getInstances().append(self.chess.get(0))
+        self.chess.add(self.chess.get(0))
+        self.assertEqual(self.chess.size(), self.columnarChess.size())
+        self.assertEqual(list(self.chess.classDistribution().items()),
+                         list(self.columnarChess.classDistribution().items()))
+
+    def test_ChangedRows(self):
+        rows = self.columnarIris.getRows(0, 100)
+        instance = self.columnarIris.get(3)
+        instance.getAttribute(2).setValue(10.0)
+        self.assertEqual(10.0, self.columnarIris.getColumn(2)[3])
+        self.assertNotEqual(10.0, rows.getColumn(2)[3])
+        self.columnarIris.shuffle(1)
+        instance.getAttribute(2).setValue(20.0)
+        index = [row is instance for row in self.columnarIris.getInstances()].index(True)
+        self.assertEqual(20.0, self.columnarIris.getColumn(2)[index])
+        self.columnarCar.get(5).removeAttribute(5)
+        self.columnarCar.get(5).addAttribute(DiscreteAttribute("unknown"))
+        self.assertEqual(self.columnarCar.get(5).__str__(), self.columnarCar.getRows(5, 6).get(0).__str__())
+        self.assertIn("unknown", self.columnarCar.getAttributeValueList(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
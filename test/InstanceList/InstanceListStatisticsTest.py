@@ -0,0 +1,106 @@
+import copy
+import pickle
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStatistics import InstanceListStatistics
+
+
+class InstanceListStatisticsTest(unittest.TestCase):
+
+    chess: InstanceList
+
+    def setUp(self) -> None:
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        dataDefinition = DataDefinition(attributeTypes)
+        self.chess = InstanceList(dataDefinition, ",", "../../datasets/chess.data")
+
+    def assertSameStatistics(self, expected: InstanceList, actual: InstanceList):
+        self.assertEqual(expected.classDistribution(), actual.classDistribution())
+        self.assertEqual(expected.allAttributesDistribution(), actual.allAttributesDistribution())
+        for i in range(3):
+            self.assertAlmostEqual(expected.continuousAverage()[i], actual.continuousAverage()[i], 9)
+            self.assertAlmostEqual(expected.continuousStandardDeviation()[i], actual.continuousStandardDeviation()[i],
+                                   9)
+            for j in range(3):
+                self.assertAlmostEqual(expected.covariance().getValue(i, j), actual.covariance().getValue(i, j), 9)
+
+    def test_Add(self):
+        instanceList = InstanceList()
+        statistics = instanceList.getStatistics()
+        for i in range(200):
+            instanceList.add(self.chess.get(i))
+        instanceList.addAll(self.chess.getInstances()[200:3000])
+        self.assertIs(statistics, instanceList.getStatistics())
+        self.assertEqual(3000, statistics.getCount())
+        self.assertSameStatistics(InstanceList(self.chess.getInstances()[:3000]), instanceList)
+
+    def test_MergeSubtract(self):
+        first = InstanceListStatistics(self.chess.getInstances()[:10000])
+        second = InstanceListStatistics(self.chess.getInstances()[10000:])
+        first.merge(second)
+        total = self.chess.getStatistics()
+        self.assertEqual(total.getCount(), first.getCount())
+        self.assertEqual(total.getClassDistribution(), first.getClassDistribution())
+        self.assertEqual(total.getAttributeDistribution(0), first.getAttributeDistribution(0))
+        for i in range(3):
+            self.assertAlmostEqual(total.getMoments().getSum()[i], first.getMoments().getSum()[i], 6)
+            self.assertAlmostEqual(total.getMoments().getSumOfSquares()[i], first.getMoments().getSumOfSquares()[i], 6)
+        first.subtract(second)
+        part = InstanceListStatistics(self.chess.getInstances()[:10000])
+        self.assertEqual(10000, first.getCount())
+        self.assertEqual(part.getClassDistribution(), first.getClassDistribution())
+        for i in range(3):
+            self.assertAlmostEqual(part.getMoments().getStandardDeviation()[i],
+                                   first.getMoments().getStandardDeviation()[i], 9)
+
+    def test_Stale(self):
+        instanceList = InstanceList(self.chess.getInstances()[:1000])
+        instanceList.getStatistics()
+        instanceList.getInstances().append(self.chess.get(1000))
+        self.assertEqual(1001, instanceList.getStatistics().getCount())
+        instanceList.get(0).removeAttribute(0)
+        instanceList.get(0).addDiscreteAttribute("a")
+        self.assertEqual(1, instanceList.getStatistics().getAttributeDistribution(5)["a"])
+
+    def test_OtherLists(self):
+        instanceList = InstanceList(self.chess.getInstances()[:1000])
+        statistics = instanceList.getStatistics()
+        other = InstanceList(self.chess.getInstances()[2000:2010])
+        other.getStatistics()
+        other.get(0).getAttribute(1).setValue(100.0)
+        self.assertIs(statistics, instanceList.getStatistics())
+        instanceList.get(0).getAttribute(1).setValue(100.0)
+        self.assertIsNot(statistics, instanceList.getStatistics())
+        statistics = instanceList.getStatistics()
+        instanceList.shuffle(1)
+        self.assertIsNot(statistics, instanceList.getStatistics())
+        self.assertEqual(1000, instanceList.getStatistics().getCount())
+        statistics = instanceList.getStatistics()
+        instanceList.add(other.get(1))
+        other.get(1).getAttribute(1).setValue(200.0)
+        self.assertIsNot(statistics, instanceList.getStatistics())
+        self.assertAlmostEqual(200.0, instanceList.getStatistics().getMoments().getSum()[0] -
+                               InstanceList(instanceList.getInstances()[:1000]).getStatistics().getMoments().getSum()[0],
+                               6)
+
+
+    def test_Copies(self):
+        instanceList = InstanceList(self.chess.getInstances()[:1000])
+        instanceList.getStatistics()
+        for copied in [pickle.loads(pickle.dumps(instanceList)), copy.deepcopy(instanceList)]:
+            statistics = copied.getStatistics()
+            copied.get(0).getAttribute(1).setValue(100.0)
+            self.assertIsNot(statistics, copied.getStatistics())
+            self.assertSameStatistics(InstanceList(copied.getInstances()), copied)
+
+
+if __name__ == '__main__':
+    unittest.main()
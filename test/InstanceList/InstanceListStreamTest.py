@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Classifier.Dummy import Dummy
+from Classification.Classifier.KMeans import KMeans
+from Classification.Classifier.Lda import Lda
+from Classification.Classifier.NaiveBayes import NaiveBayes
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.DataSetCache import DataSetCache
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStream import InstanceListStream
+from Classification.Parameter.KMeansParameter import KMeansParameter
+
+
+class InstanceListStreamTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_Statistics(self):
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        dataDefinition = DataDefinition(attributeTypes)
+        chess = InstanceList(dataDefinition, ",", "../../datasets/chess.data")
+        stream = InstanceListStream(dataDefinition, ",", "../../datasets/chess.data", chunkSize=1000)
+        self.assertEqual(chess.classDistribution(), stream.classDistribution())
+        statistics = stream.statistics()
+        self.assertEqual(chess.size(), statistics.getCount())
+        self.assertEqual(chess.allAttributesDistribution(), statistics.getAttributeDistributions())
+        for i in range(3):
+            self.assertAlmostEqual(chess.continuousAverage()[i], statistics.getMoments().getMean()[i], 9)
+
+    def test_Train(self):
+        dataDefinition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        iris = InstanceList(dataDefinition, ",", "../../datasets/iris.data")
+        stream = InstanceListStream(dataDefinition, ",", "../../datasets/iris.data", chunkSize=37)
+        dummy = Dummy()
+        dummy.train(stream)
+        self.assertAlmostEqual(66.67, 100 * dummy.test(iris).getErrorRate(), 2)
+        naiveBayes = NaiveBayes()
+        naiveBayes.train(stream)
+        self.assertAlmostEqual(5.33, 100 * naiveBayes.test(iris).getErrorRate(), 2)
+        kMeans = KMeans()
+        kMeans.train(stream, KMeansParameter(1))
+        self.assertAlmostEqual(7.33, 100 * kMeans.test(iris).getErrorRate(), 2)
+        lda = Lda()
+        lda.train(stream)
+        self.assertAlmostEqual(2.00, 100 * lda.test(iris).getErrorRate(), 2)
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE])
+        car = InstanceList(dataDefinition, ",", "../../datasets/car.data")
+        stream = InstanceListStream(dataDefinition, ",", "../../datasets/car.data", chunkSize=500)
+        naiveBayes.train(stream)
+        self.assertAlmostEqual(12.91, 100 * naiveBayes.test(car).getErrorRate(), 2)
+        kMeans.train(stream, KMeansParameter(1))
+        self.assertAlmostEqual(47.97, 100 * kMeans.test(car).getErrorRate(), 2)
+
+    def test_Cache(self):
+        dataDefinition = DataDefinition(6 * [AttributeType.CONTINUOUS])
+        bupa = InstanceList(dataDefinition, ",", "../../datasets/bupa.data")
+        DataSetCache(self.directory).load(dataDefinition, ",", "../../datasets/bupa.data")
+        stream = InstanceListStream(dataDefinition, ",", "../../datasets/bupa.data", self.directory, 100)
+        self.assertEqual([100, 100, 100, 45], [chunk.size() for chunk in stream.chunks()])
+        naiveBayes = NaiveBayes()
+        naiveBayes.train(stream)
+        self.assertAlmostEqual(38.55, 100 * naiveBayes.test(bupa).getErrorRate(), 2)
+        lda = Lda()
+        lda.train(stream)
+        self.assertAlmostEqual(29.57, 100 * lda.test(bupa).getErrorRate(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Classifier.C45 import C45
+from Classification.Classifier.Knn import Knn
+from Classification.Classifier.Lda import Lda
+from Classification.Classifier.LinearPerceptron import LinearPerceptron
+from Classification.Classifier.NaiveBayes import NaiveBayes
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.Partition import Partition
+from Classification.Parameter.C45Parameter import C45Parameter
+from Classification.Parameter.KnnParameter import KnnParameter
+from Classification.Parameter.LinearPerceptronParameter import LinearPerceptronParameter
+
+
+class InstanceListTest(unittest.TestCase):
+
+    car: InstanceList
+    bupa: InstanceList
+
+    def setUp(self) -> None:
+        dataDefinition = DataDefinition(6 * [AttributeType.DISCRETE])
+        car = InstanceList(dataDefinition, ",", "../../datasets/car.data")
+        self.car = InstanceList(car.getInstances() + car.getInstances()[::3] + car.getInstances()[::7])
+        dataDefinition = DataDefinition(6 * [AttributeType.CONTINUOUS])
+        bupa = InstanceList(dataDefinition, ",", "../../datasets/bupa.data")
+        self.bupa = InstanceList(bupa.getInstances() + bupa.getInstances()[::2])
+
+    def test_CollapseDuplicates(self):
+        collapsed = self.car.collapseDuplicates()
+        self.assertEqual(1728, collapsed.size())
+        self.assertEqual(self.car.size(), collapsed.totalWeight())
+        self.assertEqual(3, collapsed.getWeight(0))
+        self.assertEqual(1, collapsed.getWeight(1))
+        self.assertEqual(self.car.classDistribution(), collapsed.classDistribution())
+        self.assertEqual(self.car.allAttributesDistribution(), collapsed.allAttributesDistribution())
+        self.assertEqual(self.car.attributeClassDistribution(0), collapsed.attributeClassDistribution(0))
+        self.assertEqual(self.car.getStatistics().getClassDistribution(),
+                         collapsed.getStatistics().getClassDistribution())
+        collapsed = self.bupa.collapseDuplicates()
+        self.assertEqual(self.bupa.size(), collapsed.totalWeight())
+        for i in range(6):
+            self.assertAlmostEqual(self.bupa.continuousAverage()[i], collapsed.continuousAverage()[i], 9)
+            self.assertAlmostEqual(self.bupa.continuousStandardDeviation()[i],
+                                   collapsed.continuousStandardDeviation()[i], 9)
+            self.assertAlmostEqual(self.bupa.continuousAttributeStandardDeviation(i)[0],
+                                   collapsed.continuousAttributeStandardDeviation(i)[0], 9)
+            for j in range(6):
+                self.assertAlmostEqual(self.bupa.covariance().getValue(i, j), collapsed.covariance().getValue(i, j), 6)
+        moments = collapsed.moments(welford=True)
+        for i in range(6):
+            self.assertAlmostEqual(self.bupa.moments().getStandardDeviation()[i], moments.getStandardDeviation()[i], 9)
+        instances = InstanceList([Instance("x", [DiscreteAttribute("a,b"), DiscreteAttribute("c")]),
+                                  Instance("x", [DiscreteAttribute("a"), DiscreteAttribute("b,c")]),
+                                  Instance("x,y", [DiscreteAttribute("a")]),
+                                  Instance("y", [DiscreteAttribute("a"), DiscreteAttribute("x")]),
+                                  Instance("x", [DiscreteAttribute("a"), DiscreteAttribute("b,c")])])
+        collapsed = instances.collapseDuplicates()
+        self.assertEqual(4, collapsed.size())
+        self.assertEqual([1, 2, 1, 1], [collapsed.getWeight(i) for i in range(4)])
+
+    def test_Views(self):
+        collapsed = self.car.collapseDuplicates()
+        partition = Partition(collapsed)
+        expected = Partition(self.car)
+        for i in range(partition.size()):
+            self.assertEqual(expected.get(i).size(), partition.get(i).totalWeight())
+            self.assertEqual(expected.get(i).allAttributesDistribution(), partition.get(i).allAttributesDistribution())
+        collapsed.shuffle(1)
+        self.assertEqual(self.car.size(), collapsed.totalWeight())
+        collapsed.sortWrtAttribute(0)
+        self.assertEqual(dict(zip(self.car.getAttributeValueList(0), map(dict, self.car.attributeClassDistribution(0)))),
+                         dict(zip(collapsed.getAttributeValueList(0),
+                                  map(dict, collapsed.attributeClassDistribution(0)))))
+        view = Partition(collapsed, 0).get(0)
+        view.shuffle(2)
+        value = view.get(0).getAttribute(0).getValue()
+        self.assertEqual(dict(self.car.attributeClassDistribution(0)[self.car.getAttributeValueIndex(0)[value]]),
+                         dict(view.classDistribution()))
+
+    def test_Train(self):
+        collapsed = self.car.collapseDuplicates()
+        naiveBayes = NaiveBayes()
+        naiveBayes.train(self.car)
+        errorRate = naiveBayes.test(self.car).getErrorRate()
+        naiveBayes.train(collapsed)
+        self.assertAlmostEqual(errorRate, naiveBayes.test(collapsed).getErrorRate(), 9)
+        c45 = C45()
+        c45Parameter = C45Parameter(1, False, 0.2)
+        c45.train(self.car, c45Parameter)
+        errorRate = c45.test(self.car).getErrorRate()
+        c45.train(collapsed, c45Parameter)
+        self.assertAlmostEqual(errorRate, c45.test(collapsed).getErrorRate(), 9)
+        collapsed = self.bupa.collapseDuplicates()
+        naiveBayes.train(self.bupa)
+        errorRate = naiveBayes.test(self.bupa).getErrorRate()
+        naiveBayes.train(collapsed)
+        self.assertAlmostEqual(errorRate, naiveBayes.test(collapsed).getErrorRate(), 9)
+        c45.train(self.bupa, c45Parameter)
+        errorRate = c45.test(self.bupa).getErrorRate()
+        c45.train(collapsed, c45Parameter)
+        self.assertAlmostEqual(errorRate, c45.test(collapsed).getErrorRate(), 9)
+        knn = Knn()
+        knnParameter = KnnParameter(1, 1, EuclidianDistance())
+        knn.train(self.bupa, knnParameter)
+        errorRate = knn.test(self.bupa).getErrorRate()
+        knn.train(collapsed, knnParameter)
+        self.assertAlmostEqual(errorRate, knn.test(collapsed).getErrorRate(), 9)
+        lda = Lda()
+        lda.train(self.bupa)
+        errorRate = lda.test(self.bupa).getErrorRate()
+        lda.train(collapsed)
+        self.assertAlmostEqual(errorRate, lda.test(collapsed).getErrorRate(), 9)
+
+    def test_WeightedPerceptron(self):
+        collapsed = self.bupa.collapseDuplicates()
+        weights = [0] * collapsed.size()
+        for i in range(0, collapsed.size(), 2):
+            weights[i] = collapsed.getWeight(i)
+        collapsed.setWeights(weights)
+        linearPerceptron = LinearPerceptron()
+        linearPerceptronParameter = LinearPerceptronParameter(1, 0.1, 0.99, 0.2, 100)
+        linearPerceptron.train(collapsed, linearPerceptronParameter)
+        self.assertEqual(sum(weights), collapsed.totalWeight())
+        self.assertLess(linearPerceptron.test(collapsed).getErrorRate(), 0.5)
+
+    def test_ClassLabelCodes(self):
+        names = self.car.getClassLabelNames()
+        self.assertEqual(self.car.getDistinctClassLabels(), names)
+        codes = self.car.getClassLabelCodes()
+        self.assertEqual(self.car.getClassLabels(), [names[code] for code in codes.tolist()])
+        self.assertEqual({name: code for code, name in enumerate(names)}, self.car.getClassLabelIndex())
+        self.car.shuffle(1)
+        self.assertEqual(self.car.getClassLabels(), [self.car.getClassLabelNames()[code]
+                                                     for code in self.car.getClassLabelCodes().tolist()])
+        self.car.add(self.car.get(0))
+        self.assertEqual(self.car.size(), self.car.getClassLabelCodes().shape[0])
+        other = next(instance for instance in self.car if instance.getClassLabel() != self.car.get(1).getClassLabel())
+        self.car.getInstances()[1] = other
+        self.assertEqual(self.car.getClassLabelIndex()[other.getClassLabel()], self.car.getClassLabelCodes()[1])
+        self.assertEqual(self.car.getClassLabels(), [self.car.getClassLabelNames()[code]
+                                                     for code in self.car.getClassLabelCodes().tolist()])
+        view = Partition(self.car, 0).get(1)
+        view.shuffle(3)
+        self.assertEqual(view.getClassLabels(), [view.getClassLabelNames()[code]
+                                                 for code in view.getClassLabelCodes().tolist()])
+        partition = Partition(self.car)
+        for i in range(partition.size()):
+            self.assertEqual(self.car.getDistinctClassLabels()[i], partition.get(i).getClassLabel())
+            self.assertEqual(self.car.classDistribution()[partition.get(i).getClassLabel()], partition.get(i).size())
+            self.assertEqual([partition.get(i).getClassLabel()], partition.get(i).getDistinctClassLabels())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from Sampling.Bootstrap import Bootstrap
+from Sampling.KFoldCrossValidation import KFoldCrossValidation
+from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+from Classification.InstanceList.Partition import Partition
+from Classification.InstanceList.ViewBootstrap import ViewBootstrap
+from Classification.InstanceList.ViewKFoldCrossValidation import ViewKFoldCrossValidation
+from Classification.InstanceList.ViewStratifiedKFoldCrossValidation import ViewStratifiedKFoldCrossValidation
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+
+
+class InstanceListViewTest(unittest.TestCase):
+
+    iris: InstanceList
+
+    def setUp(self) -> None:
+        dataDefinition = DataDefinition([AttributeType.CONTINUOUS] * 4)
+        self.iris = InstanceList(dataDefinition, ",", "../../datasets/iris.data")
+
+    def assertSameInstances(self, expected: list, actual: InstanceList):
+        self.assertEqual(len(expected), actual.size())
+        for i in range(len(expected)):
+            self.assertIs(expected[i], actual.get(i))
+
+    def test_View(self):
+        view = InstanceListView(self.iris, [4, 80, 120, 80])
+        self.assertEqual(4, view.size())
+        self.assertIs(self.iris.get(80), view.get(1))
+        self.assertEqual(["Iris-setosa", "Iris-versicolor", "Iris-virginica", "Iris-versicolor"],
+                         view.getClassLabels())
+        subView = InstanceListView(view, [2, 0])
+        self.assertIs(self.iris, subView.getParent())
+        self.assertSameInstances([self.iris.get(120), self.iris.get(4)], subView)
+        subView.sortWrtAttribute(0)
+        self.assertSameInstances([self.iris.get(4), self.iris.get(120)], subView)
+        self.assertFalse(view.isMaterialized())
+        view.add(self.iris.get(0))
+        self.assertTrue(view.isMaterialized())
+        self.assertEqual(5, view.size())
+        self.assertIs(self.iris.get(0), view.get(4))
+
+    def test_Partition(self):
+        partition = Partition(self.iris)
+        self.assertEqual(3, partition.size())
+        for i in range(3):
+            self.assertEqual(50, partition.get(i).size())
+            self.assertEqual([partition.get(i).getClassLabel()] * 50, partition.get(i).getClassLabels())
+        partition = Partition(partition.get(1), 2, 3.0)
+        self.assertIs(self.iris, partition.get(0).getParent())
+        self.assertEqual(50, partition.get(0).size() + partition.get(1).size())
+
+    def test_CrossValidation(self):
+        instances = list(self.iris.getInstances())
+        expected = KFoldCrossValidation(instances, 10, 1)
+        crossValidation = ViewKFoldCrossValidation(self.iris, 10, 1)
+        for k in range(10):
+            self.assertSameInstances(expected.getTrainFold(k), crossValidation.getTrainFold(k))
+            self.assertSameInstances(expected.getTestFold(k), crossValidation.getTestFold(k))
+        expected = StratifiedKFoldCrossValidation(Partition(InstanceList(instances)).getLists(), 10, 1)
+        crossValidation = ViewStratifiedKFoldCrossValidation(self.iris, 10, 1)
+        for k in range(10):
+            self.assertSameInstances(expected.getTrainFold(k), crossValidation.getTrainFold(k))
+            self.assertSameInstances(expected.getTestFold(k), crossValidation.getTestFold(k))
+
+    def test_Bootstrap(self):
+        for seed in range(5):
+            self.assertSameInstances(Bootstrap(self.iris.getInstances(), seed).getSample(),
+                                     ViewBootstrap(self.iris, seed).getSample())
+
+    def test_WeightedBootstrap(self):
+        for seed in range(5):
+            bootstrap = ViewBootstrap(self.iris, seed)
+            sample = bootstrap.getSample()
+            weightedSample = bootstrap.getWeightedSample()
+            self.assertEqual(self.iris.size(), sum(bootstrap.getMultiplicities()))
+            self.assertEqual(sample.size(), weightedSample.totalWeight())
+            self.assertEqual(dict(sample.classDistribution()), dict(weightedSample.classDistribution()))
+            for i in range(4):
+                self.assertAlmostEqual(sample.continuousAverage()[i], weightedSample.continuousAverage()[i], 9)
+            tree = DecisionTree(DecisionNode(sample))
+            weightedTree = DecisionTree(DecisionNode(weightedSample))
+            for instance in self.iris:
+                self.assertEqual(tree.predict(instance), weightedTree.predict(instance))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from Math.Vector import Vector
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.Moments import Moments
+
+
+class MomentsTest(unittest.TestCase):
+
+    dermatology: InstanceList
+
+    def setUp(self) -> None:
+        dataDefinition = DataDefinition(34 * [AttributeType.CONTINUOUS])
+        self.dermatology = InstanceList(dataDefinition, ",", "../../datasets/dermatology.data")
+        self.rows = [instance.continuousAttributes() for instance in self.dermatology.getInstances()]
+
+    def test_Moments(self):
+        n = len(self.rows)
+        for welford in [False, True]:
+            moments = self.dermatology.moments(welford=welford)
+            self.assertEqual(n, moments.getCount())
+            for j in [0, 10, 33]:
+                mean = sum(row[j] for row in self.rows) / n
+                self.assertAlmostEqual(mean, moments.getMean()[j], 9)
+                variance = sum((row[j] - mean) ** 2 for row in self.rows) / (n - 1)
+                self.assertAlmostEqual(variance ** 0.5, moments.getStandardDeviation()[j], 9)
+                mean0 = sum(row[0] for row in self.rows) / n
+                covariance = sum((row[0] - mean0) * (row[j] - mean) for row in self.rows) / (n - 1)
+                self.assertAlmostEqual(covariance, moments.getCovariance().getValue(0, j), 9)
+
+    def test_ContinuousStandardDeviation(self):
+        standardDeviation = self.dermatology.standardDeviation()
+        continuousStandardDeviation = self.dermatology.continuousStandardDeviation()
+        for j in range(34):
+            self.assertAlmostEqual(standardDeviation.getAttribute(j).getValue(), continuousStandardDeviation[j], 9)
+            self.assertAlmostEqual(self.dermatology.continuousAttributeStandardDeviation(j)[0],
+                                   continuousStandardDeviation[j], 9)
+
+    def test_Covariance(self):
+        average = Vector(self.dermatology.continuousAverage())
+        shifted = Vector([value + 1.0 for value in self.dermatology.continuousAverage()])
+        covariance = self.dermatology.covariance(average)
+        shiftedCovariance = self.dermatology.covariance(shifted)
+        n = len(self.rows)
+        for i in [0, 5]:
+            for j in [0, 33]:
+                expected = sum((row[i] - shifted.getValue(i)) * (row[j] - shifted.getValue(j))
+                               for row in self.rows) / (n - 1)
+                self.assertAlmostEqual(expected, shiftedCovariance.getValue(i, j), 9)
+                self.assertAlmostEqual(covariance.getValue(i, j), self.dermatology.covariance().getValue(i, j), 9)
+
+    def test_MergeSubtract(self):
+        first = Moments.ofRows(self.rows[:100])
+        second = Moments.ofRows(self.rows[100:], welford=True)
+        total = Moments.ofRows(self.rows)
+        first.merge(second)
+        for j in range(34):
+            self.assertAlmostEqual(total.getMean()[j], first.getMean()[j], 9)
+            self.assertAlmostEqual(total.getCovariance().getValue(j, 3), first.getCovariance().getValue(j, 3), 9)
+        first.subtract(second)
+        expected = Moments.ofRows(self.rows[:100])
+        self.assertEqual(100, first.getCount())
+        for j in range(34):
+            self.assertAlmostEqual(expected.getStandardDeviation()[j], first.getStandardDeviation()[j], 9)
+
+
+if __name__ == '__main__':
+    unittest.main()